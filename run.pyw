@@ -11,8 +11,9 @@ import sys
 import os
 import locale
 import logging
-from pathlib import Path
-from datetime import datetime
+
+# バックグラウンドでログを書き出すリスナー（setup_early_logging で設定）
+_log_listener = None
 
 # === STEP 1: 最優先でのロギング初期化 ===
 def setup_early_logging():
@@ -20,6 +21,15 @@ def setup_early_logging():
     アプリケーション起動時の最初期段階でのロギング設定
     管理者権限チェックやUAC表示の段階からログが記録される
     """
+    global _log_listener
+
+    # 起動時にのみ必要なモジュールは、インポートのコストを避けるためここで読み込む
+    import atexit
+    from datetime import datetime
+    from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+    from pathlib import Path
+    from queue import Queue
+
     try:
         # ログディレクトリの作成
         log_dir = Path.cwd() / "logs"
@@ -29,35 +39,70 @@ def setup_early_logging():
         log_filename = f"jra_data_collector_{datetime.now().strftime('%Y%m%d')}.log"
         log_filepath = log_dir / log_filename
 
+        # 実際のI/Oを行うハンドラー（QueueListenerのバックグラウンドスレッドで実行）
+        formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s - %(message)s')
+        file_h = logging.FileHandler(str(log_filepath), encoding='utf-8')
+        stream_h = logging.StreamHandler(sys.stdout)
+        for handler in (file_h, stream_h):
+            handler.setFormatter(formatter)
+
+        # INFOレコードはメモリに溜めてまとめて書き出し、ERROR以上は即時フラッシュ
+        buffered_file_h = MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=file_h,
+            flushOnClose=True
+        )
+
+        # 呼び出し元スレッドではキューへの投入のみを行い、書き込みはリスナーに任せる
+        log_queue = Queue(-1)
+        _log_listener = QueueListener(log_queue, buffered_file_h, stream_h, respect_handler_level=True)
+        _log_listener.start()
+        # sys.exit() を含む終了時にキューとバッファを確実に書き出す
+        atexit.register(shutdown_early_logging)
+
         # ログ設定
         logging.basicConfig(
             level=logging.INFO,
-            format='%(asctime)s [%(levelname)s] %(name)s - %(message)s',
-            handlers=[
-                logging.FileHandler(str(log_filepath), encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ],
+            format='%(message)s',  # 最終的な書式はリスナー側のハンドラーで適用
+            handlers=[QueueHandler(log_queue)],
             force=True  # 既存のロガー設定を上書き
         )
 
         # 初期化完了ログ
         logging.info("=" * 60)
         logging.info("🚀 JRA-Data Collector アプリケーション起動")
-        logging.info(f"📝 ログファイル: {log_filepath}")
-        logging.info(f"🖥️  Python バージョン: {sys.version}")
-        logging.info(f"📂 作業ディレクトリ: {Path.cwd()}")
+        logging.info("📝 ログファイル: %s", log_filepath)
+        logging.info("🖥️  Python バージョン: %s", sys.version)
+        logging.info("📂 作業ディレクトリ: %s", Path.cwd())
         logging.info("=" * 60)
         
         print(f"📝 ログファイル初期化: {log_filepath}")
         
     except Exception as e:
         # ロギング設定に失敗した場合もアプリケーションは継続
-        print(f"⚠️  ログ設定エラー: {e}")
-        print("   基本的なログ設定で継続します...")
+        print(f"⚠️  ログ設定エラー: {e}\n"
+              "   基本的なログ設定で継続します...")
         logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 
-# 最優先でロギングを初期化
-setup_early_logging()
+def shutdown_early_logging():
+    """
+    キューに残ったログレコードとファイルバッファをディスクへ書き出す
+    """
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    logging.shutdown()
+
+def _bootstrap():
+    """
+    エントリーポイントとして実行された場合にのみ行う初期化処理
+    （モジュールのインポート自体は副作用なしで行えるようにする）
+    """
+    # 最優先でロギングを初期化
+    setup_early_logging()
 
 def run_main_application():
     """
@@ -80,7 +125,7 @@ def run_main_application():
             from src.admin_helper import get_python_architecture
             
             python_arch = get_python_architecture()
-            logging.info(f"🔍 Python アーキテクチャ: {python_arch}")
+            logging.info("🔍 Python アーキテクチャ: %s", python_arch)
             
             if python_arch == '64bit':
                 logging.info("🔧 64bit Python環境を検出。JV-LinkのCOMサロゲート設定を確認・構成します...")
@@ -111,7 +156,7 @@ def run_main_application():
         logging.info("launch_gui()関数を呼び出します")
         exit_code = launch_gui()
         
-        logging.info(f"launch_gui()から戻りました。終了コード: {exit_code}")
+        logging.info("launch_gui()から戻りました。終了コード: %s", exit_code)
         return exit_code
 
     except ImportError as import_error:
@@ -164,9 +209,13 @@ def setup_unicode_environment():
         # Windows Console UTF-8対応
         try:
             # コンソールのコードページをUTF-8に設定
-            import subprocess
-            subprocess.run(['chcp', '65001'], shell=True, capture_output=True)
-        except Exception:
+            # （chcp のプロセス起動を避け、kernel32 API を直接呼び出す）
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            if kernel32.GetConsoleOutputCP() != 65001:
+                kernel32.SetConsoleOutputCP(65001)
+                kernel32.SetConsoleCP(65001)
+        except (AttributeError, OSError):
             pass  # エラーが発生しても継続
 
         # Windows localeの設定
@@ -180,13 +229,15 @@ def setup_unicode_environment():
 
     # ファイルシステムエンコーディングの確認
     fs_encoding = sys.getfilesystemencoding()
-    logging.info(f"ファイルシステムエンコーディング: {fs_encoding}")
+    logging.info("ファイルシステムエンコーディング: %s", fs_encoding)
 
     # 標準入出力のエンコーディング確認
     stdout_encoding = sys.stdout.encoding
-    logging.info(f"標準出力エンコーディング: {stdout_encoding}")
+    logging.info("標準出力エンコーディング: %s", stdout_encoding)
 
 if __name__ == "__main__":
+    _bootstrap()
+
     logging.info("🚀 JRA-Data Collector エントリーポイント開始")
     print("🚀 JRA-Data Collector を起動しています...")
 
@@ -198,23 +249,24 @@ if __name__ == "__main__":
             # === 管理者権限で実行されている場合 ===
             # メインアプリケーションのロジックを直接実行
             logging.info("🔐 管理者権限で実行中です")
-            print("🔐 管理者権限で実行されています。")
 
-            # 実行環境の詳細表示
+            # 実行環境の詳細表示（権限の表示とまとめて1回で出力する）
             try:
                 elevation_status = get_elevation_status()
                 arch = elevation_status.get('python_architecture', 'Unknown')
                 pid = elevation_status.get('process_id', 'Unknown')
-                logging.info(f"📊 実行環境: {arch} Python, PID: {pid}")
-                print(f"📊 実行環境: {arch} Python, プロセスID: {pid}")
+                logging.info("📊 実行環境: %s Python, PID: %s", arch, pid)
+                print("🔐 管理者権限で実行されています。\n"
+                      f"📊 実行環境: {arch} Python, プロセスID: {pid}")
             except Exception as e:
                 logging.warning(f"実行環境取得エラー: {e}")
-                print(f"⚠️  実行環境取得エラー: {e}")
+                print("🔐 管理者権限で実行されています。\n"
+                      f"⚠️  実行環境取得エラー: {e}")
 
             # メインアプリケーションを実行
             logging.info("メインアプリケーション関数を呼び出します")
             exit_code = run_main_application()
-            logging.info(f"アプリケーション終了（終了コード: {exit_code}）")
+            logging.info("アプリケーション終了（終了コード: %s）", exit_code)
             
             # 明示的に終了コードで終了
             sys.exit(exit_code)
@@ -223,9 +275,8 @@ if __name__ == "__main__":
             # === 非管理者権限で実行されている場合 ===
             # UACプロンプトを表示して自己昇格を試みる
             logging.info("🔒 非管理者権限で実行中。昇格を試みます")
-            print("🔒 JV-Link COMコンポーネントの適切な動作のため、管理者権限が必要です。")
-            print("   UACプロンプトが表示されますので、「はい」を選択してください。")
-            print()
+            print("🔒 JV-Link COMコンポーネントの適切な動作のため、管理者権限が必要です。\n"
+                  "   UACプロンプトが表示されますので、「はい」を選択してください。\n")
 
             # 管理者権限で自己再起動（現在のプロセスは終了される）
             logging.info("管理者権限昇格を実行します...")
@@ -239,8 +290,8 @@ if __name__ == "__main__":
     except ImportError as import_error:
         error_msg = f"管理者権限ヘルパーの読み込みに失敗: {import_error}"
         logging.error(error_msg)
-        print(f"❌ {error_msg}")
-        print("   管理者権限なしで継続しますが、JV-Link機能に制限が生じる可能性があります。")
+        print(f"❌ {error_msg}\n"
+              "   管理者権限なしで継続しますが、JV-Link機能に制限が生じる可能性があります。")
 
         # フォールバック: 管理者権限なしでアプリケーションを実行
         try:
@@ -251,13 +302,15 @@ if __name__ == "__main__":
             fallback_error_msg = f"フォールバック実行も失敗しました: {fallback_err}"
             logging.critical(fallback_error_msg)
             print(f"❌ {fallback_error_msg}")
+            shutdown_early_logging()
             input("Enterキーを押して終了...")
             sys.exit(1)
 
     except Exception as critical_error:
         critical_error_msg = f"アプリケーション起動で予期しないエラー: {critical_error}"
         logging.critical(critical_error_msg)
-        print(f"❌ {critical_error_msg}")
-        print("   予期しないエラーが発生しました。")
+        print(f"❌ {critical_error_msg}\n"
+              "   予期しないエラーが発生しました。")
+        shutdown_early_logging()
         input("Enterキーを押して終了...")
         sys.exit(1)
@@ -11,12 +11,16 @@ import ctypes
 import sys
 import os
 import logging
+import subprocess
+from functools import lru_cache
 from typing import Optional
 
 
+@lru_cache(maxsize=1)
 def is_admin() -> bool:
     """
     現在のプロセスが管理者権限で実行されているかを確認
+    （プロセス実行中に権限は変化しないため、結果をキャッシュする）
 
     Returns:
         bool: 管理者権限で実行されている場合True
@@ -44,31 +48,18 @@ def request_admin_privileges() -> None:
         # 現在のスクリプトのパスを取得
         script_path = os.path.abspath(sys.argv[0])
 
-        # 引数の処理（参考実装に基づく改善版）
-        if len(sys.argv) > 1:
-            # 引数がある場合は適切にエスケープ
-            args = []
-            for arg in sys.argv[1:]:
-                if ' ' in arg:
-                    args.append(f'"{arg}"')
-                else:
-                    args.append(arg)
-            params = ' '.join(args)
-        else:
-            params = ''
+        # 引数の処理（CommandLineToArgvW の規則に従ってエスケープ）
+        params = subprocess.list2cmdline(sys.argv[1:])
 
         logging.info("管理者権限を要求しています...")
-        logging.info(f"Python実行ファイル: {sys.executable}")
-        logging.info(f"スクリプトパス: {script_path}")
-        logging.info(f"引数: {params}")
+        logging.info("Python実行ファイル: %s", sys.executable)
+        logging.info("スクリプトパス: %s", script_path)
+        logging.info("引数: %s", params)
 
-        # パラメータ文字列を構築（参考実装に基づく改良版）
-        if params:
-            command_params = f'"{script_path}" {params}'
-        else:
-            command_params = f'"{script_path}"'
+        # パラメータ文字列を構築（スクリプトパス + 引数）
+        command_params = subprocess.list2cmdline([script_path]) + (' ' + params if params else '')
 
-        logging.info(f"実行コマンド: {sys.executable} {command_params}")
+        logging.info("実行コマンド: %s %s", sys.executable, command_params)
 
         # ShellExecuteWでrunas動詞を使用して管理者権限で再起動
         # https://docs.microsoft.com/en-us/windows/win32/api/shellapi/nf-shellapi-shellexecutew
@@ -102,18 +93,18 @@ def request_admin_privileges() -> None:
             # 特別なケース：ユーザーがUACをキャンセルした場合（通常はエラーコード5）
             if result == 5:
                 logging.warning("ユーザーがUACプロンプトをキャンセルしました")
-                print("⚠️  UACプロンプトがキャンセルされました。")
-                print("   管理者権限が必要です。アプリケーションを手動で管理者として実行してください。")
+                print("⚠️  UACプロンプトがキャンセルされました。\n"
+                      "   管理者権限が必要です。アプリケーションを手動で管理者として実行してください。")
             else:
                 logging.error(f"管理者権限での再起動に失敗: {error_msg}")
-                print(f"❌ 管理者権限での再起動に失敗: {error_msg}")
-                print("   手動で管理者権限でアプリケーションを起動してください。")
+                print(f"❌ 管理者権限での再起動に失敗: {error_msg}\n"
+                      "   手動で管理者権限でアプリケーションを起動してください。")
             
             input("Enterキーを押して終了...")
             sys.exit(1)
         else:
             # 成功時
-            logging.info(f"管理者権限での再起動を開始しました（結果コード: {result}）")
+            logging.info("管理者権限での再起動を開始しました（結果コード: %s）", result)
             logging.info("現在のプロセスを終了します")
             
             # 少し待機してから終了（新しいプロセスの起動を待つ）
@@ -122,8 +113,8 @@ def request_admin_privileges() -> None:
 
     except Exception as e:
         logging.error(f"管理者権限要求中に予期しないエラー: {e}")
-        print(f"\n❌ 管理者権限要求エラー: {e}")
-        print("手動で管理者権限でアプリケーションを起動してください。")
+        print(f"\n❌ 管理者権限要求エラー: {e}\n"
+              "手動で管理者権限でアプリケーションを起動してください。")
         input("Enterキーを押して終了...")
         sys.exit(1)
 
@@ -139,10 +130,9 @@ def ensure_admin_privileges() -> None:
     この関数はアプリケーションのエントリーポイントで最初に呼び出すべき。
     """
     if not is_admin():
-        print("🔒 JV-Link COMコンポーネントの適切な動作のため、管理者権限が必要です。")
-        print("    UACプロンプトが表示されますので、「はい」を選択してください。")
-        print("    これにより64bit Python環境での32bit JV-Link呼び出しが可能になります。")
-        print()
+        print("🔒 JV-Link COMコンポーネントの適切な動作のため、管理者権限が必要です。\n"
+              "    UACプロンプトが表示されますので、「はい」を選択してください。\n"
+              "    これにより64bit Python環境での32bit JV-Link呼び出しが可能になります。\n")
         request_admin_privileges()
     else:
         logging.info("✅ 管理者権限で実行されています。")
@@ -158,6 +148,7 @@ def run_as_admin() -> None:
     request_admin_privileges()
 
 
+@lru_cache(maxsize=1)
 def get_python_architecture() -> str:
     """
     現在のPythonインタープリタのアーキテクチャを取得
@@ -168,6 +159,15 @@ def get_python_architecture() -> str:
     return "64bit" if sys.maxsize > 2**32 else "32bit"
 
 
+# プロセス実行中に変化しない実行環境情報
+_STATIC_PROCESS_INFO = {
+    "python_architecture": get_python_architecture(),
+    "python_executable": sys.executable,
+    "script_path": os.path.abspath(sys.argv[0]) if sys.argv else "",
+    "working_directory": os.getcwd()
+}
+
+
 def get_elevation_status() -> dict:
     """
     現在の昇格状態の詳細情報を取得
@@ -176,19 +176,11 @@ def get_elevation_status() -> dict:
         dict: 昇格状態の詳細情報
     """
     try:
-        is_elevated = is_admin()
-
-        # Pythonのアーキテクチャ情報
-        python_arch = "64bit" if sys.maxsize > 2**32 else "32bit"
-
-        # プロセス情報
+        # プロセス情報（不変の情報はインポート時に計算済み）
         process_info = {
-            "is_admin": is_elevated,
-            "python_architecture": python_arch,
-            "python_executable": sys.executable,
+            "is_admin": is_admin(),
             "process_id": os.getpid(),
-            "script_path": os.path.abspath(sys.argv[0]),
-            "working_directory": os.getcwd()
+            **_STATIC_PROCESS_INFO
         }
 
         return process_info
@@ -1,15 +1,25 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, Deque, Optional, Tuple
+import atexit
 import logging
-from datetime import datetime, timedelta
-from PySide6.QtCore import QObject, Slot
-from PySide6.QtWidgets import QDialog
+import os
+import time
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from collections import deque
+from itertools import islice
+from datetime import date, datetime
+from functools import cached_property, wraps
+from types import MappingProxyType
+from PySide6.QtCore import QEventLoop, QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtWidgets import QDialog, QMessageBox
+from sqlalchemy import text
 
 from ..services.settings_manager import SettingsManager
 from ..services.db_manager import DatabaseManager
 from ..services.jvlink_manager import JvLinkManager
 from ..services.etl_processor import EtlProcessor, EtlDataPipeline
-from ..services.export_manager import ExportManager
+from ..views.data_selection_dialog import DataSelectionDialog
 
 # 統一通知システムのインポート（新機能）
 from ..utils.notification_manager import (
@@ -18,23 +28,287 @@ from ..utils.notification_manager import (
 )
 
 # State Machine パターンのインポート
-from ..services.state_machine.base import AppState
-from ..services.state_machine.states import IdleState
+from ..services.state_machine.base import AppState, StateKind
+from ..services.state_machine.states import IdleState, ErrorState
 
 # Phase 3: Worker Pipeline 統合
-from ..services.workers.pipeline_coordinator import PipelineCoordinator
 from ..services.workers.base import ProgressInfo
 
 # 統一シグナルシステムと構造化ログ
-from ..services.workers.signals import WorkerSignals, LogRecord, ProgressInfo as NewProgressInfo, TaskResult
+from ..services.workers.signals import WorkerSignals, LogRecord, ProgressInfo as NewProgressInfo, TaskResult, TaskInfo
 
 if TYPE_CHECKING:
+    from ..services.export_manager import ExportManager
+    from ..services.workers.pipeline_coordinator import PipelineCoordinator
     from ..views.main_window import MainWindow
     from ..views.setup_dialog import SetupDialog
     from ..views.settings_view import SettingsView
     from ..views.etl_setting_view import EtlSettingView
 
 
+# ログ出力先ディレクトリ（プロジェクトルート/logs）はモジュール読み込み時に一度だけ算出
+_LOG_DIR = os.path.join(
+    os.path.dirname(
+        os.path.dirname(
+            os.path.dirname(os.path.abspath(__file__)))),
+    "logs")
+_log_dir_ready = False
+
+# ファイル/コンソール出力を担うバックグラウンドリスナー（プロセス内で一つ）
+_log_listener = None
+
+
+def _stop_log_listener():
+    """ログリスナーを停止し、キューに残ったレコードを書き出す"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+# 詳細なフォーマッター（ファイル用）
+_DETAILED_FORMATTER = logging.Formatter(
+    '%(asctime)s [%(levelname)8s] %(name)s:%(lineno)d - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# シンプルなフォーマッター（コンソール用）
+_SIMPLE_FORMATTER = logging.Formatter(
+    '%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%H:%M:%S'
+)
+
+# 構造化ログのレベル名 -> logging の数値レベル
+_LOG_LEVEL_VALUES = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+_logger = logging.getLogger(__name__)
+
+# 通知対象とする重大ログのレベル
+_CRITICAL_LEVELS = frozenset({"ERROR", "CRITICAL"})
+
+# タスク結果 -> ログレベル（result.success をインデックスとして参照）
+_TASK_RESULT_LEVEL = ("ERROR", "INFO")
+
+# 構造化ログのマスターリストに保持する最大件数（超過分は古い順に破棄）
+_MAX_LOG_RECORDS = 10000
+
+# タスク進捗をダッシュボードへ反映する間隔（ミリ秒、約30Hz）
+_PROGRESS_FLUSH_INTERVAL_MS = 33
+
+# ETLパイプラインの進捗をダッシュボードへ反映する間隔（ミリ秒、約20Hz）
+_PIPELINE_PROGRESS_FLUSH_INTERVAL_MS = 50
+
+# cleanup でキャンセル完了を待つ最大時間（ミリ秒）
+_CLEANUP_CANCEL_TIMEOUT_MS = 3000
+
+# 受け付け待ちのデータ取得コマンドの上限（JV-Link側が逐次処理のため小さく保つ）
+_ACQUISITION_QUEUE_MAXLEN = 16
+
+# 構造化ログの非同期配信（ASYNC_LOG_ENABLED=0 でデバッグ用に同期配信へ切り替え）
+_ASYNC_LOG_ENABLED = os.environ.get("ASYNC_LOG_ENABLED", "1") != "0"
+_LOG_QUEUE_MAXLEN = 20000  # 溢れた場合は古いものから破棄
+_LOG_DRAIN_INTERVAL_MS = 50
+_LOG_DRAIN_BATCH = 128  # 1回のタイマー処理で配信する最大件数
+
+# タスク完了ログのメッセージテンプレート
+_COMPLETION_TEMPLATE = "タスク完了: {items}アイテム処理, {records}レコード書き込み, {time:.2f}秒"
+
+# 接続確認用のクエリ（死活確認にはどの方言でも SELECT 1 で十分）
+_DEFAULT_PING = text("SELECT 1")
+
+# パイプライン設定の既定値（設定キー -> 既定値）
+_PIPELINE_CONFIG_DEFAULTS = {
+    'raw_queue_size': ('pipeline_raw_queue_size', 1000),
+    'processed_queue_size': ('pipeline_processed_queue_size', 500),
+    'etl_batch_size': ('pipeline_etl_batch_size', 10),
+    'db_batch_size': ('pipeline_db_batch_size', 100),
+    'db_commit_interval': ('pipeline_db_commit_interval', 1000),
+}
+
+# デフォルトETLルール（プロセスプールへpickleして渡すため、取得時に dict へコピーする）
+_DEFAULT_ETL_RULES = MappingProxyType({
+    'data_validation': True,
+    'duplicate_check': True,
+    'auto_commit': True,
+    'batch_processing': True,
+})
+
+# ダッシュボードへ渡すDB情報の雛形（更新ごとに copy() して使用）
+_DB_INFO_TEMPLATE = {
+    'connected': False,
+    'type': '',
+    'name': '',
+    'tables_count': 0,
+    'last_updated': None,
+    'error_message': None,
+}
+
+# ダッシュボード用タイムスタンプ文字列のキャッシュ（秒単位で再利用）
+_last_ts_second = None
+_last_ts_str = ""
+
+
+def _dashboard_timestamp() -> str:
+    """現在時刻のISO形式文字列を返す（同一秒内は同じ文字列を再利用）"""
+    global _last_ts_second, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_second:
+        _last_ts_str = datetime.fromtimestamp(now).isoformat()
+        _last_ts_second = now
+    return _last_ts_str
+
+
+def _setup_fromtime(from_date: str) -> str:
+    """セットアップデータの fromtime（未指定時は提供開始日から）"""
+    return f"{from_date}000000" if from_date else "19860101000000"
+
+
+# 速報系 fromtime のキャッシュ（(年, 年内通算日) -> 文字列。日付が変わるまで再利用）
+_week_cache_day = None
+_week_cache_str = ""
+
+
+def _this_week_fromtime(_from_date: str) -> str:
+    """速報系データの fromtime（当該週の日曜日 00:00:00。同一日内は同じ文字列を再利用）"""
+    global _week_cache_day, _week_cache_str
+    now = time.localtime()
+    day = (now.tm_year, now.tm_yday)
+    if day != _week_cache_day:
+        today = date(now.tm_year, now.tm_mon, now.tm_mday)
+        days_since_sunday = today.weekday() + 1  # 月曜日=0なので+1で日曜日基準に
+        sunday = date.fromordinal(today.toordinal() - days_since_sunday)
+        _week_cache_str = f"{sunday:%Y%m%d}000000"
+        _week_cache_day = day
+    return _week_cache_str
+
+
+# データ取得モード -> (JVOpen option, 表示名, fromtime算出関数)
+_ACQUISITION_MODES = {
+    'setup': (4, "セットアップ", _setup_fromtime),  # セットアップデータ（ダイアログ無し）
+    'accumulated': (1, "蓄積系", None),  # 通常データ（差分更新）
+    'realtime': (2, "速報系", _this_week_fromtime),  # 今週データ
+}
+
+# データ取得モード -> 既定のデータ種別（読み取り専用で共有）
+_DEFAULT_DATA_TYPES = MappingProxyType({
+    'setup': ("RACE", "SE", "HR", "UM", "KS"),  # セットアップ推奨
+    'accumulated': ("RACE", "SE", "HR"),  # 差分更新推奨
+    'realtime': ("RACE", "SE"),  # 当該週データ
+})
+
+
+def requires_idle(label: str):
+    """
+    アイドル状態の場合のみメソッドを実行するデコレーター（それ以外は警告を出して何もしない）
+
+    Args:
+        label: 警告メッセージに表示する処理名（例: "エクスポート"）
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self._is_idle_state():
+                _logger.warning(
+                    "%sは現在実行できません。現在の状態: %s", label, self.state_name)
+                return None
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class _EnsureTablesSignals(QObject):
+    """テーブル作成ワーカーから発行されるシグナル"""
+    finished = Signal()
+    error = Signal(str)
+
+
+class _EnsureTablesRunnable(QRunnable):
+    """
+    Base.metadata.create_all をバックグラウンドで実行するワーカー。
+    GUIスレッドをスキーマ作成でブロックしないために使用する。
+    """
+
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+        self.signals = _EnsureTablesSignals()
+
+    @Slot()
+    def run(self):
+        try:
+            from ..models.tables import Base
+            Base.metadata.create_all(self.engine)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit()
+
+
+class _SummarySignals(QObject):
+    """データサマリー取得ワーカーから発行されるシグナル"""
+    summary_ready = Signal(dict)
+    error = Signal(str)
+
+
+class _SummaryRunnable(QRunnable):
+    """
+    db_manager.get_data_summary をバックグラウンドで実行するワーカー。
+    全テーブルの件数集計でコントローラースレッドをブロックしないために使用する。
+    """
+
+    def __init__(self, db_manager):
+        super().__init__()
+        self.db_manager = db_manager
+        self.signals = _SummarySignals()
+
+    @Slot()
+    def run(self):
+        try:
+            summary = self.db_manager.get_data_summary()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.summary_ready.emit(summary or {})
+
+
+class _RealtimeTransformSignals(QObject):
+    """速報データ変換ワーカーから発行されるシグナル"""
+    transformed = Signal(object)  # {table_name: DataFrame}
+    error = Signal(str)
+
+
+class _RealtimeTransformRunnable(QRunnable):
+    """
+    速報イベントのETL変換をバックグラウンドで実行するワーカー。
+    速報が集中した場合でもイベントループを塞がないために使用する。
+    """
+
+    def __init__(self, etl_processor, event_data: list, data_spec: str):
+        super().__init__()
+        self.etl_processor = etl_processor
+        self.event_data = event_data
+        self.data_spec = data_spec
+        self.signals = _RealtimeTransformSignals()
+
+    @Slot()
+    def run(self):
+        try:
+            transformed_dfs = self.etl_processor.transform(
+                self.event_data, self.data_spec)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.transformed.emit(transformed_dfs)
+
+
 class AppController(QObject):
     """
     アプリケーション全体のコントローラー。
@@ -47,6 +321,16 @@ class AppController(QObject):
     修正点: 統一通知システムの統合
     """
 
+    # 状態遷移の完了通知（遷移先の状態名）
+    state_changed = Signal(str)
+
+    # Worker 進捗の反映待ちが発生した（ワーカースレッドからUIタイマーを起動するため）
+    _ui_flush_requested = Signal()
+
+    # 遅延インポートした COM モジュール（初回のダイアログ表示時に設定）
+    _win32com_client = None
+    _pythoncom = None
+
     def __init__(self, main_window: MainWindow = None, parent=None):
         super().__init__(parent)
 
@@ -54,8 +338,16 @@ class AppController(QObject):
         from ..services.workers.signals import LoggerMixin
         self.logger = LoggerMixin("アプリケーション制御", "AppController")
 
+        # emit_log はキューに積むだけにし、タイマーでまとめて配信する
+        self._log_queue: Deque[tuple] = deque(maxlen=_LOG_QUEUE_MAXLEN)
+        self._log_drain_timer = QTimer(self)
+        self._log_drain_timer.setSingleShot(True)
+        self._log_drain_timer.setInterval(_LOG_DRAIN_INTERVAL_MS)
+        self._log_drain_timer.timeout.connect(self._drain_log_queue)
+
         # State Machine 初期化
         self._state: AppState = None
+        self._state_kind = StateKind.OTHER  # 遷移時に確定する現在の状態の種別
 
         # 基本設定
         self.main_window = main_window
@@ -83,17 +375,15 @@ class AppController(QObject):
         try:
             from ..services.jvlink_adapter import create_jvlink_manager
             self.jvlink_manager = create_jvlink_manager()
-            logging.info("アーキテクチャ対応JV-Linkマネージャーを初期化しました")
+            _logger.info("アーキテクチャ対応JV-Linkマネージャーを初期化しました")
         except ImportError:
             # フォールバック: 従来のマネージャーを使用
             self.jvlink_manager = JvLinkManager()
-            logging.warning("従来のJV-Linkマネージャーを使用します")
+            _logger.warning("従来のJV-Linkマネージャーを使用します")
 
         self.etl_processor = EtlProcessor()
-        self.export_manager = ExportManager(self.db_manager)
 
-        # Phase 3: PipelineCoordinator 初期化
-        self.pipeline_coordinator = self._initialize_pipeline_coordinator()
+        # ExportManager / PipelineCoordinator は初回アクセス時に生成する（遅延初期化）
 
         # 既存のETLパイプライン（下位互換性のため維持）
         self.etl_pipeline = EtlDataPipeline(
@@ -102,6 +392,7 @@ class AppController(QObject):
             self._on_pipeline_item_processed)
         self.etl_pipeline.pipeline_finished.connect(self._on_pipeline_finished)
         self.etl_pipeline.pipeline_error.connect(self._on_pipeline_error)
+        self._etl_has_is_running = hasattr(self.etl_pipeline, 'is_running')
 
         # 状態管理
         self.current_data_specs = []  # 複数のデータ種別を管理
@@ -109,9 +400,89 @@ class AppController(QObject):
         self.pipeline_total_expected = 0  # パイプラインで処理予定の総件数
         self.pipeline_processed_count = 0  # パイプラインで処理済みの件数
 
+        # get_debug_info が返す辞書（呼び出しごとに値だけ更新して再利用）
+        self._debug_info: Dict[str, Any] = {
+            "current_state": None,
+            "can_start_processing": False,
+            "can_cancel_processing": False,
+            "is_idle": False,
+            "pipeline_running": False,
+            "realtime_watching": False,
+            "current_data_specs": None,
+        }
+        self._last_percent = -1  # 直近にUIへ反映したデータ取得進捗率
+
+        # UIコンポーネントへのキャッシュ参照（_rebind_uiで設定）
+        self._rebind_ui()
+
+        # テーブル作成ワーカーの多重起動防止
+        self._ensuring_tables = False
+        self._ensure_tables_runnable = None
+        self._ensure_tables_pending = False  # 実行中に再接続されたエンジンへの再実行要求
+
+        # エラーダイアログはエラーごとに生成せず使い回す
+        self._error_dialog = None
+
+        # データサマリー取得ワーカーの多重起動防止（実行中の要求は完了後に再実行）
+        self._summary_in_flight = False
+        self._summary_requested = False
+        self._summary_runnable = None
+
+        # ETLルールのキャッシュ（ルールの保存・削除、設定保存時に無効化）
+        self._etl_rules_cache = None
+
+        # パイプライン設定のキャッシュ（設定保存時に無効化）
+        self._cached_pipeline_config: Optional[dict] = None
+
+        # JV-Link未初期化時の設定ダイアログ用COMオブジェクト（終了時に解放）
+        self._jvlink_com_cache = None
+        self._com_initialized = False
+
+        # データ取得コマンドの待ち行列（(取得モード定義, 開始日, データ種別)）
+        # JV-Link の COM オブジェクトはメインスレッドに属するため、実行はイベントループ上で行う
+        self._acquisition_cmd_queue: Deque[tuple] = deque()
+        self._acquisition_timer = QTimer(self)
+        self._acquisition_timer.setSingleShot(True)
+        self._acquisition_timer.setInterval(0)
+        self._acquisition_timer.timeout.connect(self._process_acquisition_queue)
+
+        # 速報データ変換用のスレッドプール（イベント順を保つため1スレッド）
+        self._realtime_pool = QThreadPool(self)
+        self._realtime_pool.setMaxThreadCount(1)
+
+        # 選択中のETLルール（ルール選択・保存時に更新し、データ受信時に参照）
+        self._active_rule_name: Optional[str] = None
+        self._active_rule: Dict[str, Any] = {}
+
         # Phase 3 Update: 構造化ログとマルチタスク管理
-        self.active_tasks: Dict[str, Dict[str, Any]] = {}  # タスク名 -> タスク情報
-        self.log_records: List[LogRecord] = []  # 構造化ログのマスターリスト
+        self.active_tasks: Dict[str, TaskInfo] = {}  # タスク名 -> タスク情報
+        self._status_counts: Dict[str, int] = {'running': 0, 'completed': 0, 'error': 0}  # 状態別タスク数
+        self.log_records: Deque[LogRecord] = deque(maxlen=_MAX_LOG_RECORDS)  # 構造化ログのマスターリスト
+
+        # タスク進捗の合流バッファ（タスク名 -> 最新の進捗情報）
+        self._pending_progress: Dict[str, NewProgressInfo] = {}
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.setInterval(_PROGRESS_FLUSH_INTERVAL_MS)
+        self._progress_flush_timer.timeout.connect(self._flush_progress)
+
+        # ETLパイプライン進捗の合流バッファ（最新の進捗率とメッセージ）
+        self._pipeline_progress_buffer = (0, "")
+        self._pipeline_progress_sent = None
+        self._pipeline_progress_timer = QTimer(self)
+        self._pipeline_progress_timer.setInterval(
+            _PIPELINE_PROGRESS_FLUSH_INTERVAL_MS)
+        self._pipeline_progress_timer.timeout.connect(
+            self._flush_pipeline_progress)
+
+        # Worker 進捗の最新値（ワーカースレッドが書き込み、UIタイマーが一定間隔で反映）
+        self._ui_dirty = False
+        self._latest_progress: Optional[ProgressInfo] = None
+        self._ui_flush_timer = QTimer(self)
+        self._ui_flush_timer.setInterval(_PROGRESS_FLUSH_INTERVAL_MS)
+        self._ui_flush_timer.timeout.connect(self._flush_ui)
+        # タイマーは進捗が届いた時だけ動かし、反映するものがなくなれば止める
+        self._ui_flush_requested.connect(self._ui_flush_timer.start)
 
         self._setup_enhanced_logging()
 
@@ -121,62 +492,70 @@ class AppController(QObject):
         # State Machineを初期状態（Idle）に設定
         self.transition_to(IdleState())
 
+    @cached_property
+    def export_manager(self) -> ExportManager:
+        """ExportManager（初回アクセス時に生成し、シグナルを接続）"""
+        from ..services.export_manager import ExportManager
+
+        export_manager = ExportManager(self.db_manager)
+        export_manager.export_progress.connect(self.on_export_progress)
+        export_manager.export_finished.connect(self.on_export_finished)
+        export_manager.export_error.connect(self.on_export_error)
+        return export_manager
+
+    @cached_property
+    def pipeline_coordinator(self) -> PipelineCoordinator:
+        """Phase 3: PipelineCoordinator（初回アクセス時に初期化）"""
+        return self._initialize_pipeline_coordinator()
+
     def _setup_enhanced_logging(self):
         """強化されたログ設定を行う"""
-        import os
-        from datetime import datetime
+        global _log_dir_ready, _log_listener
 
-        # ログディレクトリの作成
-        log_dir = os.path.join(
-            os.path.dirname(
-                os.path.dirname(
-                    os.path.dirname(__file__))),
-            "logs")
-        os.makedirs(log_dir, exist_ok=True)
+        # ログディレクトリの作成（プロセス内で一度だけ）
+        if not _log_dir_ready:
+            os.makedirs(_LOG_DIR, exist_ok=True)
+            _log_dir_ready = True
 
         # ログファイル名（日付付き）
         log_filename = f"jra_data_collector_{
             datetime.now().strftime('%Y%m%d')}.log"
-        log_filepath = os.path.join(log_dir, log_filename)
+        log_filepath = os.path.join(_LOG_DIR, log_filename)
 
         # ルートロガーの設定
         root_logger = logging.getLogger()
         root_logger.setLevel(logging.DEBUG)
 
-        # 既存のハンドラーをクリア
+        # 既存のハンドラーとリスナーをクリア
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
-
-        # 詳細なフォーマッター
-        detailed_formatter = logging.Formatter(
-            '%(asctime)s [%(levelname)8s] %(name)s:%(lineno)d - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-
-        # シンプルなフォーマッター（コンソール用）
-        simple_formatter = logging.Formatter(
-            '%(asctime)s [%(levelname)s] %(message)s',
-            datefmt='%H:%M:%S'
-        )
+        _stop_log_listener()
 
         # ファイルハンドラー（詳細ログ）
         file_handler = logging.FileHandler(log_filepath, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(detailed_formatter)
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(_DETAILED_FORMATTER)
 
         # コンソールハンドラー（重要なログのみ）
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(simple_formatter)
-        root_logger.addHandler(console_handler)
+        console_handler.setFormatter(_SIMPLE_FORMATTER)
+
+        # 呼び出し元スレッドはキューに積むだけにし、
+        # ディスク/コンソールへの書き込みはリスナースレッドで行う
+        log_queue = SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        _log_listener = QueueListener(
+            log_queue, file_handler, console_handler,
+            respect_handler_level=True)
+        _log_listener.start()
 
         # 起動ログ
-        logging.info("=" * 60)
-        logging.info("JRA-Data Collector アプリケーションを開始しました")
-        logging.info(f"ログファイル: {log_filepath}")
-        logging.info(f"ログレベル: ファイル=DEBUG, コンソール=INFO")
-        logging.info("=" * 60)
+        _logger.info("=" * 60)
+        _logger.info("JRA-Data Collector アプリケーションを開始しました")
+        _logger.info("ログファイル: %s", log_filepath)
+        _logger.info("ログレベル: ファイル=DEBUG, コンソール=INFO")
+        _logger.info("=" * 60)
 
     def transition_to(self, state: AppState) -> None:
         """
@@ -192,30 +571,34 @@ class AppController(QObject):
 
             # 新しい状態の設定
             self._state = state
+            self._state_kind = state.KIND
             self._state.context = self
 
             # 新しい状態の開始処理
             self._state.on_enter()
 
-            logging.info(f"State transition completed: -> {state.name}")
+            if _logger.isEnabledFor(logging.INFO):
+                _logger.info("State transition completed: -> %s", state.name)
+
+            self.state_changed.emit(state.name)
 
         except Exception as e:
-            logging.error(f"State transition failed: {e}")
+            _logger.error("State transition failed: %s", e)
             # 遷移に失敗した場合はエラー状態に遷移
-            from ..services.state_machine.states import ErrorState
             if not isinstance(state, ErrorState):  # 無限ループを防ぐ
                 self._force_transition_to_error(e)
 
     def _force_transition_to_error(self, error: Exception) -> None:
         """エラー状態への強制遷移（循環参照を避けるための内部メソッド）"""
         try:
-            from ..services.state_machine.states import ErrorState
             self._state = ErrorState(error)
+            self._state_kind = StateKind.ERROR
             self._state.context = self
             self._state.on_enter()
+            self.state_changed.emit(self._state.name)
         except Exception as critical_error:
-            logging.critical(
-                f"Critical error during error state transition: {critical_error}")
+            _logger.critical(
+                "Critical error during error state transition: %s", critical_error)
 
     @property
     def state(self) -> AppState:
@@ -239,7 +622,7 @@ class AppController(QObject):
         if self._state:
             self._state.start_processing(params)
         else:
-            logging.error("No state available to handle start request")
+            _logger.error("No state available to handle start request")
 
     def request_cancel(self) -> None:
         """
@@ -248,7 +631,7 @@ class AppController(QObject):
         if self._state:
             self._state.cancel_processing()
         else:
-            logging.error("No state available to handle cancel request")
+            _logger.error("No state available to handle cancel request")
 
     def initialize_app(self):
         """
@@ -261,7 +644,7 @@ class AppController(QObject):
         self._is_initializing = True
         
         try:
-            logging.info("アプリケーションの初期化を開始します。")
+            _logger.info("アプリケーションの初期化を開始します。")
 
             # 初回起動時のウェルカムウィザード表示（新機能）
             self._check_and_show_welcome_wizard()
@@ -274,20 +657,18 @@ class AppController(QObject):
             # 2. データベースへの接続 (DBManagerのコンストラクタで実行済み)
 
             # 3. JV-Link設定はレジストリで管理（JVSetUIProperties()で設定）
-            logging.info(
+            _logger.info(
             "JV-Link設定はWindowsレジストリで管理されます。設定画面から公式ダイアログを開いて設定してください。")
 
             # 4. 初期のダッシュボード更新
             summary = self.db_manager.get_data_summary()
-            if hasattr(
-                self.main_window,
-                'dashboard_view') and self.main_window.dashboard_view:
-                self.main_window.dashboard_view.update_dashboard_summary(summary)
+            if self._dashboard is not None:
+                self._dashboard.update_dashboard_summary(summary)
 
-            logging.info("アプリケーションの初期化が完了しました。")
+            _logger.info("アプリケーションの初期化が完了しました。")
             
         except Exception as e:
-            logging.error(f"アプリケーション初期化中にエラーが発生しました: {e}")
+            _logger.error("アプリケーション初期化中にエラーが発生しました: %s", e)
             raise
         finally:
             # 初期化完了後、フラグを解除
@@ -321,6 +702,7 @@ class AppController(QObject):
         except Exception as e:
             self.emit_log("ERROR", f"ウェルカムウィザード表示エラー: {e}")
 
+    @Slot()
     def _on_welcome_wizard_completed(self):
         """
         ウェルカムウィザード完了時の処理（新機能）
@@ -345,8 +727,6 @@ class AppController(QObject):
         初回セットアップ完了後、初期データ取得を促すメッセージを表示（新機能）
         """
         try:
-            from PySide6.QtWidgets import QMessageBox
-
             msg = QMessageBox(self.main_window)
             msg.setWindowTitle("次のステップ")
             msg.setIcon(QMessageBox.Information)
@@ -366,9 +746,39 @@ class AppController(QObject):
         except Exception as e:
             self.emit_log("ERROR", f"初期データ取得提案表示エラー: {e}")
 
+    def _rebind_ui(self):
+        """
+        メインウィンドウのUI部品への参照をキャッシュし直す
+        （main_window を差し替えた場合も呼び出すこと）
+        """
+        main_window = self.main_window
+        self._dashboard = getattr(main_window, 'dashboard_view', None)
+        self._settings_view = getattr(main_window, 'settings_view', None)
+        self._etl_setting_view = getattr(main_window, 'etl_setting_view', None)
+        self._status_bar = (main_window.statusBar()
+                            if hasattr(main_window, 'statusBar') else None)
+        self._status_show_message = (self._status_bar.showMessage
+                                     if self._status_bar is not None else None)
+
+        # Worker の進捗/エラー通知先（未実装のビューでは None）
+        self._dashboard_update_progress = getattr(
+            self._dashboard, 'update_progress', None)
+        self._dashboard_show_error = getattr(
+            self._dashboard, 'show_error', None)
+
+        # 進捗系スロットから頻繁に呼ぶダッシュボードのメソッドを束縛しておく（未実装のビューでは None）
+        self._add_task = getattr(self._dashboard, 'add_task', None)
+        self._update_task_progress = getattr(
+            self._dashboard, 'update_task_progress', None)
+        self._complete_task = getattr(self._dashboard, 'complete_task', None)
+
     def initialize_connections(self):
         """UIとコントローラー間のシグナル・スロット接続を確立する"""
-        logging.info("UIとコントローラーの接続を初期化します。")
+        _logger.info("UIとコントローラーの接続を初期化します。")
+
+        # 頻繁に呼ばれるスロットで hasattr を繰り返さないよう参照をキャッシュ
+        self._rebind_ui()
+        self._error_dialog = self._create_error_dialog()
 
         # JV-Link Manager
         self.jvlink_manager.data_received.connect(self.on_data_received)
@@ -378,10 +788,7 @@ class AppController(QObject):
         self.jvlink_manager.realtime_event_received.connect(
             self.on_realtime_event_received)
 
-        # Export Manager
-        self.export_manager.export_progress.connect(self.on_export_progress)
-        self.export_manager.export_finished.connect(self.on_export_finished)
-        self.export_manager.export_error.connect(self.on_export_error)
+        # Export Manager のシグナルは export_manager の初回生成時に接続する
 
         # SettingsView
         self.main_window.settings_view.settings_saved.connect(
@@ -426,10 +833,9 @@ class AppController(QObject):
                 self.on_settings_saved)
 
         # Phase 3 Update: Pipeline Coordinator接続（統一シグナル）
-        if hasattr(self, 'pipeline_coordinator') and self.pipeline_coordinator:
-            # pipeline_coordinatorが統一シグナルを発行する場合の接続
-            # （実装時には、PipelineCoordinatorも統一シグナルシステムに更新する）
-            pass
+        # pipeline_coordinatorが統一シグナルを発行する場合はここで接続する
+        # （実装時には、PipelineCoordinatorも統一シグナルシステムに更新する）
+        # ※ pipeline_coordinator は遅延初期化のため、ここでは参照しない
 
         # UIの初期設定を読み込む
         self.load_and_apply_settings()
@@ -440,9 +846,46 @@ class AppController(QObject):
         # アクティブデータベースプロファイルの初期化（新機能）
         self._initialize_database_profiles()
 
+    @staticmethod
+    def _should_log(level: str) -> bool:
+        """指定レベルのログが現在の実効ログレベルで出力対象かどうかを判定"""
+        return _logger.isEnabledFor(_LOG_LEVEL_VALUES.get(level, logging.INFO))
+
     def emit_log(self, level: str, message: str, context=None):
-        """LoggerMixinのemit_logを委譲"""
-        self.logger.emit_log(level, message, context)
+        """LoggerMixinのemit_logを委譲（出力対象外のレベルはLogRecordを生成しない）"""
+        if not self._should_log(level):
+            return
+
+        if not _ASYNC_LOG_ENABLED:
+            self.logger.emit_log(level, message, context)
+            return
+
+        self._log_queue.append((datetime.now(), level, message, context))
+        if not self._log_drain_timer.isActive():
+            self._log_drain_timer.start()
+
+    @Slot()
+    def _drain_log_queue(self):
+        """キューに溜まった構造化ログをまとめて配信"""
+        log_queue = self._log_queue
+        emit = self.logger.signals.log.emit
+        task_name = self.logger.task_name
+        worker_name = self.logger.worker_name
+
+        for _ in range(min(len(log_queue), _LOG_DRAIN_BATCH)):
+            timestamp, level, message, context = log_queue.popleft()
+            emit(LogRecord(
+                timestamp=timestamp,
+                level=level,
+                task_name=task_name,
+                worker_name=worker_name,
+                message=message,
+                context=context
+            ))
+
+        # 残りがあれば次のタイマーで続きを配信
+        if log_queue:
+            self._log_drain_timer.start()
 
     def connect_jvlink_manually(self) -> bool:
         """
@@ -458,15 +901,13 @@ class AppController(QObject):
             success = self.jvlink_manager.initialize()
             if success:
                 self.emit_log("INFO", "JV-Link接続が正常に完了しました。")
-                if hasattr(self.main_window, 'statusBar'):
-                    self.main_window.statusBar().showMessage("JV-Link接続が完了しました。", 3000)
+                self._set_status_bar_message("JV-Link接続が完了しました。", 3000)
                 return True
             else:
                 error_msg = ("JV-Link接続に失敗しました。\n\n"
                              "JV-Link設定ダイアログ（設定画面）で正しい設定を行ってください。")
                 self.emit_log("WARNING", error_msg)
-                if hasattr(self.main_window, 'statusBar'):
-                    self.main_window.statusBar().showMessage("JV-Link接続に失敗しました。設定を確認してください。", 5000)
+                self._set_status_bar_message("JV-Link接続に失敗しました。設定を確認してください。", 5000)
                 return False
         except Exception as e:
             self.emit_log("ERROR", f"JV-Link手動接続中にエラー: {e}")
@@ -481,13 +922,15 @@ class AppController(QObject):
         default_data_types = ["RACE", "SE", "HR", "KS"]
         return self.start_setup_data_acquisition_with_types("19860101", default_data_types)
     
-    def start_setup_data_acquisition_with_types(self, from_date: str, selected_data_types: list):
+    def _prepare_data_acquisition(self, operation_name: str) -> bool:
         """
-        指定されたデータ種別でセットアップデータ取得を開始
-        
+        データ取得開始前の共通チェック（JV-Link初期化と状態確認）
+
         Args:
-            from_date: 取得開始日（YYYYMMDD形式）
-            selected_data_types: 取得するデータ種別のリスト
+            operation_name: ステータス表示に使用する処理名（例: "セットアップデータ取得"）
+
+        Returns:
+            bool: データ取得を開始できる場合True
         """
         # JV-Link初期化チェック
         if not self.jvlink_manager.is_initialized():
@@ -502,9 +945,23 @@ class AppController(QObject):
             self._show_status_message(error_msg, 5000)
             return False
 
+        self._show_status_message(f"{operation_name}を開始しています...", 0)
+        self._last_percent = -1
+        return True
+
+    def start_setup_data_acquisition_with_types(self, from_date: str, selected_data_types: list):
+        """
+        指定されたデータ種別でセットアップデータ取得を開始
+        
+        Args:
+            from_date: 取得開始日（YYYYMMDD形式）
+            selected_data_types: 取得するデータ種別のリスト
+        """
+        if not self._prepare_data_acquisition("セットアップデータ取得"):
+            return False
+
         try:
             self.emit_log("INFO", f"セットアップデータ取得を開始: 開始日={from_date}, データ種別={selected_data_types}")
-            self._show_status_message("セットアップデータ取得を開始しています...", 0)
 
             # オプション4（セットアップデータ）で選択されたデータ種別を取得
             # from_dateが指定されている場合は開始日として使用、空の場合は全期間
@@ -539,17 +996,7 @@ class AppController(QObject):
         Args:
             selected_data_types: 取得するデータ種別のリスト（例: ["RACE", "SE", "HR"]）
         """
-        # JV-Link初期化チェック
-        if not self.jvlink_manager.is_initialized():
-            if not self.connect_jvlink_manually():
-                return False
-
-        # データ取得中でないことを確認
-        if not self.jvlink_manager.can_start_data_operation():
-            error_msg = f"データ取得を開始できません。現在の状態: {
-                self.jvlink_manager.current_state.value}"
-            self.emit_log("ERROR", error_msg)
-            self._show_status_message(error_msg, 5000)
+        if not self._prepare_data_acquisition("差分データ取得"):
             return False
 
         try:
@@ -560,7 +1007,6 @@ class AppController(QObject):
                 last_timestamp = ""
 
             self.emit_log("INFO", f"差分データ取得を開始: タイムスタンプ={last_timestamp}, データ種別={selected_data_types}")
-            self._show_status_message("差分データ取得を開始しています...", 0)
 
             # オプション1（差分データ）で選択されたデータ種別を取得
             self.jvlink_manager.get_data_async(
@@ -627,15 +1073,59 @@ class AppController(QObject):
     def _ensure_database_tables(self):
         """
         データベーステーブルの存在を確認し、必要に応じて作成
+        （作成処理はスレッドプールで実行し、完了はシグナルで受け取る）
         """
+        if self._ensuring_tables:
+            # 実行中のジョブと異なるエンジン（再接続後）なら、完了後に再実行する
+            engine = self.db_manager.engine if self.db_manager else None
+            if engine is not None and engine is not self._ensure_tables_runnable.engine:
+                self._ensure_tables_pending = True
+            return
+
         try:
             if self.db_manager and self.db_manager.engine:
-                from ..models.tables import Base
-                Base.metadata.create_all(self.db_manager.engine)
-                self.emit_log("INFO", "データベーステーブルの初期化が完了しました")
+                runnable = _EnsureTablesRunnable(self.db_manager.engine)
+                runnable.signals.finished.connect(self._on_database_tables_ensured)
+                runnable.signals.error.connect(self._on_database_tables_error)
+
+                self._ensuring_tables = True
+                self._ensure_tables_runnable = runnable
+                QThreadPool.globalInstance().start(runnable)
         except Exception as e:
+            self._ensuring_tables = False
+            self._ensure_tables_runnable = None
             self.emit_log("WARNING", f"テーブル作成エラー: {e}")
 
+    @Slot()
+    def _on_database_tables_ensured(self):
+        """テーブル作成ワーカー完了時の処理"""
+        self._ensuring_tables = False
+        self._ensure_tables_runnable = None
+        self.emit_log("INFO", "データベーステーブルの初期化が完了しました")
+
+        # テーブル作成後、情報を再更新
+        self._update_dashboard_db_info()
+        self._rerun_pending_ensure_tables()
+
+    @Slot(str)
+    def _on_database_tables_error(self, error_message: str):
+        """テーブル作成ワーカーでエラーが発生した時の処理"""
+        self._ensuring_tables = False
+        self._ensure_tables_runnable = None
+        self.emit_log("WARNING", f"テーブル作成エラー: {error_message}")
+        self._rerun_pending_ensure_tables()
+
+    def _rerun_pending_ensure_tables(self):
+        """ジョブ実行中に再接続されていた場合、新しいエンジンでテーブル作成を再実行"""
+        if self._ensure_tables_pending:
+            self._ensure_tables_pending = False
+            self._ensure_database_tables()
+
+    def _set_status_bar_message(self, message: str, timeout: int = 0):
+        """ステータスバーのみにメッセージを表示（通知は行わない）"""
+        if self._status_bar is not None:
+            self._status_bar.showMessage(message, timeout)
+
     def _show_status_message(self, message: str, timeout: int = 5000):
         """
         統一通知システムを使用したステータスメッセージ表示（改良版）
@@ -645,8 +1135,7 @@ class AppController(QObject):
             timeout: 表示時間（ミリ秒）
         """
         # 旧来のステータスバー更新も維持（互換性のため）
-        if hasattr(self.main_window, 'statusBar'):
-            self.main_window.statusBar().showMessage(message, timeout)
+        self._set_status_bar_message(message, timeout)
         
         # 統一通知システムでも表示
         self.notification_manager.show_info(message, timeout=timeout)
@@ -656,11 +1145,19 @@ class AppController(QObject):
         """
         設定保存完了通知を受信 (ループ対策済み)
         """
+        # パイプライン設定・ETLルールとコーディネーターは次回参照時に再構築する
+        # （cached_property のため、実行中でなければキャッシュを破棄して新しい設定を反映）
+        self._cached_pipeline_config = None
+        self._etl_rules_cache = None
+        coordinator = self.__dict__.get('pipeline_coordinator')
+        if coordinator is not None and not coordinator.is_running:
+            del self.__dict__['pipeline_coordinator']
+
         # 初期化中は処理をスキップ（無限ループ対策）
         if self._is_initializing:
             return
             
-        logging.info("設定保存が完了しました。")
+        _logger.info("設定保存が完了しました。")
 
         # settings_managerからのシグナルを一時的にブロックし、再入を防ぐ
         is_blocked = self.settings_manager.signalsBlocked()
@@ -685,27 +1182,27 @@ class AppController(QObject):
         ダッシュボードのデータベース接続情報を更新（強化版）
         設定変更後の接続状態確認とUI反映を行う
         """
-        try:
-            if not hasattr(self.main_window, 'dashboard_view'):
-                self.emit_log("WARNING", "ダッシュボードビューが見つかりません")
-                return
+        dashboard = self._dashboard
+        if dashboard is None:
+            self.emit_log("WARNING", "ダッシュボードビューが見つかりません")
+            return
 
+        # ダッシュボード用のDB情報（テンプレートを複製して各経路で書き換える）
+        db_info = _DB_INFO_TEMPLATE.copy()
+
+        try:
             if not self.db_manager:
                 # DatabaseManagerが存在しない場合
                 self.emit_log("WARNING", "DatabaseManagerが存在しません")
-                offline_info = {
-                    'connected': False,
-                    'type': 'オフライン',
-                    'name': '未接続',
-                    'tables_count': 0,
-                    'last_updated': datetime.now().isoformat()
-                }
-                self.main_window.dashboard_view.update_db_info(offline_info)
+                db_info['type'] = 'オフライン'
+                db_info['name'] = '未接続'
                 return
 
             # データベース基本情報を取得
             db_type = self.db_manager.get_db_type() or 'Unknown'
             db_name = self.db_manager.get_db_name() or 'Unknown'
+            db_info['type'] = db_type
+            db_info['name'] = db_name
             
             self.emit_log("INFO", f"ダッシュボードDB情報更新: {db_type} - {db_name}")
 
@@ -717,15 +1214,7 @@ class AppController(QObject):
                 if self.db_manager.engine:
                     # エンジンが存在する場合は簡単な接続テストを実行
                     with self.db_manager.engine.connect() as conn:
-                        # データベース種別に応じたテストクエリ
-                        if db_type.lower() == 'sqlite':
-                            conn.execute(text("SELECT sqlite_version()"))
-                        elif db_type.lower() == 'mysql':
-                            conn.execute(text("SELECT VERSION()"))
-                        elif db_type.lower() == 'postgresql':
-                            conn.execute(text("SELECT version()"))
-                        else:
-                            conn.execute(text("SELECT 1"))
+                        conn.execute(_DEFAULT_PING)
                     
                     is_connected = True
                     self.emit_log("INFO", f"データベース接続確認成功: {db_type}")
@@ -740,57 +1229,48 @@ class AppController(QObject):
                 is_connected = False
 
             # テーブル数とデータサマリーを取得
-            tables_count = 0
             data_summary = {}
             
             if is_connected:
                 try:
                     data_summary = self.db_manager.get_data_summary()
-                    tables_count = len(data_summary) if data_summary else 0
-                    self.emit_log("INFO", f"データサマリー取得成功: {tables_count}テーブル")
+                    db_info['tables_count'] = len(data_summary) if data_summary else 0
+                    self.emit_log("INFO", f"データサマリー取得成功: {db_info['tables_count']}テーブル")
                     
                 except Exception as summary_error:
                     error_message = f"データサマリー取得エラー: {summary_error}"
                     self.emit_log("WARNING", error_message)
 
-            # ダッシュボード用のDB情報を構築
-            db_info = {
-                'connected': is_connected,
-                'type': db_type,
-                'name': db_name,
-                'tables_count': tables_count,
-                'last_updated': datetime.now().isoformat(),
-                'error_message': error_message if error_message else None
-            }
-
-            # ダッシュボードを更新
-            self.main_window.dashboard_view.update_db_info(db_info)
-
-            # データサマリーも更新（接続されている場合）
-            if is_connected and data_summary:
-                self.main_window.dashboard_view.update_dashboard_summary(data_summary)
-
-            self.emit_log("INFO", f"ダッシュボードDB情報更新完了: {db_type} ({db_name}) - 接続状態: {is_connected}")
+            db_info['connected'] = is_connected
+            db_info['error_message'] = error_message if error_message else None
 
         except Exception as e:
-            critical_error_msg = f"ダッシュボードDB情報更新で予期しないエラー: {e}"
-            self.emit_log("ERROR", critical_error_msg)
+            self.emit_log("ERROR", f"ダッシュボードDB情報更新で予期しないエラー: {e}")
 
             # クリティカルエラー時のフォールバック情報
-            fallback_info = {
-                'connected': False,
-                'type': 'システムエラー',
-                'name': 'N/A',
-                'tables_count': 0,
-                'last_updated': datetime.now().isoformat(),
-                'error_message': str(e)
-            }
+            db_info = _DB_INFO_TEMPLATE.copy()
+            db_info['type'] = 'システムエラー'
+            db_info['name'] = 'N/A'
+            db_info['error_message'] = str(e)
+            return
 
+        finally:
+            # どの経路でもダッシュボードへの反映はここで一度だけ行う
+            db_info['last_updated'] = _dashboard_timestamp()
             try:
-                if hasattr(self.main_window, 'dashboard_view'):
-                    self.main_window.dashboard_view.update_db_info(fallback_info)
-            except Exception as fallback_error:
-                self.emit_log("CRITICAL", f"フォールバック情報更新も失敗: {fallback_error}")
+                dashboard.update_db_info(db_info)
+            except Exception as update_error:
+                self.emit_log("CRITICAL", f"ダッシュボードDB情報の反映に失敗: {update_error}")
+
+        # データサマリーも更新（接続されている場合）
+        if is_connected and data_summary:
+            try:
+                dashboard.update_dashboard_summary(data_summary)
+            except Exception as e:
+                self.emit_log("ERROR", f"ダッシュボードDB情報更新で予期しないエラー: {e}")
+                return
+
+        self.emit_log("INFO", f"ダッシュボードDB情報更新完了: {db_type} ({db_name}) - 接続状態: {is_connected}")
 
     def handle_db_connection_success(self):
         """
@@ -799,17 +1279,8 @@ class AppController(QObject):
         self.emit_log("INFO", "データベース接続が正常に確立されました")
         self._update_dashboard_db_info()
 
-        # 必要に応じてテーブル作成
-        try:
-            from ..models.tables import Base
-            Base.metadata.create_all(self.db_manager.engine)
-            self.emit_log("INFO", "データベーステーブルの初期化が完了しました")
-
-            # テーブル作成後、情報を再更新
-            self._update_dashboard_db_info()
-
-        except Exception as e:
-            self.emit_log("ERROR", f"テーブル作成エラー: {e}")
+        # 必要に応じてテーブル作成（完了後にダッシュボード情報を再更新）
+        self._ensure_database_tables()
 
     def handle_db_connection_error(self, error_message: str):
         """
@@ -818,8 +1289,8 @@ class AppController(QObject):
         self.emit_log("ERROR", f"データベース接続エラー: {error_message}")
 
         # エラー状態をダッシュボードに反映
-        if hasattr(self.main_window, 'dashboard_view'):
-            self.main_window.dashboard_view.show_db_error(str(e))
+        if self._dashboard is not None:
+            self._dashboard.show_db_error(str(e))
 
     # 修正点2: ErrorStateからのシグナルを受信するスロット
     @Slot(str, str)
@@ -828,12 +1299,30 @@ class AppController(QObject):
         修正点2: エラーダイアログを表示するスロット
         UIスレッドで安全に実行される
         """
-        from PySide6.QtWidgets import QMessageBox
+        if self._error_dialog is None:
+            self._error_dialog = self._create_error_dialog()
 
-        # QMessageBoxはUIコンポーネントなので、親ウィジェットを指定するのが望ましい
-        QMessageBox.critical(self.main_window, title, message)
+        dialog = self._error_dialog
+
+        # 表示中に次のエラーが届いた場合は、先のエラーを残したまま追記する
+        if dialog.isVisible():
+            dialog.setText(f"{dialog.text()}\n\n{title}:\n{message}")
+            self.emit_log("INFO", f"エラーダイアログに追記: {title}")
+            return
+
+        dialog.setWindowTitle(title)
+        dialog.setText(message)
 
         self.emit_log("INFO", f"エラーダイアログ表示: {title}")
+        dialog.exec()
+
+    def _create_error_dialog(self):
+        """使い回し用のエラーダイアログを生成"""
+        # QMessageBoxはUIコンポーネントなので、親ウィジェットを指定するのが望ましい
+        dialog = QMessageBox(self.main_window)
+        dialog.setIcon(QMessageBox.Critical)
+        dialog.setStandardButtons(QMessageBox.Ok)
+        return dialog
 
     def refresh_db_info(self):
         """
@@ -851,37 +1340,53 @@ class AppController(QObject):
         self.log_records.append(log_record)
 
         # ダッシュボードのログビューアに送信
-        if hasattr(self.main_window, 'dashboard_view'):
-            self.main_window.dashboard_view.add_log_record(log_record)
+        if self._dashboard is not None:
+            self._dashboard.add_log_record(log_record)
 
         # 重要なログレベルの場合は追加処理
-        if log_record.level in ['ERROR', 'CRITICAL']:
+        if log_record.level in _CRITICAL_LEVELS:
             self._handle_critical_log(log_record)
 
     @Slot(object)
     def on_progress_received(self, progress_info: NewProgressInfo):
         """進捗情報を受信して処理"""
         # ダッシュボードのマルチタスク進捗を更新
-        if hasattr(self.main_window, 'dashboard_view'):
-            dashboard = self.main_window.dashboard_view
-
-            # タスクが未登録の場合は追加
+        if self._dashboard is not None:
+            # タスクが未登録の場合は即座に追加
             if progress_info.task_name not in self.active_tasks:
-                dashboard.add_task(
+                if self._add_task is not None:
+                    self._add_task(
+                        progress_info.task_name,
+                        progress_info.worker_name)
+                self.active_tasks[progress_info.task_name] = TaskInfo(
+                    worker_name=progress_info.worker_name,
+                    start_time=datetime.now(),
+                    status='running'
+                )
+                self._status_counts['running'] += 1
+
+            # 進捗はタスクごとに最新値のみ保持し、タイマーでまとめて反映する
+            self._pending_progress[progress_info.task_name] = progress_info
+            if not self._progress_flush_timer.isActive():
+                self._progress_flush_timer.start()
+
+    @Slot()
+    def _flush_progress(self):
+        """合流された進捗情報をダッシュボードへ一括反映"""
+        if not self._pending_progress:
+            return
+
+        pending = self._pending_progress
+        self._pending_progress = {}
+
+        update_task_progress = self._update_task_progress
+        if update_task_progress is not None:
+            for progress_info in pending.values():
+                update_task_progress(
                     progress_info.task_name,
-                    progress_info.worker_name)
-                self.active_tasks[progress_info.task_name] = {
-                    'worker_name': progress_info.worker_name,
-                    'start_time': datetime.now(),
-                    'status': 'running'
-                }
-
-            # 進捗を更新
-            dashboard.update_task_progress(
-                progress_info.task_name,
-                progress_info.percentage,
-                progress_info.status_message
-            )
+                    progress_info.percentage,
+                    progress_info.status_message
+                )
 
     @Slot(str, str, str)
     def on_status_received(
@@ -891,39 +1396,46 @@ class AppController(QObject):
             status_message: str):
         """ステータス更新を受信して処理"""
         # ダッシュボードの該当タスクステータスを更新
-        if hasattr(self.main_window, 'dashboard_view'):
+        dashboard = self._dashboard
+        if dashboard is not None and self._update_task_progress is not None:
             # 現在の進捗率を維持してステータスのみ更新
-            dashboard = self.main_window.dashboard_view
-            if task_name in dashboard.task_widgets:
-                current_progress = dashboard.task_widgets[task_name].progress_bar.value(
+            task_widgets = getattr(dashboard, 'task_widgets', {})
+            if task_name in task_widgets:
+                current_progress = task_widgets[task_name].progress_bar.value(
                 )
-                dashboard.update_task_progress(
+                self._update_task_progress(
                     task_name, current_progress, status_message)
 
     @Slot(object)
     def on_task_finished(self, result: TaskResult):
         """タスク完了結果を受信して処理"""
+        # 未反映の進捗で完了状態が上書きされないよう破棄
+        self._pending_progress.pop(result.task_name, None)
+
         # アクティブタスクの状態を更新
         if result.task_name in self.active_tasks:
-            self.active_tasks[result.task_name]['status'] = 'completed' if result.success else 'error'
-            self.active_tasks[result.task_name]['end_time'] = datetime.now()
+            self._set_task_status(
+                result.task_name, 'completed' if result.success else 'error')
+            self.active_tasks[result.task_name].end_time = datetime.now()
 
         # ダッシュボードのタスク完了状態を更新
-        if hasattr(self.main_window, 'dashboard_view'):
-            self.main_window.dashboard_view.complete_task(
+        if self._complete_task is not None:
+            self._complete_task(
                 result.task_name, result.success)
 
         # 完了ログを記録
-        completion_log = LogRecord(
-            timestamp=datetime.now(),
-            level='INFO' if result.success else 'ERROR',
-            task_name=result.task_name,
-            worker_name=result.worker_name,
-            message=f"タスク完了: {
-                result.items_processed}アイテム処理, {
-                result.records_written}レコード書き込み, {
-                result.processing_time:.2f}秒")
-        self.on_structured_log_received(completion_log)
+        level = _TASK_RESULT_LEVEL[bool(result.success)]
+        if self._should_log(level):
+            completion_log = LogRecord(
+                timestamp=datetime.now(),
+                level=level,
+                task_name=result.task_name,
+                worker_name=result.worker_name,
+                message=_COMPLETION_TEMPLATE.format(
+                    items=result.items_processed,
+                    records=result.records_written,
+                    time=result.processing_time))
+            self.on_structured_log_received(completion_log)
 
     @Slot(str, str, str)
     def on_error_received(
@@ -944,11 +1456,12 @@ class AppController(QObject):
 
         # タスクの状態を更新
         if task_name in self.active_tasks:
-            self.active_tasks[task_name]['status'] = 'error'
+            self._set_task_status(task_name, 'error')
+        self._pending_progress.pop(task_name, None)
 
         # ダッシュボードのタスクエラー状態を更新
-        if hasattr(self.main_window, 'dashboard_view'):
-            self.main_window.dashboard_view.update_task_progress(
+        if self._update_task_progress is not None:
+            self._update_task_progress(
                 task_name, 0, f"エラー: {error_message}")
 
     def _handle_critical_log(self, log_record: LogRecord):
@@ -956,8 +1469,8 @@ class AppController(QObject):
         # エラーダイアログ表示などの処理
         if log_record.level == 'CRITICAL':
             # クリティカルエラーの場合は即座に通知
-            logging.critical(
-                f"[{log_record.task_name}|{log_record.worker_name}] {log_record.message}")
+            _logger.critical(
+                "[%s|%s] %s", log_record.task_name, log_record.worker_name, log_record.message)
 
         # 状態機械への通知（必要に応じて）
         if hasattr(self._state, 'handle_critical_error'):
@@ -966,28 +1479,32 @@ class AppController(QObject):
     def clear_all_tasks(self):
         """すべてのアクティブタスクをクリア"""
         self.active_tasks.clear()
-        if hasattr(self.main_window, 'dashboard_view'):
-            self.main_window.dashboard_view.clear_all_tasks()
-            self.main_window.dashboard_view.clear_logs()
+        for status in self._status_counts:
+            self._status_counts[status] = 0
+        if self._dashboard is not None:
+            self._dashboard.reset()
+
+    def _set_task_status(self, task_name: str, new_status: str):
+        """タスクの状態を更新し、状態別のタスク数を同時に更新"""
+        task_info = self.active_tasks[task_name]
+        old_status = task_info.status
+        if old_status == new_status:
+            return
+
+        task_info.status = new_status
+        self._status_counts[old_status] -= 1
+        self._status_counts[new_status] += 1
 
     def get_active_task_summary(self) -> Dict[str, Any]:
         """アクティブタスクのサマリーを取得"""
-        total_tasks = len(self.active_tasks)
-        completed_tasks = sum(
-            1 for task in self.active_tasks.values() if task['status'] == 'completed')
-        error_tasks = sum(
-            1 for task in self.active_tasks.values() if task['status'] == 'error')
-        running_tasks = total_tasks - completed_tasks - error_tasks
-
         return {
-            'total': total_tasks,
-            'completed': completed_tasks,
-            'error': error_tasks,
-            'running': running_tasks
+            'total': len(self.active_tasks),
+            **self._status_counts
         }
 
     # === 既存UIメソッドをState Machineパターンに適合（段階的移行）===
 
+    @Slot()
     def show_setup_dialog(self):
         """
         セットアップデータ取得設定ダイアログを表示
@@ -997,8 +1514,6 @@ class AppController(QObject):
 
         try:
             # 新しいデータ選択ダイアログを表示
-            from ..views.data_selection_dialog import DataSelectionDialog
-            
             dialog = DataSelectionDialog(mode="setup", parent=self.main_window)
             
             if dialog.exec() == QDialog.Accepted:
@@ -1014,17 +1529,19 @@ class AppController(QObject):
                     return False
                 
                 # 選択内容の確認ダイアログ
-                data_names = [DataSelectionDialog.get_data_type_name(dt) for dt in selected_data_types]
+                get_data_type_name = DataSelectionDialog.get_data_type_name
+                preview = ', '.join(
+                    get_data_type_name(dt) for dt in islice(selected_data_types, 5))
+                total = len(selected_data_types)
                 confirmation_text = (
                     f"以下の設定でセットアップデータ取得を開始しますか？\n\n"
                     f"開始日: {start_date}\n"
-                    f"データ種別: {', '.join(data_names[:5])}"
-                    f"{'...' if len(data_names) > 5 else ''} "
-                    f"(合計{len(data_names)}種類)\n\n"
+                    f"データ種別: {preview}"
+                    f"{'...' if total > 5 else ''} "
+                    f"(合計{total}種類)\n\n"
                     f"※ 大量のデータをダウンロードするため、時間がかかる場合があります。"
                 )
                 
-                from PySide6.QtWidgets import QMessageBox
                 reply = QMessageBox.question(
                 self.main_window,
                         'セットアップデータ取得確認',
@@ -1054,6 +1571,7 @@ class AppController(QObject):
             self._show_status_message(f"設定エラー: {e}", 8000)
             return False
 
+    @Slot()
     def start_diff_update(self):
         """
         差分データ更新設定ダイアログを表示
@@ -1063,8 +1581,6 @@ class AppController(QObject):
 
         try:
             # 新しいデータ選択ダイアログを表示
-            from ..views.data_selection_dialog import DataSelectionDialog
-            
             dialog = DataSelectionDialog(mode="differential", parent=self.main_window)
             
             if dialog.exec() == QDialog.Accepted:
@@ -1084,7 +1600,6 @@ class AppController(QObject):
                     warning_msg = "最終更新タイムスタンプが設定されていません。まずセットアップデータを取得することを推奨します。"
                     self.emit_log("WARNING", warning_msg)
                     
-                    from PySide6.QtWidgets import QMessageBox
                     reply = QMessageBox.question(
                         self.main_window,
                         '差分更新確認',
@@ -1099,16 +1614,18 @@ class AppController(QObject):
                     last_timestamp = ""  # 空の場合は全データ取得
                 
                 # 選択内容の確認
-                data_names = [DataSelectionDialog.get_data_type_name(dt) for dt in selected_data_types]
+                get_data_type_name = DataSelectionDialog.get_data_type_name
+                preview = ', '.join(
+                    get_data_type_name(dt) for dt in islice(selected_data_types, 5))
+                total = len(selected_data_types)
                 confirmation_text = (
                     f"以下の設定で差分データ更新を開始しますか？\n\n"
                     f"最終更新: {last_timestamp or '未設定（全データ取得）'}\n"
-                    f"データ種別: {', '.join(data_names[:5])}"
-                    f"{'...' if len(data_names) > 5 else ''} "
-                    f"(合計{len(data_names)}種類)"
+                    f"データ種別: {preview}"
+                    f"{'...' if total > 5 else ''} "
+                    f"(合計{total}種類)"
                 )
                 
-                from PySide6.QtWidgets import QMessageBox
                 reply = QMessageBox.question(
                     self.main_window,
                     '差分データ更新確認',
@@ -1154,7 +1671,7 @@ class AppController(QObject):
 
     def _is_idle_state(self) -> bool:
         """現在の状態がアイドル状態かどうかを判定"""
-        return self._state and self._state.name == "Idle"
+        return self._state_kind == StateKind.IDLE
 
     def _can_start_processing(self) -> bool:
         """処理開始が可能かどうかを判定"""
@@ -1174,7 +1691,7 @@ class AppController(QObject):
         Args:
             error_message: エラーメッセージ
         """
-        logging.error(f"JV-Linkエラーが発生しました: {error_message}")
+        _logger.error("JV-Linkエラーが発生しました: %s", error_message)
 
         # 統一通知システムでエラー表示（改良版）
         self._show_error_message("JV-Linkでエラーが発生しました", error_message)
@@ -1182,7 +1699,7 @@ class AppController(QObject):
         # JV-Link状態の確認とリセット
         if hasattr(self.jvlink_manager, 'current_state'):
             current_state = self.jvlink_manager.current_state
-            logging.info(f"エラー発生時のJV-Link状態: {current_state.value}")
+            _logger.info("エラー発生時のJV-Link状態: %s", current_state.value)
 
             # エラー状態の場合は手動でリセットが必要であることを通知
             if current_state.value == "ERROR":
@@ -1200,30 +1717,29 @@ class AppController(QObject):
             raw_data_list: (data_spec, raw_data)のタプルのリスト
         """
         if not raw_data_list:
-            logging.info("受信データが空でした。")
+            _logger.info("受信データが空でした。")
             # パイプラインが起動していれば終了マーカーを送信
             if self.etl_pipeline.is_running:
                 self.etl_pipeline.finish_production()
             return
 
-        logging.info(f"データ受信: 総件数: {len(raw_data_list)}")
+        _logger.info("データ受信: 総件数: %d", len(raw_data_list))
 
         # パイプラインが実行中でない場合は開始
         if not self.etl_pipeline.is_running:
-            # 現在選択されているETLルールを取得
-            active_rule_name = self.main_window.etl_setting_view.rule_combo.currentText()
-            all_rules = self.settings_manager.load_etl_rules()
-            active_rule = all_rules.get(active_rule_name, {})
+            # 現在選択されているETLルールを取得（選択時に確定済み）
+            active_rule = self._active_rule or {}
 
             self.etl_pipeline.start_pipeline(active_rule)
+            self._pipeline_progress_sent = self._pipeline_progress_buffer
+            self._pipeline_progress_timer.start()
 
         # 総処理予定件数を更新
         self.pipeline_total_expected += len(raw_data_list)
         self.pipeline_processed_count = 0
 
-        # データをパイプラインに送信
-        for data_spec, raw_data in raw_data_list:
-            self.etl_pipeline.add_data(data_spec, raw_data)
+        # データをパイプラインにまとめて送信
+        self.etl_pipeline.add_data_bulk(raw_data_list)
 
         # データ送信完了をマーク
         self.etl_pipeline.finish_production()
@@ -1236,23 +1752,17 @@ class AppController(QObject):
         Args:
             last_timestamp: 最終ファイルタイムスタンプ
         """
-        logging.info(f"データ取得が完了しました。最終タイムスタンプ: {last_timestamp}")
+        _logger.info("データ取得が完了しました。最終タイムスタンプ: %s", last_timestamp)
 
         try:
             # 最終タイムスタンプを設定に保存
             if last_timestamp and last_timestamp != "キャンセル":
                 self.settings_manager.update_last_file_timestamp(
                     last_timestamp)
-                logging.info(f"最終タイムスタンプを更新しました: {last_timestamp}")
-
-            # ダッシュボードの更新
-            if hasattr(self.main_window, 'dashboard_view'):
-                summary = self.db_manager.get_data_summary()
-                self.main_window.dashboard_view.update_dashboard_summary(
-                    summary)
+                _logger.info("最終タイムスタンプを更新しました: %s", last_timestamp)
 
-            # データベース情報の更新
-            self._update_dashboard_db_info()
+            # ダッシュボードの更新はイベントループに戻してから順に実行する
+            QTimer.singleShot(0, self._apply_summary_update)
 
             # 統一通知システムで完了メッセージ表示（改良版）
             if last_timestamp == "キャンセル":
@@ -1261,10 +1771,20 @@ class AppController(QObject):
                 self._show_success_message("データ取得が完了しました")
 
         except Exception as e:
-            logging.error(f"データ取得完了処理中にエラー: {e}")
+            _logger.error("データ取得完了処理中にエラー: %s", e)
             # 統一通知システムでエラー表示
             self._show_error_message("完了処理でエラーが発生しました", str(e))
 
+    @Slot()
+    def _apply_summary_update(self):
+        """データ取得完了後のダッシュボード更新（1段目: データサマリー）"""
+        # サマリーはバックグラウンドで取得
+        if self._dashboard is not None:
+            self._request_data_summary()
+
+        # データベース情報の更新は次のイベントループで実行
+        QTimer.singleShot(0, self._update_dashboard_db_info)
+
     # === キャンセル機能（State Machine対応）===
 
     def cancel_current_operation(self):
@@ -1276,44 +1796,37 @@ class AppController(QObject):
     # === 既存のエクスポート機能（State Machine対応）===
 
     @Slot(dict)
+    @requires_idle("エクスポート")
     def start_export(self, params: dict):
         """ExportViewからのリクエストを受けてエクスポートを開始する"""
-        # アイドル状態でない場合は開始しない
-        if not self._is_idle_state():
-            logging.warning(f"エクスポートは現在実行できません。現在の状態: {self.state_name}")
-            return
-
-        logging.info("エクスポート処理の開始をExportManagerに依頼します。")
+        _logger.info("エクスポート処理の開始をExportManagerに依頼します。")
         self.export_manager.start_export(params)
-        if hasattr(self.main_window, 'statusBar'):
-            self.main_window.statusBar().showMessage("エクスポートを開始しました...")
+        self._set_status_bar_message("エクスポートを開始しました...")
 
     @Slot(str)
     def on_export_finished(self, message: str):
         """エクスポート完了をUIに反映する"""
-        logging.info(f"[Export Finished] {message}")
+        _logger.info("[Export Finished] %s", message)
         # 統一通知システムで成功メッセージ表示
         self._show_success_message(message)
 
         # State MachineのIDLE状態に戻す
-        from ..services.state_machine.states import IdleState
         self.transition_to(IdleState())
 
     @Slot(str)
     def on_export_error(self, message: str):
         """エクスポートエラーをUIに反映する"""
-        logging.error(f"[Export Error] {message}")
+        _logger.error("[Export Error] %s", message)
         # 統一通知システムでエラー表示
         self._show_error_message("エクスポートでエラーが発生しました", message)
 
         # State MachineのIDLE状態に戻す
-        from ..services.state_machine.states import IdleState
         self.transition_to(IdleState())
 
     @Slot(str)
     def on_export_progress(self, message: str):
         """エクスポートの進捗をUIに反映する"""
-        logging.info(f"[Export Progress] {message}")
+        _logger.info("[Export Progress] %s", message)
         # 統一通知システムで情報表示
         self._show_status_message(message)
 
@@ -1327,43 +1840,93 @@ class AppController(QObject):
         """パイプラインでアイテムが処理された時のスロット"""
         self.pipeline_processed_count += processed_count
 
-        # 進捗を更新
+        # 進捗はバッファに保持し、タイマーでまとめてダッシュボードへ反映する
         if self.pipeline_total_expected > 0:
             progress = min(
                 100,
                 (self.pipeline_processed_count *
                  100) //
                 self.pipeline_total_expected)
-            if hasattr(self.main_window, 'dashboard_view'):
-                self.main_window.dashboard_view.update_progress(
-                    progress, f"処理中: {data_spec}")
+            self._pipeline_progress_buffer = (progress, data_spec)
+
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "パイプライン処理進捗: %s, %d 件処理, 合計: %d/%d",
+                data_spec, processed_count,
+                self.pipeline_processed_count, self.pipeline_total_expected)
+
+    @Slot()
+    def _flush_pipeline_progress(self):
+        """バッファされたパイプライン進捗を変化があった場合のみ反映"""
+        buffered = self._pipeline_progress_buffer
+        if buffered == self._pipeline_progress_sent:
+            return
+        self._pipeline_progress_sent = buffered
 
-        logging.info(
-            f"パイプライン処理進捗: {data_spec}, {processed_count} 件処理, " f"合計: {
-                self.pipeline_processed_count}/{
-                self.pipeline_total_expected}")
+        if self._dashboard is not None:
+            progress, data_spec = buffered
+            self._dashboard.update_progress(progress, f"処理中: {data_spec}")
 
     @Slot()
     def _on_pipeline_finished(self):
         """パイプライン処理完了時のスロット"""
-        logging.info("ETLパイプラインの処理が完了しました。")
+        _logger.info("ETLパイプラインの処理が完了しました。")
+        self._pipeline_progress_timer.stop()
+        self._pipeline_progress_buffer = (0, "")
 
         # 進捗を100%に更新
-        if hasattr(self.main_window, 'dashboard_view'):
-            self.main_window.dashboard_view.update_progress(100, "ETL処理完了")
+        if self._dashboard is not None:
+            self._dashboard.update_progress(100, "ETL処理完了")
 
-        # データサマリーを更新
-        summary = self.db_manager.get_data_summary()
-        self.main_window.dashboard_view.update_dashboard_summary(summary)
+        # データサマリーを更新（バックグラウンドで取得）
+        self._request_data_summary()
 
         # パイプライン統計をリセット
         self.pipeline_total_expected = 0
         self.pipeline_processed_count = 0
 
+    def _request_data_summary(self):
+        """データサマリーの取得をスレッドプールに依頼し、完了後にダッシュボードへ反映する"""
+        if self._summary_in_flight:
+            # 実行中の集計は古い可能性があるため、完了後にもう一度取得する
+            self._summary_requested = True
+            return
+
+        runnable = _SummaryRunnable(self.db_manager)
+        runnable.signals.summary_ready.connect(self._on_data_summary_ready)
+        runnable.signals.error.connect(self._on_data_summary_error)
+
+        self._summary_in_flight = True
+        self._summary_requested = False
+        self._summary_runnable = runnable
+        QThreadPool.globalInstance().start(runnable)
+
+    def _finish_data_summary_request(self):
+        """サマリー取得完了時の共通処理（保留中の要求があれば再実行）"""
+        self._summary_in_flight = False
+        self._summary_runnable = None
+        if self._summary_requested:
+            self._request_data_summary()
+
+    @Slot(dict)
+    def _on_data_summary_ready(self, summary: dict):
+        """データサマリー取得ワーカー完了時の処理"""
+        if self._dashboard is not None:
+            self._dashboard.update_dashboard_summary(summary)
+        self._finish_data_summary_request()
+
+    @Slot(str)
+    def _on_data_summary_error(self, error_message: str):
+        """データサマリー取得ワーカーでエラーが発生した時の処理"""
+        self.emit_log("WARNING", f"データサマリー取得エラー: {error_message}")
+        self._finish_data_summary_request()
+
     @Slot(str)
     def _on_pipeline_error(self, error_message: str):
         """パイプラインでエラーが発生した時のスロット"""
-        logging.error(f"ETLパイプラインエラー: {error_message}")
+        _logger.error("ETLパイプラインエラー: %s", error_message)
+        self._pipeline_progress_timer.stop()
+        self._pipeline_progress_buffer = (0, "")
 
         # State Machineのエラーハンドリングを使用
         error = RuntimeError(f"ETL Pipeline Error: {error_message}")
@@ -1373,27 +1936,37 @@ class AppController(QObject):
             self._state.handle_error(error, context_info)
         else:
             # フォールバック：直接エラー状態に遷移
-            from ..services.state_machine.states import ErrorState
             self.transition_to(ErrorState(error, context_info))
 
     def cleanup(self):
         """アプリケーション終了時のクリーンアップ処理"""
-        logging.info("クリーンアップ処理を実行します。")
+        _logger.info("クリーンアップ処理を実行します。")
 
         # 実行中の処理をキャンセル
         if not self._is_idle_state():
-            logging.info("実行中の処理をキャンセルしてからクリーンアップします。")
+            _logger.info("実行中の処理をキャンセルしてからクリーンアップします。")
             self.request_cancel()
 
-            # キャンセル完了を待つ（最大3秒）
-            import time
-            timeout = 3.0
-            start_time = time.time()
-            while not self._is_idle_state() and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
+            # キャンセル完了（アイドル状態への遷移）をイベントループを回しながら待つ（最大3秒）
+            if not self._is_idle_state():
+                loop = QEventLoop()
+
+                def _quit_when_idle(_state_name):
+                    if self._is_idle_state():
+                        loop.quit()
+
+                self.state_changed.connect(_quit_when_idle)
+                QTimer.singleShot(_CLEANUP_CANCEL_TIMEOUT_MS, loop.quit)
+                loop.exec()
+                self.state_changed.disconnect(_quit_when_idle)
 
             if not self._is_idle_state():
-                logging.warning("キャンセル完了を待つのがタイムアウトしました。強制終了します。")
+                _logger.warning("キャンセル完了を待つのがタイムアウトしました。強制終了します。")
+
+        # 未実行のデータ取得要求は破棄
+        self._acquisition_timer.stop()
+        self._acquisition_cmd_queue.clear()
+        self._ui_flush_timer.stop()
 
         # ETLパイプラインの停止
         if self.etl_pipeline.is_running:
@@ -1402,6 +1975,17 @@ class AppController(QObject):
         self.db_manager.close()
         self.jvlink_manager.close()
 
+        # 未配信の構造化ログ（終了時のエラーを含む）をすべて配信してからタイマーを止める
+        while self._log_queue:
+            self._drain_log_queue()
+        self._log_drain_timer.stop()
+
+        # 設定ダイアログ用に保持していたCOMオブジェクトを解放
+        self._jvlink_com_cache = None
+        if self._com_initialized:
+            self._pythoncom.CoUninitialize()
+            self._com_initialized = False
+
     # --- Export Slots ---
     # === データベース設定チェック機能（State Machineで使用）===
 
@@ -1455,13 +2039,12 @@ class AppController(QObject):
 
     def _show_config_error(self, message: str):
         """設定エラーメッセージを表示する"""
-        from PySide6.QtWidgets import QMessageBox
         QMessageBox.warning(
             self.main_window,
             "設定エラー",
             message
         )
-        logging.warning(f"Database config error: {message}")
+        _logger.warning("Database config error: %s", message)
 
     # === リアルタイム監視機能（既存機能との統合）===
 
@@ -1478,59 +2061,55 @@ class AppController(QObject):
         # JV-Linkの初期化状態をチェック
         if not self.jvlink_manager.is_initialized():
             error_msg = "JV-Linkが初期化されていません。まず設定画面からJV-Linkを初期化してください。"
-            logging.error(error_msg)
+            _logger.error(error_msg)
             # 統一通知システムでエラー表示
             self._show_error_message("JV-Link未初期化", error_msg)
 
             # 速報ボタンを無効状態に戻す
-            if hasattr(self.main_window, 'dashboard_view'):
-                self.main_window.dashboard_view.update_realtime_button_state(
+            if self._dashboard is not None:
+                self._dashboard.update_realtime_button_state(
                     False)
             return
 
         # データベースにデータが存在するかチェック
         try:
-            summary = self.db_manager.get_data_summary()
-            if not summary or all(info.get('count', 0) ==
-                                  0 for info in summary.values()):
+            if not self.db_manager.has_any_data():
                 warning_msg = "データベースにデータが存在しません。まずセットアップまたは差分データを取得してください。"
-                logging.warning(warning_msg)
+                _logger.warning(warning_msg)
                 # 統一通知システムで警告表示
                 self._show_warning_message("データベースが空です", warning_msg)
 
                 # 速報ボタンを無効状態に戻す
-                if hasattr(self.main_window, 'dashboard_view'):
-                    self.main_window.dashboard_view.update_realtime_button_state(
+                if self._dashboard is not None:
+                    self._dashboard.update_realtime_button_state(
                         False)
                 return
         except Exception as e:
-            logging.error(f"データベース状態確認エラー: {e}")
+            _logger.error("データベース状態確認エラー: %s", e)
 
-        logging.info("速報イベントの監視開始を指示します。")
+        _logger.info("速報イベントの監視開始を指示します。")
         try:
             self.jvlink_manager.watch_realtime_events_async()
             # 統一通知システムで情報表示
             self._show_info_message("速報受信を開始しました")
         except Exception as e:
-            logging.error(f"速報監視開始エラー: {e}")
+            _logger.error("速報監視開始エラー: %s", e)
             # 統一通知システムでエラー表示
             self._show_error_message("速報監視開始でエラーが発生しました", str(e))
 
             # 速報ボタンを無効状態に戻す
-            if hasattr(self.main_window, 'dashboard_view'):
-                self.main_window.dashboard_view.update_realtime_button_state(
+            if self._dashboard is not None:
+                self._dashboard.update_realtime_button_state(
                     False)
 
     def stop_realtime_watch(self):
         """速報イベントの監視を停止する"""
-        logging.info("速報イベントの監視停止を指示します。")
+        _logger.info("速報イベントの監視停止を指示します。")
         try:
             self.jvlink_manager.stop_watching_events()
         except Exception as e:
-            logging.error(f"速報監視停止エラー: {e}")
-            if hasattr(self.main_window, 'statusBar'):
-                self.main_window.statusBar().showMessage(
-                    f"速報監視停止エラー: {e}", 5000)
+            _logger.error("速報監視停止エラー: %s", e)
+            self._set_status_bar_message(f"速報監視停止エラー: {e}", 5000)
 
     @Slot(list)
     def on_realtime_event_received(self, event_data: list):
@@ -1538,27 +2117,40 @@ class AppController(QObject):
         # data_specはイベントデータ自身から特定する必要がある
         # ここでは仮に 'REALTIME' とする
         data_spec = "REALTIME"
-        logging.info(
-            f"速報イベントを処理します: Spec={data_spec}, Data length={len(event_data[0])}")
+        _logger.info(
+            "速報イベントを処理します: Spec=%s, Data length=%d", data_spec, len(event_data[0]))
 
-        # ETL処理 (ログ出力のみ)
-        transformed_dfs = self.etl_processor.transform(event_data, data_spec)
-        logging.info(f"ETL結果: {transformed_dfs.keys()}")
+        # ETL処理はワーカースレッドで実行し、結果はシグナルで受け取る
+        runnable = _RealtimeTransformRunnable(
+            self.etl_processor, event_data, data_spec)
+        runnable.signals.transformed.connect(self._on_realtime_transformed)
+        runnable.signals.error.connect(self._on_realtime_transform_error)
+        self._realtime_pool.start(runnable)
+
+    @Slot(object)
+    def _on_realtime_transformed(self, transformed_dfs: dict):
+        """速報データのETL変換完了時の処理"""
+        _logger.info("ETL結果: %s", transformed_dfs.keys())
 
         # DB保存 (ログ出力のみ)
         for table_name, df in transformed_dfs.items():
-            logging.info(
-                f"テーブル '{table_name}' に {
-                    len(df)} 件の速報データを保存します（ログのみ）。")
+            _logger.info(
+                "テーブル '%s' に %d 件の速報データを保存します（ログのみ）。",
+                table_name, len(df))
             # self.db_manager.bulk_insert(table_name, df)
 
+    @Slot(str)
+    def _on_realtime_transform_error(self, error_message: str):
+        """速報データのETL変換でエラーが発生した時の処理"""
+        _logger.error("速報データ変換エラー: %s", error_message)
+
     @Slot()
     def on_realtime_watch_started(self):
         """速報監視開始時の処理"""
-        logging.info("UIに監視開始を通知します。")
+        _logger.info("UIに監視開始を通知します。")
         self.is_watching_realtime = True
-        if hasattr(self.main_window, 'dashboard_view'):
-            dashboard = self.main_window.dashboard_view
+        if self._dashboard is not None:
+            dashboard = self._dashboard
             if hasattr(dashboard, 'update_realtime_button_state'):
                 dashboard.update_realtime_button_state(
                     self.is_watching_realtime)
@@ -1566,10 +2158,10 @@ class AppController(QObject):
     @Slot()
     def on_realtime_watch_stopped(self):
         """速報監視停止時の処理"""
-        logging.info("UIに監視停止を通知します。")
+        _logger.info("UIに監視停止を通知します。")
         self.is_watching_realtime = False
-        if hasattr(self.main_window, 'dashboard_view'):
-            dashboard = self.main_window.dashboard_view
+        if self._dashboard is not None:
+            dashboard = self._dashboard
             if hasattr(dashboard, 'update_realtime_button_state'):
                 dashboard.update_realtime_button_state(
                     self.is_watching_realtime)
@@ -1579,7 +2171,13 @@ class AppController(QObject):
     @Slot(int)
     def on_progress_updated(self, percent: int):
         """データ取得の進捗をUIに反映する"""
-        logging.info(f"データ取得進捗: {percent}%")
+        # 進捗率が変わらない通知は破棄する
+        if percent == self._last_percent:
+            return
+        self._last_percent = percent
+
+        if percent % 5 == 0:
+            _logger.info("データ取得進捗: %s%%", percent)
 
         # State Machineに進捗情報を通知
         if self._state:
@@ -1589,23 +2187,21 @@ class AppController(QObject):
             self._state.handle_progress_update(progress_info)
 
         # UIに進捗を反映
-        if hasattr(self.main_window, 'dashboard_view'):
-            dashboard = self.main_window.dashboard_view
+        if self._dashboard is not None:
+            dashboard = self._dashboard
             if hasattr(dashboard, 'update_progress'):
                 dashboard.update_progress(percent, f"データ取得中... {percent}%")
 
         # ステータスメッセージも更新
-        if hasattr(self.main_window, 'statusBar'):
-            self.main_window.statusBar().showMessage(f"データ取得中... {percent}%")
+        self._set_status_bar_message(f"データ取得中... {percent}%")
 
     # === エクスポート進捗機能 ===
 
     @Slot(str)
     def on_export_progress(self, message: str):
         """エクスポートの進捗をUIに反映する"""
-        logging.info(f"[Export Progress] {message}")
-        if hasattr(self.main_window, 'statusBar'):
-            self.main_window.statusBar().showMessage(message)
+        _logger.info("[Export Progress] %s", message)
+        self._set_status_bar_message(message)
 
     # === 設定管理機能（既存機能との統合）===
 
@@ -1624,13 +2220,14 @@ class AppController(QObject):
                 
                 # SettingsManagerで設定を更新
                 self.settings_manager.update_db_config(**db_config)
-                logging.info("データベース設定が更新されました。")
+                _logger.info("データベース設定が更新されました。")
                 
                 # データベース設定を更新し、再接続を試行
                 success, message = self.db_manager.reconnect(db_config)
                 
                 # ダッシュボードのDB情報を常に更新して最新の状態を反映
-                self._update_dashboard_db_info()
+                # （再接続直後のため、イベントループに戻してから実行）
+                QTimer.singleShot(0, self._update_dashboard_db_info)
                 
                 if success:
                     # 統一通知システムで成功メッセージ表示
@@ -1639,20 +2236,20 @@ class AppController(QObject):
                     # 統一通知システムでエラー表示とダイアログ
                     self._show_error_message("データベース再接続に失敗しました", message, show_dialog=True)
 
-            # その他の設定（データベース以外）
-            for section, section_data in settings.items():
-                if section not in ['database'] and isinstance(
-                        section_data, dict):
-                    for key, value in section_data.items():
-                        self.settings_manager.set_value(
-                            section, key, str(value))
+            # その他の設定（データベース以外）はまとめて設定し、保存は一度だけ行う
+            self.settings_manager.set_values({
+                (section, key): str(value)
+                for section, section_data in settings.items()
+                if section != 'database' and isinstance(section_data, dict)
+                for key, value in section_data.items()
+            })
 
-            logging.info("設定が正常に保存されました。")
+            _logger.info("設定が正常に保存されました。")
             # 統一通知システムで成功メッセージ表示
             self._show_success_message("設定を保存しました")
 
         except Exception as e:
-            logging.error(f"設定の保存中にエラーが発生: {e}")
+            _logger.error("設定の保存中にエラーが発生: %s", e)
             # 統一通知システムでエラー表示とダイアログ
             self._show_error_message("設定の保存でエラーが発生しました", str(e), show_dialog=True)
 
@@ -1663,20 +2260,20 @@ class AppController(QObject):
 
         存在しないデータベースの場合は作成確認ダイアログを表示
         """
-        logging.info(f"データベース接続テストを開始します: {db_settings.get('type')}")
+        _logger.info("データベース接続テストを開始します: %s", db_settings.get('type'))
 
         # show_create_dialog=True でダイアログ表示を有効化
         success, message = self.db_manager.test_connection(
             db_settings, show_create_dialog=True)
 
-        if hasattr(self.main_window, 'settings_view'):
-            self.main_window.settings_view.show_test_result(success, message)
+        if self._settings_view is not None:
+            self._settings_view.show_test_result(success, message)
 
     def load_and_apply_settings(self):
         """設定を読み込み、各コンポーネントに適用する"""
         settings = self.settings_manager.get_all()
-        if hasattr(self.main_window, 'settings_view'):
-            self.main_window.settings_view.set_current_settings(settings)
+        if self._settings_view is not None:
+            self._settings_view.set_current_settings(settings)
 
         # 必要に応じて他のマネージャーにも設定を適用
         self.db_manager.reconnect(settings.get('database'))
@@ -1690,52 +2287,73 @@ class AppController(QObject):
     def save_etl_rule(self, rule_name: str, rule_data: dict):
         """ETLルールを保存する"""
         self.settings_manager.save_etl_rule(rule_name, rule_data)
+        self._etl_rules_cache = None
+        self._active_rule_name = rule_name
+        self._active_rule = rule_data
         self.load_and_set_etl_rules()  # UIを更新
-        if hasattr(self.main_window, 'etl_setting_view'):
-            self.main_window.etl_setting_view.rule_combo.setCurrentText(
-                rule_name)
-        if hasattr(self.main_window, 'statusBar'):
-            self.main_window.statusBar().showMessage(
-                f"ETLルール '{rule_name}' を保存しました。", 3000)
+        if self._etl_setting_view is not None:
+            self._etl_setting_view.rule_combo.setCurrentText(rule_name)
+        self._set_status_bar_message(f"ETLルール '{rule_name}' を保存しました。", 3000)
 
     @Slot(str)
     def delete_etl_rule(self, rule_name: str):
         """ETLルールを削除する"""
         self.settings_manager.delete_etl_rule(rule_name)
+        self._etl_rules_cache = None
+        if rule_name == self._active_rule_name:
+            self._active_rule_name = None
+            self._active_rule = {}
         self.load_and_set_etl_rules()  # UIを更新
-        if hasattr(self.main_window, 'statusBar'):
-            self.main_window.statusBar().showMessage(
-                f"ETLルール '{rule_name}' を削除しました。", 3000)
+        self._set_status_bar_message(f"ETLルール '{rule_name}' を削除しました。", 3000)
 
     def load_and_set_etl_rules(self):
         """保存されているETLルールを読み込み、UIにセットする"""
-        rules = self.settings_manager.load_etl_rules()
-        if hasattr(self.main_window, 'etl_setting_view'):
-            self.main_window.etl_setting_view.set_rules(rules)
+        rules = self._get_etl_rules()
+        if self._etl_setting_view is not None:
+            self._etl_setting_view.set_rules(rules)
+
+    def _get_etl_rules(self) -> Dict[str, Any]:
+        """
+        ETLルールを取得する（キャッシュ付き）
+        無効化されるまでは前回デコードした結果を返す
+        """
+        if self._etl_rules_cache is None:
+            self._etl_rules_cache = self.settings_manager.load_etl_rules()
+        return self._etl_rules_cache
 
     @Slot(str)
     def on_etl_rule_selected(self, rule_name: str):
         """ETLルールが選択されたときに、ルール詳細をUIに反映する"""
         if rule_name and rule_name != "＜新規作成＞":
-            rules = self.settings_manager.load_etl_rules()
+            rules = self._get_etl_rules()
             rule_data = rules.get(rule_name)
-            if rule_data and hasattr(self.main_window, 'etl_setting_view'):
-                self.main_window.etl_setting_view.set_rule_data(rule_data)
+            self._active_rule_name = rule_name
+            self._active_rule = rule_data or {}
+            if rule_data and self._etl_setting_view is not None:
+                self._etl_setting_view.set_rule_data(rule_data)
+        else:
+            self._active_rule_name = None
+            self._active_rule = {}
 
     # === State Machine統合のためのデバッグ機能 ===
 
     def get_debug_info(self) -> dict:
-        """デバッグ情報を取得"""
-        return {
-            "current_state": self.state_name,
-            "can_start_processing": self._can_start_processing(),
-            "can_cancel_processing": self._can_cancel_processing(),
-            "is_idle": self._is_idle_state(),
-            "pipeline_running": self.etl_pipeline.is_running if hasattr(
-                self.etl_pipeline,
-                'is_running') else False,
-            "realtime_watching": self.is_watching_realtime,
-            "current_data_specs": self.current_data_specs}
+        """
+        デバッグ情報を取得
+
+        返す辞書はコントローラーが保持するものを更新して再利用するため、
+        保存や変更が必要な場合は呼び出し側で copy() すること
+        """
+        info = self._debug_info
+        info["current_state"] = self.state_name
+        info["can_start_processing"] = self._can_start_processing()
+        info["can_cancel_processing"] = self._can_cancel_processing()
+        info["is_idle"] = self._state_kind == StateKind.IDLE
+        info["pipeline_running"] = (self._etl_has_is_running
+                                    and self.etl_pipeline.is_running)
+        info["realtime_watching"] = self.is_watching_realtime
+        info["current_data_specs"] = self.current_data_specs
+        return info
 
     def _initialize_pipeline_coordinator(self) -> PipelineCoordinator:
         """
@@ -1744,6 +2362,8 @@ class AppController(QObject):
         Returns:
             PipelineCoordinator: 初期化されたコーディネーター
         """
+        from ..services.workers.pipeline_coordinator import PipelineCoordinator
+
         try:
             # パイプライン設定の取得
             pipeline_config = self._get_pipeline_configuration()
@@ -1759,11 +2379,11 @@ class AppController(QObject):
                 pipeline_config=pipeline_config
             )
 
-            logging.info("PipelineCoordinator initialized successfully")
+            _logger.info("PipelineCoordinator initialized successfully")
             return coordinator
 
         except Exception as e:
-            logging.error(f"Failed to initialize PipelineCoordinator: {e}")
+            _logger.error("Failed to initialize PipelineCoordinator: %s", e)
             # フォールバック: 基本設定でリトライ
             try:
                 coordinator = PipelineCoordinator(
@@ -1774,12 +2394,12 @@ class AppController(QObject):
                     progress_callback=self._on_worker_progress,
                     error_callback=self._on_worker_error
                 )
-                logging.warning(
+                _logger.warning(
                     "PipelineCoordinator initialized with fallback configuration")
                 return coordinator
             except Exception as fallback_error:
-                logging.critical(
-                    f"Critical: PipelineCoordinator initialization failed: {fallback_error}")
+                _logger.critical(
+                    "Critical: PipelineCoordinator initialization failed: %s", fallback_error)
                 raise
 
     def _get_pipeline_configuration(self) -> dict:
@@ -1789,35 +2409,32 @@ class AppController(QObject):
         Returns:
             dict: パイプライン設定
         """
+        if self._cached_pipeline_config is not None:
+            return self._cached_pipeline_config
+
         try:
             # Settings Managerから設定を取得
             config = self.settings_manager.get_all_settings()
 
             # パフォーマンス設定の抽出
             pipeline_config = {
-                'raw_queue_size': config.get(
-                    'pipeline_raw_queue_size', 1000), 'processed_queue_size': config.get(
-                    'pipeline_processed_queue_size', 500), 'etl_batch_size': config.get(
-                    'pipeline_etl_batch_size', 10), 'db_batch_size': config.get(
-                    'pipeline_db_batch_size', 100), 'db_commit_interval': config.get(
-                        'pipeline_db_commit_interval', 1000)}
-
-            logging.info(f"Pipeline configuration loaded: {pipeline_config}")
-            return pipeline_config
+                name: config.get(key, default)
+                for name, (key, default) in _PIPELINE_CONFIG_DEFAULTS.items()
+            }
+            _logger.info("Pipeline configuration loaded: %s", pipeline_config)
 
         except Exception as e:
-            logging.warning(f"Failed to load pipeline configuration: {e}")
+            _logger.warning("Failed to load pipeline configuration: %s", e)
             # デフォルト設定を返す
-            default_config = {
-                'raw_queue_size': 1000,
-                'processed_queue_size': 500,
-                'etl_batch_size': 10,
-                'db_batch_size': 100,
-                'db_commit_interval': 1000
+            pipeline_config = {
+                name: default
+                for name, (_key, default) in _PIPELINE_CONFIG_DEFAULTS.items()
             }
-            logging.info(
-                f"Using default pipeline configuration: {default_config}")
-            return default_config
+            _logger.info(
+                "Using default pipeline configuration: %s", pipeline_config)
+
+        self._cached_pipeline_config = pipeline_config
+        return pipeline_config
 
     def _on_worker_progress(self, progress: ProgressInfo) -> None:
         """
@@ -1831,17 +2448,18 @@ class AppController(QObject):
             if self._state:
                 self._state.handle_progress_update(progress)
 
-            # UI への進捗反映
+            # UI への進捗反映（実際の描画は _flush_ui で一定間隔にまとめて行う）
             self._update_ui_progress(progress)
 
             # 詳細ログ（デバッグレベル）
-            logging.debug(
-                f"Worker progress: {progress.worker_name} - {progress.percentage:.1f}% "
-                f"({progress.current_item}/{progress.total_items}) - {progress.message}"
-            )
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    "Worker progress: %s - %.1f%% (%s/%s) - %s",
+                    progress.worker_name, progress.percentage,
+                    progress.current_item, progress.total_items, progress.message)
 
-        except Exception as e:
-            logging.error(f"Error handling worker progress: {e}")
+        except (RuntimeError, AttributeError) as e:
+            _logger.error("Error handling worker progress: %s", e)
 
     def _on_worker_error(self, worker_name: str, error: Exception) -> None:
         """
@@ -1852,7 +2470,7 @@ class AppController(QObject):
             error: 発生したエラー
         """
         try:
-            logging.error(f"Worker error from {worker_name}: {error}")
+            _logger.error("Worker error from %s: %s", worker_name, error)
 
             # State Machine にエラーを通知
             if self._state:
@@ -1862,33 +2480,43 @@ class AppController(QObject):
             self._update_ui_error(worker_name, error)
 
         except Exception as e:
-            logging.critical(f"Critical error in worker error handler: {e}")
+            _logger.critical("Critical error in worker error handler: %s", e)
 
     def _update_ui_progress(self, progress: ProgressInfo) -> None:
         """
-        UIに進捗情報を反映
+        UIに反映する進捗情報を更新（描画は _flush_ui が行う）
 
         Args:
             progress: 進捗情報
         """
+        self._latest_progress = progress
+        if not self._ui_dirty:
+            self._ui_dirty = True
+            self._ui_flush_requested.emit()
+
+    @Slot()
+    def _flush_ui(self) -> None:
+        """最新の Worker 進捗をUIに反映（前回の反映以降に更新があった場合のみ）"""
+        if not self._ui_dirty:
+            self._ui_flush_timer.stop()
+            return
+        self._ui_dirty = False
+        progress = self._latest_progress
+
         try:
-            if self.main_window:
-                # Dashboard View の進捗更新
-                if hasattr(self.main_window, 'dashboard_view'):
-                    dashboard = self.main_window.dashboard_view
-                    if hasattr(dashboard, 'update_progress'):
-                        dashboard.update_progress(
-                            progress.percentage, progress.message)
-
-                # ステータスバーの更新
-                if hasattr(self.main_window, 'statusBar'):
-                    status_message = f"{
-                        progress.worker_name}: {
-                        progress.message}"
-                    self.main_window.statusBar().showMessage(status_message)
+            # Dashboard View の進捗更新
+            update_progress = self._dashboard_update_progress
+            if update_progress is not None:
+                update_progress(progress.percentage, progress.message)
 
-        except Exception as e:
-            logging.debug(f"UI progress update failed: {e}")
+            # ステータスバーの更新
+            show_message = self._status_show_message
+            if show_message is not None:
+                show_message(f"{progress.worker_name}: {progress.message}")
+
+        except (RuntimeError, AttributeError) as e:
+            # 破棄済みウィジェット（C++側削除済み）への呼び出しなど
+            _logger.debug("UI progress update failed: %s", e)
 
     def _update_ui_error(self, worker_name: str, error: Exception) -> None:
         """
@@ -1898,25 +2526,25 @@ class AppController(QObject):
             worker_name: エラーが発生したワーカー名
             error: 発生したエラー
         """
-        try:
-            if self.main_window:
-                # エラーダイアログまたは通知の表示
-                error_message = f"ワーカー '{worker_name}' でエラーが発生しました:\n{
-                    str(error)}"
+        show_message = self._status_show_message
+        show_error = self._dashboard_show_error
+        if show_message is None and show_error is None:
+            return
+
+        # エラーダイアログまたは通知の表示
+        error_message = f"ワーカー '{worker_name}' でエラーが発生しました:\n{error}"
 
-                # ステータスバーにエラー表示
-                if hasattr(self.main_window, 'statusBar'):
-                    self.main_window.statusBar().showMessage(
-                        f"エラー: {error_message}")
+        try:
+            # ステータスバーにエラー表示
+            if show_message is not None:
+                show_message(f"エラー: {error_message}")
 
-                # Dashboard View にエラー表示
-                if hasattr(self.main_window, 'dashboard_view'):
-                    dashboard = self.main_window.dashboard_view
-                    if hasattr(dashboard, 'show_error'):
-                        dashboard.show_error(error_message)
+            # Dashboard View にエラー表示
+            if show_error is not None:
+                show_error(error_message)
 
-        except Exception as e:
-            logging.debug(f"UI error update failed: {e}")
+        except (RuntimeError, AttributeError) as e:
+            _logger.debug("UI error update failed: %s", e)
 
     def start_high_performance_pipeline(
             self,
@@ -1944,11 +2572,11 @@ class AppController(QObject):
             pipeline_state = PipelineProcessingState(data_params, etl_rules)
             self.transition_to(pipeline_state)
 
-            logging.info("High-performance pipeline started successfully")
+            _logger.info("High-performance pipeline started successfully")
             return True
 
         except Exception as e:
-            logging.error(f"Failed to start high-performance pipeline: {e}")
+            _logger.error("Failed to start high-performance pipeline: %s", e)
             return False
 
     def _get_default_etl_rules(self) -> dict:
@@ -1956,14 +2584,9 @@ class AppController(QObject):
         デフォルトETLルールを取得
 
         Returns:
-            dict: ETLルール
+            dict: ETLルール（呼び出しごとの新しい dict）
         """
-        return {
-            'data_validation': True,
-            'duplicate_check': True,
-            'auto_commit': True,
-            'batch_processing': True
-        }
+        return dict(_DEFAULT_ETL_RULES)
 
     def get_pipeline_performance_stats(self) -> dict:
         """
@@ -1976,10 +2599,10 @@ class AppController(QObject):
             if self.pipeline_coordinator:
                 return self.pipeline_coordinator.get_pipeline_stats()
             else:
-                logging.warning("PipelineCoordinator not available for stats")
+                _logger.warning("PipelineCoordinator not available for stats")
                 return {}
         except Exception as e:
-            logging.error(f"Failed to get pipeline stats: {e}")
+            _logger.error("Failed to get pipeline stats: %s", e)
             return {}
 
     def is_high_performance_mode(self) -> bool:
@@ -1989,78 +2612,76 @@ class AppController(QObject):
         Returns:
             bool: 高性能モードの場合 True
         """
-        try:
-            if self._state:
-                return "PipelineProcessing" in self._state.name
-            return False
-        except Exception:
-            return False
+        return self._state_kind == StateKind.PIPELINE_PROCESSING
 
+    @classmethod
+    def _get_com_modules(cls):
+        """win32com.client と pythoncom を初回のみインポートして返す"""
+        if cls._pythoncom is None:
+            import win32com.client
+            import pythoncom
+            cls._win32com_client = win32com.client
+            cls._pythoncom = pythoncom
+        return cls._win32com_client, cls._pythoncom
+
+    @Slot()
     def open_jvlink_settings_dialog(self):
         """JV-Link設定ダイアログを開く"""
-        logging.info("JV-Link公式設定ダイアログを開きます。")
+        _logger.info("JV-Link公式設定ダイアログを開きます。")
 
         try:
             # JV-Linkマネージャーが利用可能かチェック
-            if not hasattr(self.jvlink_manager,
-                           'jvlink') or self.jvlink_manager.jvlink is None:
+            jvlink = getattr(self.jvlink_manager, 'jvlink', None)
+            if jvlink is None:
                 # JV-Linkが初期化されていない場合、COMオブジェクトのみ作成
                 try:
-                    import win32com.client
-                    import pythoncom
-
-                    # 一時的にCOMオブジェクトを作成
-                    pythoncom.CoInitialize()
-                    jvlink_temp = win32com.client.Dispatch("JVDTLab.JVLink")
+                    # COMオブジェクトは初回のみ作成し、以降は再利用する
+                    if self._jvlink_com_cache is None:
+                        win32com_client, pythoncom = self._get_com_modules()
+                        if not self._com_initialized:
+                            pythoncom.CoInitialize()
+                            self._com_initialized = True
+                        self._jvlink_com_cache = win32com_client.Dispatch(
+                            "JVDTLab.JVLink")
 
                     # JV-Link設定ダイアログを開く
-                    result = jvlink_temp.JVSetUIProperties()
-
-                    # リソース解放
-                    jvlink_temp = None
-                    pythoncom.CoUninitialize()
+                    result = self._jvlink_com_cache.JVSetUIProperties()
 
                 except Exception as com_error:
-                    logging.error(f"JV-Link COMオブジェクトの作成に失敗: {com_error}")
+                    _logger.error("JV-Link COMオブジェクトの作成に失敗: %s", com_error)
                     error_msg = ("JV-Link設定ダイアログを開くことができませんでした。\n\n"
                                  "JV-Linkが正しくインストールされているか確認してください。\n"
                                  f"エラー詳細: {com_error}")
-                    if hasattr(self.main_window, 'settings_view'):
-                        self.main_window.settings_view.show_jvlink_dialog_result(
-                            False, error_msg)
+                    self._show_jvlink_dialog_result(False, error_msg)
                     return
             else:
                 # JV-Linkが既に初期化されている場合
-                result = self.jvlink_manager.jvlink.JVSetUIProperties()
-
-            # 結果の判定
-            if result == 0:
-                success_msg = ("JV-Link設定が正常に完了しました。\n\n"
-                               "設定はWindowsレジストリに保存され、"
-                               "次回のデータ取得時に自動的に使用されます。")
-                logging.info("JV-Link設定ダイアログが正常に完了しました。")
-                if hasattr(self.main_window, 'settings_view'):
-                    self.main_window.settings_view.show_jvlink_dialog_result(
-                        True, success_msg)
-            elif result == -100:
-                cancel_msg = "JV-Link設定がキャンセルされました。"
-                logging.info("JV-Link設定ダイアログがキャンセルされました。")
-                if hasattr(self.main_window, 'settings_view'):
-                    self.main_window.settings_view.show_jvlink_dialog_result(
-                        False, cancel_msg)
-            else:
-                error_msg = f"JV-Link設定でエラーが発生しました。エラーコード: {result}"
-                logging.error(f"JV-Link設定ダイアログでエラー: {result}")
-                if hasattr(self.main_window, 'settings_view'):
-                    self.main_window.settings_view.show_jvlink_dialog_result(
-                        False, error_msg)
+                result = jvlink.JVSetUIProperties()
 
         except Exception as e:
-            logging.error(f"JV-Link設定ダイアログの開催中にエラー: {e}")
-            error_msg = f"予期しないエラーが発生しました: {e}"
-            if hasattr(self.main_window, 'settings_view'):
-                self.main_window.settings_view.show_jvlink_dialog_result(
-                    False, error_msg)
+            _logger.error("JV-Link設定ダイアログの開催中にエラー: %s", e)
+            self._show_jvlink_dialog_result(False, f"予期しないエラーが発生しました: {e}")
+            return
+
+        # 結果の判定
+        if result == 0:
+            _logger.info("JV-Link設定ダイアログが正常に完了しました。")
+            self._show_jvlink_dialog_result(
+                True, "JV-Link設定が正常に完了しました。\n\n"
+                      "設定はWindowsレジストリに保存され、"
+                      "次回のデータ取得時に自動的に使用されます。")
+        elif result == -100:
+            _logger.info("JV-Link設定ダイアログがキャンセルされました。")
+            self._show_jvlink_dialog_result(False, "JV-Link設定がキャンセルされました。")
+        else:
+            _logger.error("JV-Link設定ダイアログでエラー: %s", result)
+            self._show_jvlink_dialog_result(
+                False, f"JV-Link設定でエラーが発生しました。エラーコード: {result}")
+
+    def _show_jvlink_dialog_result(self, success: bool, message: str):
+        """JV-Link設定ダイアログの結果を設定画面に表示（設定画面が無い場合は何もしない）"""
+        if self._settings_view is not None:
+            self._settings_view.show_jvlink_dialog_result(success, message)
 
     # === 統合データ取得フレームワーク（報告書フェーズ1.2実装） ===
     
@@ -2076,146 +2697,96 @@ class AppController(QObject):
             selected_data_types: 取得するデータ種別のリスト
             
         Returns:
-            bool: 取得開始の成功/失敗
+            bool: 取得要求を受け付けた場合 True（開始の成否はログ・ステータスで通知）
         """
+        acquisition = _ACQUISITION_MODES.get(mode)
+
         # デフォルトデータ種別の設定
         if selected_data_types is None:
-            if mode == 'setup':
-                selected_data_types = ["RACE", "SE", "HR", "UM", "KS"]  # セットアップ推奨
-            elif mode == 'accumulated':
-                selected_data_types = ["RACE", "SE", "HR"]  # 差分更新推奨
-            elif mode == 'realtime':
-                selected_data_types = ["RACE", "SE"]  # 当該週データ
-            else:
+            selected_data_types = _DEFAULT_DATA_TYPES.get(mode)
+            if selected_data_types is None:
                 raise ValueError(f"不正なデータ取得モード: {mode}")
-        
-        # JV-Linkパラメータのマッピング（報告書表1に基づく）
-        if mode == 'setup':
-            return self._execute_setup_acquisition(from_date, selected_data_types)
-        elif mode == 'accumulated':
-            return self._execute_accumulated_acquisition(selected_data_types)
-        elif mode == 'realtime':
-            return self._execute_realtime_acquisition(selected_data_types)
-        else:
+
+        if acquisition is None:
             error_msg = f"サポートされていないデータ取得モード: {mode}"
             self.emit_log("ERROR", error_msg)
             self._show_status_message(error_msg, 5000)
             return False
-    
-    def _execute_setup_acquisition(self, from_date: str, selected_data_types: list) -> bool:
-        """
-        セットアップデータ取得の実行（JVOpen option=4）
-        
-        Args:
-            from_date: 取得開始日（YYYYMMDD形式）
-            selected_data_types: データ種別リスト
-        """
-        try:
-            # JV-Link初期化チェック
-            if not self.jvlink_manager.is_initialized():
-                if not self.connect_jvlink_manually():
-                    return False
 
-            # データ取得中でないことを確認
-            if not self.jvlink_manager.can_start_data_operation():
-                error_msg = f"データ取得を開始できません。現在の状態: {self.jvlink_manager.current_state.value}"
-                self.emit_log("ERROR", error_msg)
-                self._show_status_message(error_msg, 5000)
-                return False
+        if len(self._acquisition_cmd_queue) >= _ACQUISITION_QUEUE_MAXLEN:
+            self.emit_log("WARNING", "データ取得要求が多すぎるため受け付けできませんでした。")
+            return False
 
-            self.emit_log("INFO", f"セットアップデータ取得開始: 開始日={from_date}, データ種別={selected_data_types}")
-            self._show_status_message("セットアップデータ取得を開始しています...", 0)
+        # 呼び出し元（UIスロット）へすぐ制御を返し、接続と取得開始は次のイベントループで行う
+        self._acquisition_cmd_queue.append(
+            (acquisition, from_date, selected_data_types))
+        if not self._acquisition_timer.isActive():
+            self._acquisition_timer.start()
+        return True
 
-            # fromtimeパラメータの設定（報告書仕様に従い）
-            formatted_date = f"{from_date}000000" if from_date else "19860101000000"
-            
-            self.jvlink_manager.get_data_async(
-                option=4,  # セットアップデータ（ダイアログ無し）
-                from_date=formatted_date,
-                data_spec_list=selected_data_types
-            )
-            return True
+    @Slot()
+    def _process_acquisition_queue(self):
+        """待ち行列のデータ取得コマンドを1件実行（残りがあれば次のイベントループへ）"""
+        if not self._acquisition_cmd_queue:
+            return
+        acquisition, from_date, selected_data_types = self._acquisition_cmd_queue.popleft()
+        self._execute_acquisition(acquisition, from_date, selected_data_types)
+        if self._acquisition_cmd_queue:
+            self._acquisition_timer.start()
 
-        except Exception as e:
-            error_msg = f"セットアップデータ取得開始エラー: {e}"
-            self.emit_log("ERROR", error_msg)
-            self._show_status_message(error_msg, 5000)
-            return False
-    
-    def _execute_accumulated_acquisition(self, selected_data_types: list) -> bool:
+    def _assert_ready_to_acquire(self) -> Tuple[bool, Optional[str]]:
         """
-        蓄積系（差分）データ取得の実行（JVOpen option=1）
-        
-        Args:
-            selected_data_types: データ種別リスト
+        データ取得を開始できるかを確認（未接続なら接続を試みる）
+
+        Returns:
+            Tuple[bool, Optional[str]]: (開始可能か, エラーメッセージ)
+            接続失敗時は connect_jvlink_manually 側で通知済みのためメッセージは None
         """
-        try:
-            # JV-Link初期化チェック
-            if not self.jvlink_manager.is_initialized():
-                if not self.connect_jvlink_manually():
-                    return False
+        jvlink_manager = self.jvlink_manager
 
-            # データ取得中でないことを確認
-            if not self.jvlink_manager.can_start_data_operation():
-                error_msg = f"データ取得を開始できません。現在の状態: {self.jvlink_manager.current_state.value}"
-                self.emit_log("ERROR", error_msg)
-                self._show_status_message(error_msg, 5000)
-                return False
+        # JV-Link初期化チェック
+        if not jvlink_manager.is_initialized() and not self.connect_jvlink_manually():
+            return False, None
 
-            self.emit_log("INFO", f"蓄積系データ取得開始: データ種別={selected_data_types}")
-            self._show_status_message("蓄積系データ取得を開始しています...", 0)
+        # データ取得中でないことを確認
+        if not jvlink_manager.can_start_data_operation():
+            state = getattr(jvlink_manager, 'current_state', None)
+            state_name = getattr(state, 'value', state)
+            return False, f"データ取得を開始できません。現在の状態: {state_name}"
 
-            self.jvlink_manager.get_data_async(
-                option=1,  # 通常データ（差分更新）
-                data_spec_list=selected_data_types
-            )
-            return True
+        return True, None
 
-        except Exception as e:
-            error_msg = f"蓄積系データ取得開始エラー: {e}"
-            self.emit_log("ERROR", error_msg)
-            self._show_status_message(error_msg, 5000)
-            return False
-    
-    def _execute_realtime_acquisition(self, selected_data_types: list) -> bool:
+    def _execute_acquisition(self, acquisition: tuple, from_date: str, selected_data_types: list) -> bool:
         """
-        速報系データ取得の実行（JVOpen option=2）
+        データ取得の実行（JVOpen の option はモードごとに _ACQUISITION_MODES で定義）
         
         Args:
+            acquisition: _ACQUISITION_MODES の要素 (option, 表示名, fromtime算出関数)
+            from_date: 取得開始日（YYYYMMDD形式、setupモードで使用）
             selected_data_types: データ種別リスト
         """
+        option, label, fromtime_fn = acquisition
         try:
-            # JV-Link初期化チェック
-            if not self.jvlink_manager.is_initialized():
-                if not self.connect_jvlink_manually():
-                    return False
-
-            # データ取得中でないことを確認
-            if not self.jvlink_manager.can_start_data_operation():
-                error_msg = f"データ取得を開始できません。現在の状態: {self.jvlink_manager.current_state.value}"
-                self.emit_log("ERROR", error_msg)
-                self._show_status_message(error_msg, 5000)
+            ready, error_msg = self._assert_ready_to_acquire()
+            if not ready:
+                if error_msg:
+                    self.emit_log("ERROR", error_msg)
+                    self._show_status_message(error_msg, 5000)
                 return False
 
-            self.emit_log("INFO", f"速報系データ取得開始: データ種別={selected_data_types}")
-            self._show_status_message("速報系データ取得を開始しています...", 0)
-
-            # 当該週の開始日時を計算（日曜日開始）
-            from datetime import datetime, timedelta
-            today = datetime.now()
-            days_since_sunday = today.weekday() + 1  # 月曜日=0なので+1で日曜日基準に
-            sunday = today - timedelta(days=days_since_sunday)
-            week_start = sunday.strftime("%Y%m%d") + "000000"
+            kwargs = {'option': option, 'data_spec_list': selected_data_types}
+            if fromtime_fn is not None:
+                kwargs['from_date'] = fromtime_fn(from_date)
+                self.emit_log("INFO", f"{label}データ取得開始: 開始日時={kwargs['from_date']}, データ種別={selected_data_types}")
+            else:
+                self.emit_log("INFO", f"{label}データ取得開始: データ種別={selected_data_types}")
+            self._show_status_message(f"{label}データ取得を開始しています...", 0)
 
-            self.jvlink_manager.get_data_async(
-                option=2,  # 今週データ
-                from_date=week_start,
-                data_spec_list=selected_data_types
-            )
+            self.jvlink_manager.get_data_async(**kwargs)
             return True
 
         except Exception as e:
-            error_msg = f"速報系データ取得開始エラー: {e}"
+            error_msg = f"{label}データ取得開始エラー: {e}"
             self.emit_log("ERROR", error_msg)
             self._show_status_message(error_msg, 5000)
             return False
@@ -2231,8 +2802,6 @@ class AppController(QObject):
             message: エラーメッセージの内容
         """
         try:
-            from PySide6.QtWidgets import QMessageBox
-            
             if self.main_window:
                 QMessageBox.critical(self.main_window, title, message)
             else:
@@ -2255,8 +2824,8 @@ class AppController(QObject):
             active_profile = self.settings_manager.get_active_database_profile()
 
             # ダッシュボードにプロファイル一覧を設定
-            if hasattr(self.main_window, 'dashboard_view'):
-                self.main_window.dashboard_view.set_database_profiles(profiles, active_profile)
+            if self._dashboard is not None:
+                self._dashboard.set_database_profiles(profiles, active_profile)
 
             self.emit_log("INFO", f"データベースプロファイル初期化完了: {len(profiles)}個、アクティブ: {active_profile}")
 
@@ -2367,8 +2936,8 @@ class AppController(QObject):
             profiles = self.settings_manager.get_database_profiles()
             active_profile = self.settings_manager.get_active_database_profile()
 
-            if hasattr(self.main_window, 'dashboard_view'):
-                self.main_window.dashboard_view.set_database_profiles(profiles, active_profile)
+            if self._dashboard is not None:
+                self._dashboard.set_database_profiles(profiles, active_profile)
 
         except Exception as e:
             self.emit_log("ERROR", f"データベースプロファイル一覧更新エラー: {e}")
@@ -2411,8 +2980,7 @@ class AppController(QObject):
             timeout: 表示時間（ミリ秒）
         """
         # 旧来のステータスバー更新も維持（互換性のため）
-        if hasattr(self.main_window, 'statusBar'):
-            self.main_window.statusBar().showMessage(message, timeout)
+        self._set_status_bar_message(message, timeout)
         
         # 統一通知システムでも表示
         self.notification_manager.show_info(message, timeout=timeout)
@@ -2426,8 +2994,7 @@ class AppController(QObject):
             timeout: 表示時間（ミリ秒）
         """
         # 旧来のステータスバー更新も維持（互換性のため）
-        if hasattr(self.main_window, 'statusBar'):
-            self.main_window.statusBar().showMessage(message, timeout)
+        self._set_status_bar_message(message, timeout)
         
         # 統一通知システムでも表示
         self.notification_manager.show_warning(message, timeout=timeout)
@@ -2443,14 +3010,12 @@ class AppController(QObject):
             show_dialog: ダイアログ表示を行うかどうか
         """
         # 旧来のステータスバー更新も維持（互換性のため）
-        if hasattr(self.main_window, 'statusBar'):
-            self.main_window.statusBar().showMessage(message, timeout)
+        self._set_status_bar_message(message, timeout)
         
         # 統一通知システムでも表示
         self.notification_manager.show_error(message, details, timeout=timeout)
 
         if show_dialog:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(self.main_window, "エラー", message)
 
     def _show_info_message(self, message: str, details: str = "", timeout: int = 4000):
@@ -11,20 +11,61 @@ from .controllers.app_controller import AppController
 from .views.main_window import MainWindow
 from qfluentwidgets import FluentTranslator, FluentIcon
 import qfluentwidgets
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QFontDatabase
 from PySide6.QtCore import Qt, QTranslator, QLocale
 from PySide6.QtWidgets import QApplication, QMessageBox
 import sys
 import os
+import atexit
 import logging
 import types
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
+
+_logger = logging.getLogger(__name__)
+
+# 起動直後のログを書き出すバックグラウンドリスナー（setup_unicode_logging で開始）
+_log_listener = None
+
+
+def _stop_log_listener():
+    """ログリスナーを停止し、キューに残ったレコードを書き出す"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+# プロセス内で一度だけ行う Qt の初期設定（高DPI属性・モンキーパッチ）が済んだか
+_QT_BOOTSTRAPPED = False
+
+# 解決済みの日本語フォント（フォントデータベースの照会は初回のみ）
+_JP_FONT = None
+
+# UIフォントの候補（優先順。いずれも無ければ最後の候補を指定する）
+_JP_FONT_CANDIDATES = ("Yu Gothic UI", "Meiryo UI", "MS UI Gothic")
+
+if sys.platform == 'win32':
+    import ctypes
+else:
+    ctypes = None
+
+# 互換性シム / Unicode環境設定を実施済みか（reload 時も値を引き継ぎ、再実行を防ぐ）
+_COMPAT_DONE = globals().get('_COMPAT_DONE', False)
+_UNICODE_ENV_DONE = globals().get('_UNICODE_ENV_DONE', False)
 
 # PySide6/PyQt5 互換性シム (最優先で実行)
 
 
 def setup_qt_compatibility():
     """PySide6とPyQt5の互換性を確保"""
+    global _COMPAT_DONE
+    if _COMPAT_DONE:
+        return
+
     try:
         import PySide6.QtCore as _QtCore
         import PySide6.QtWidgets as _QtWidgets
@@ -40,11 +81,16 @@ def setup_qt_compatibility():
         _pyqt5.QtWidgets = _QtWidgets
         _pyqt5.QtGui = _QtGui
 
-        # sys.modules に登録
-        sys.modules.setdefault("PyQt5", _pyqt5)
-        sys.modules.setdefault("PyQt5.QtCore", _QtCore)
-        sys.modules.setdefault("PyQt5.QtWidgets", _QtWidgets)
-        sys.modules.setdefault("PyQt5.QtGui", _QtGui)
+        # sys.modules に登録（既に登録済みのモジュールは置き換えない）
+        aliases = {
+            "PyQt5": _pyqt5,
+            "PyQt5.QtCore": _QtCore,
+            "PyQt5.QtWidgets": _QtWidgets,
+            "PyQt5.QtGui": _QtGui,
+        }
+        sys.modules.update({name: module for name, module in aliases.items()
+                            if name not in sys.modules})
+        _COMPAT_DONE = True
 
         print("PyQt5/PySide6 互換性シム設定完了")
 
@@ -63,18 +109,22 @@ os.environ['QT_AUTO_SCREEN_SCALE_FACTOR'] = '1'
 
 def setup_qt_unicode_environment():
     """Qt アプリケーション用のUnicode環境設定"""
+    global _UNICODE_ENV_DONE
+    if _UNICODE_ENV_DONE:
+        return
+
     try:
         # Qt関連の環境変数を設定
         os.environ['QT_SCALE_FACTOR'] = '1'
         os.environ['QT_ENABLE_HIGHDPI_SCALING'] = '1'
 
         # Windows Console UTF-8対応
-        if sys.platform == 'win32':
+        if ctypes is not None:
             try:
-                import ctypes
                 ctypes.windll.kernel32.SetConsoleOutputCP(65001)  # UTF-8
             except Exception:
                 pass
+        _UNICODE_ENV_DONE = True
 
     except Exception as e:
         print(f"Qt Unicode環境設定エラー: {e}")
@@ -99,13 +149,28 @@ def setup_unicode_logging():
         log_dir.mkdir(exist_ok=True)
         log_file = log_dir / "jra_data_collector.log"
 
+        # run.pyw経由の起動などで既にルートロガーが設定済みなら何もしない
+        if logging.getLogger().handlers:
+            return
+
+        # ファイルは最初の書き込み時に開き、書き込み自体はリスナースレッドで行う
+        formatter = logging.Formatter(log_format)
+        file_handler = logging.FileHandler(
+            str(log_file), encoding='utf-8', delay=True)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        file_handler.setFormatter(formatter)
+        stream_handler.setFormatter(formatter)
+
+        global _log_listener
+        _stop_log_listener()
+        log_queue = SimpleQueue()
+        _log_listener = QueueListener(log_queue, file_handler, stream_handler)
+        _log_listener.start()
+
         logging.basicConfig(
             level=logging.INFO,
-            format=log_format,
-            handlers=[
-                logging.FileHandler(str(log_file), encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ]
+            format='%(message)s',  # 最終的な書式はリスナー側のハンドラーで適用
+            handlers=[QueueHandler(log_queue)]
         )
 
         print(f"ログファイル設定: {log_file}")
@@ -138,7 +203,7 @@ def handle_unicode_exception(exc_type, exc_value, exc_traceback):
         print(f"詳細なエラー情報:\n{error_msg}")
 
         # ログにも記録
-        logging.error(f"Unicode decode error: {error_msg}")
+        _logger.error("Unicode decode error: %s", error_msg)
 
     elif isinstance(exc_value, UnicodeEncodeError):
         print("=" * 60)
@@ -148,7 +213,7 @@ def handle_unicode_exception(exc_type, exc_value, exc_traceback):
         print(f"詳細なエラー情報:\n{error_msg}")
 
         # ログにも記録
-        logging.error(f"Unicode encode error: {error_msg}")
+        _logger.error("Unicode encode error: %s", error_msg)
 
     else:
         # その他のエラーは標準のハンドラーに任せる
@@ -162,7 +227,7 @@ def launch_gui():
     run.pyから呼び出されることを想定したGUI起動のエントリーポイント
     """
     try:
-        logging.info("launch_gui()関数を開始します")
+        _logger.info("launch_gui()関数を開始します")
         
         # グローバル例外ハンドラーを設定
         sys.excepthook = handle_unicode_exception
@@ -170,37 +235,42 @@ def launch_gui():
         # Unicode対応ログ設定
         setup_unicode_logging()
 
-        logging.info(
+        _logger.info(
             "============================================================")
-        logging.info("JRA-Data Collector GUIアプリケーションを開始")
-        logging.info(f"Python バージョン: {sys.version}")
-        logging.info(f"作業ディレクトリ: {Path.cwd()}")
-        logging.info(f"ファイルシステムエンコーディング: {sys.getfilesystemencoding()}")
-        logging.info(f"引数: {sys.argv}")
-        logging.info(
+        _logger.info("JRA-Data Collector GUIアプリケーションを開始")
+        _logger.info("Python バージョン: %s", sys.version)
+        _logger.info("作業ディレクトリ: %s", Path.cwd())
+        _logger.info("ファイルシステムエンコーディング: %s", sys.getfilesystemencoding())
+        _logger.info("引数: %s", sys.argv)
+        _logger.info(
             "============================================================")
 
-        # アプリケーション設定
-        logging.info("QApplicationの高DPI設定を構成します")
-        QApplication.setHighDpiScaleFactorRoundingPolicy(
-            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
-        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
-        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+        global _QT_BOOTSTRAPPED, _JP_FONT
 
-        logging.info("QApplicationインスタンスを作成します")
+        # アプリケーション設定
+        if not _QT_BOOTSTRAPPED:
+            _logger.info("QApplicationの高DPI設定を構成します")
+            QApplication.setHighDpiScaleFactorRoundingPolicy(
+                Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+            QApplication.setAttribute(Qt.AA_EnableHighDpiScaling)
+            QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps)
+
+        _logger.info("QApplicationインスタンスを作成します")
         app = QApplication(sys.argv)
-        logging.info("QApplicationインスタンスの作成が完了しました")
+        _logger.info("QApplicationインスタンスの作成が完了しました")
 
         # Unicode対応フォント設定
         try:
-            font = QFont("Yu Gothic UI", 9)  # 日本語対応フォント
-            if not font.exactMatch():
-                font = QFont("Meiryo UI", 9)  # フォールバック
-            if not font.exactMatch():
-                font = QFont("MS UI Gothic", 9)  # さらなるフォールバック
-            app.setFont(font)
+            if _JP_FONT is None:
+                # インストール済みフォントを一度だけ照会し、候補の先頭から選ぶ
+                installed = set(QFontDatabase.families())
+                family = next(
+                    (name for name in _JP_FONT_CANDIDATES if name in installed),
+                    _JP_FONT_CANDIDATES[-1])
+                _JP_FONT = QFont(family, 9)
+            app.setFont(_JP_FONT)
         except Exception as e:
-            logging.warning(f"フォント設定エラー: {e}")
+            _logger.warning("フォント設定エラー: %s", e)
 
         # 翻訳設定
         try:
@@ -208,16 +278,18 @@ def launch_gui():
             translator = FluentTranslator(QLocale(QLocale.Language.Japanese, QLocale.Country.Japan))
             app.installTranslator(translator)
         except Exception as e:
-            logging.warning(f"翻訳設定エラー: {e}")
+            _logger.warning("翻訳設定エラー: %s", e)
             # フォールバック: 翻訳設定をスキップして続行
-            logging.info("翻訳設定をスキップして続行します")
+            _logger.info("翻訳設定をスキップして続行します")
 
         # モンキーパッチ適用
-        try:
-            patch_qfluentwidgets()
-            logging.info("QFluent モンキーパッチ適用完了")
-        except Exception as e:
-            logging.warning(f"モンキーパッチ適用エラー: {e}")
+        if not _QT_BOOTSTRAPPED:
+            try:
+                patch_qfluentwidgets()
+                _logger.info("QFluent モンキーパッチ適用完了")
+            except Exception as e:
+                _logger.warning("モンキーパッチ適用エラー: %s", e)
+            _QT_BOOTSTRAPPED = True
 
         # メインウィンドウとコントローラー初期化
         main_win = MainWindow()
@@ -230,22 +302,22 @@ def launch_gui():
             main_win.initialize_views()
             controller.initialize_app()
 
-            logging.info("アプリケーション初期化完了")
+            _logger.info("アプリケーション初期化完了")
 
             # メインウィンドウを表示
-            logging.info("メインウィンドウを表示します")
+            _logger.info("メインウィンドウを表示します")
             main_win.show()
 
             # アプリケーション実行（メインイベントループ開始）
-            logging.info("🎯 QtアプリケーションのメインループCapp.exec())を開始します")
+            _logger.info("🎯 QtアプリケーションのメインループCapp.exec())を開始します")
             exit_code = app.exec()
-            logging.info(f"Qtアプリケーションが終了しました。終了コード: {exit_code}")
+            _logger.info("Qtアプリケーションが終了しました。終了コード: %s", exit_code)
             
             return exit_code
 
         except UnicodeDecodeError as e:
             error_msg = f"アプリケーション初期化時のUnicodeエラー: {e}"
-            logging.error(error_msg)
+            _logger.error(error_msg)
 
             # ユーザーにわかりやすいエラーメッセージを表示
             QMessageBox.critical(
@@ -260,7 +332,7 @@ def launch_gui():
             return 1
 
         except Exception as e:
-            logging.error(f"アプリケーション初期化エラー: {e}")
+            _logger.error("アプリケーション初期化エラー: %s", e)
 
             QMessageBox.critical(
                 None,
@@ -271,7 +343,7 @@ def launch_gui():
 
     except Exception as e:
         error_msg = f"GUIアプリケーション起動時の致命的エラー: {e}"
-        logging.exception(error_msg)  # スタックトレースも含めてログに記録
+        _logger.exception(error_msg)  # スタックトレースも含めてログに記録
         print(f"❌ {error_msg}")
         
         # 可能であればエラーダイアログも表示
@@ -284,7 +356,7 @@ def launch_gui():
         except ImportError:
             print("GUI環境でないため、エラーダイアログを表示できません")
         except Exception as dialog_error:
-            logging.warning(f"エラーダイアログの表示に失敗: {dialog_error}")
+            _logger.warning("エラーダイアログの表示に失敗: %s", dialog_error)
         
         return 1
 
@@ -1,28 +1,343 @@
 import os
+import re
+import atexit
 import logging
-import pandas as pd
-from typing import Dict, List, Any, Optional
-from sqlalchemy import create_engine, inspect, text
-from sqlalchemy.orm import sessionmaker, declarative_base
+import socket
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, List, Any, Mapping, NamedTuple, Optional
+from sqlalchemy import (String, bindparam, cast, column, create_engine, event, func, inspect,
+                        literal, null, select, table, text, union_all)
+from sqlalchemy.engine import URL
 from sqlalchemy.exc import OperationalError, IntegrityError
 
 from ..services.workers.signals import LoggerMixin
 from ..exceptions import DatabaseError, DatabaseConnectionError, DatabaseIntegrityError
 
-# 修正点3: データベース固有のエラーを捕捉するためにインポート
-try:
-    import psycopg2
-    PSYCOPG2_AVAILABLE = True
-except ImportError:
-    psycopg2 = None
-    PSYCOPG2_AVAILABLE = False
+_logger = logging.getLogger(__name__)
 
-try:
-    import mysql.connector
-    MYSQL_CONNECTOR_AVAILABLE = True
-except ImportError:
-    mysql = None
-    MYSQL_CONNECTOR_AVAILABLE = False
+_IS_WINDOWS = sys.platform == 'win32'
+
+# pandas / DBドライバー / sqlalchemy.orm は使用する箇所で遅延インポートする
+# （SQLiteのみ・オフライン起動時に読み込みコストを払わないため）
+if TYPE_CHECKING:
+    import pandas as pd
+
+# 「データベースが存在しない」ことを示すエラーコード
+_MYSQL_ER_BAD_DB_ERROR = 1049  # MySQL: Unknown database
+_PG_INVALID_CATALOG_NAME = '3D000'  # PostgreSQL: invalid_catalog_name
+# エラーコードを持たない接続時エラー（libpq）用のメッセージパターン
+_MISSING_DATABASE_PATTERN = re.compile(r'database ".*" does not exist')
+
+
+def _is_missing_database_error(error: Exception) -> bool:
+    """
+    接続エラーが「データベースが存在しない」ことによるものかを判定する
+
+    ドライバーのエラーコードで判定し、コードを持たない場合
+    （libpq の接続時エラーなど）のみメッセージで判定する。
+    """
+    orig = getattr(error, 'orig', error)
+    args = getattr(orig, 'args', ())
+    if args and isinstance(args[0], int):
+        # pymysql: args = (errno, message)
+        return args[0] == _MYSQL_ER_BAD_DB_ERROR
+    pgcode = getattr(orig, 'pgcode', None)
+    if pgcode is not None:
+        return pgcode == _PG_INVALID_CATALOG_NAME
+    return _MISSING_DATABASE_PATTERN.search(str(orig)) is not None
+
+
+# SQLAlchemyのコンパイル済みSQLキャッシュのサイズ（既定は500）
+# ETLのUPSERTはテーブル毎に文が異なるため、既定値では溢れやすい
+_QUERY_CACHE_SIZE = 1200
+
+# MySQL/PostgreSQLのコネクションプール既定値（設定の[Database]セクションで上書き可）
+_POOL_DEFAULTS = {
+    'pool_size': 20,
+    'max_overflow': 40,
+    'pool_timeout': 30,
+    'pool_recycle': 3600,
+}
+
+
+def _pool_options(db_config: dict) -> Dict[str, Any]:
+    """db_configからcreate_engineに渡すコネクションプール設定を組み立てる"""
+    options = {key: int(db_config.get(key, default)) for key, default in _POOL_DEFAULTS.items()}
+    # 不安定なネットワーク環境向けに設定で事前確認(pool_pre_ping)を有効化できる
+    options['pool_pre_ping'] = bool(db_config.get('pool_pre_ping', False))
+    return options
+
+
+# pool_pre_ping（チェックアウト毎の SELECT 1）の代わりに使うTCPキープアライブ設定
+_PG_KEEPALIVE_ARGS = {
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    'keepalives_interval': 10,
+    'keepalives_count': 5,
+}
+_MYSQL_INIT_COMMAND = 'SET SESSION wait_timeout=28800'
+
+
+def _enable_socket_keepalive(dbapi_connection, connection_record):
+    """pymysql接続のソケットでSO_KEEPALIVEを有効にする（engineの"connect"イベント）"""
+    sock = getattr(dbapi_connection, '_sock', None)
+    if sock is not None:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+
+# SQLite接続毎に適用するPRAGMA（WAL + メモリマップドI/O）
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA cache_size=-65536",    # 64MB（負値はKiB単位）
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """SQLite接続にWAL等のPRAGMAを設定する（engineの"connect"イベント）"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# bulk_insert（DataFrame.to_sql）の複数行INSERT設定
+_SQLITE_MAX_VARIABLES = 999     # 古いSQLiteでも安全なバインド変数の上限
+_MULTI_ROW_CHUNKSIZE = 1000     # MySQLで1文にまとめる行数
+_PG_EXECUTE_VALUES_PAGE_SIZE = 1000
+
+
+def _psql_insert_values(table, conn, keys, data_iter):
+    """DataFrame.to_sqlのmethod: psycopg2のexecute_valuesで複数行VALUESを一括送信する"""
+    from psycopg2.extras import execute_values
+
+    columns = ', '.join(f'"{key}"' for key in keys)
+    table_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    with conn.connection.cursor() as cursor:
+        execute_values(
+            cursor, f'INSERT INTO {table_name} ({columns}) VALUES %s',
+            list(data_iter), page_size=_PG_EXECUTE_VALUES_PAGE_SIZE)
+
+
+# get_data_summary用: カタログ統計から行数の概算を一括取得するSQL（:namesは展開バインド）
+_ROW_ESTIMATE_SQL = MappingProxyType({
+    'postgresql': (
+        "SELECT c.relname, CAST(c.reltuples AS BIGINT) FROM pg_class c"
+        " JOIN pg_namespace n ON n.oid = c.relnamespace"
+        " WHERE n.nspname = current_schema() AND c.relname IN :names"),
+    'mysql': (
+        "SELECT table_name, table_rows FROM information_schema.tables"
+        " WHERE table_schema = DATABASE() AND table_name IN :names"),
+})
+
+# 概算取得の前に実行するSQL（MySQL 8はtable_rowsを既定で24時間キャッシュするため無効化）
+_ROW_ESTIMATE_PRELUDE = MappingProxyType({
+    'mysql': "/*!80000 SET SESSION information_schema_stats_expiry = 0 */",
+})
+
+
+@lru_cache(maxsize=16)
+def _resolved_sqlite_path(path: str, cwd: str) -> str:
+    """SQLiteファイルの絶対パス（resolveのstat呼び出しを作業ディレクトリごとにキャッシュ）"""
+    return str(Path(cwd, path).resolve())
+
+
+class _DialectSpec(NamedTuple):
+    """MySQL/PostgreSQL接続処理における方言ごとの差分"""
+    label: str                  # ログ・メッセージ用の表示名
+    driver: str                 # SQLAlchemyのドライバー指定
+    default_port: int
+    default_user: str
+    url_query: Mapping[str, str]  # 接続URLのクエリパラメータ
+    connect_args: Mapping[str, Any]
+    engine_connect_args: Mapping[str, Any]  # 本接続のみで追加する接続引数（キープアライブ等）
+    engine_options: Mapping[str, Any]       # 本接続のcreate_engineに渡す方言固有オプション
+    socket_keepalive: bool      # DBAPI接続のソケットにSO_KEEPALIVEを設定するか
+    pin_ipv4_localhost: bool    # Windowsでlocalhostを127.0.0.1に固定するか
+    version_sql: str
+    admin_database: str         # データベース作成時の接続先（空文字はデータベース指定なし）
+    quote_char: str             # 識別子のクォート文字
+    exists_sql: Optional[str]   # 存在確認SQL（CREATE DATABASE IF NOT EXISTS がない方言のみ）
+    create_sql: str             # {} にエスケープ済みのデータベース名が入る
+
+
+_MYSQL = _DialectSpec(
+    label='MySQL',
+    driver='mysql+pymysql',
+    default_port=3306,
+    default_user='root',
+    url_query=MappingProxyType({
+        'charset': 'utf8mb4',
+        'use_unicode': '1',
+        'connect_timeout': '30',
+    }),
+    connect_args=MappingProxyType({
+        'charset': 'utf8mb4',
+        'use_unicode': True,
+        'connect_timeout': 30,
+    }),
+    engine_connect_args=MappingProxyType({'init_command': _MYSQL_INIT_COMMAND}),
+    engine_options=MappingProxyType({}),
+    socket_keepalive=True,
+    pin_ipv4_localhost=False,
+    version_sql='SELECT VERSION()',
+    admin_database='',
+    quote_char='`',
+    exists_sql=None,
+    create_sql='CREATE DATABASE IF NOT EXISTS `{}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci',
+)
+
+_POSTGRESQL = _DialectSpec(
+    label='PostgreSQL',
+    driver='postgresql+psycopg2',
+    default_port=5432,
+    default_user='postgres',
+    url_query=MappingProxyType({
+        'client_encoding': 'utf8',
+        'application_name': 'JRA-Data-Collector',
+        'connect_timeout': '30',
+        'options': '-c timezone=Asia/Tokyo',
+    }),
+    connect_args=MappingProxyType({
+        'client_encoding': 'utf8',
+        'application_name': 'JRA-Data-Collector',
+        'connect_timeout': 30,
+    }),
+    engine_connect_args=MappingProxyType(_PG_KEEPALIVE_ARGS),
+    # psycopg2のFast Execution Helpersでexecutemanyを複数行単位で送信する
+    engine_options=MappingProxyType({
+        'executemany_mode': 'values_plus_batch',
+        'executemany_values_page_size': 1000,
+        'executemany_batch_page_size': 500,
+    }),
+    socket_keepalive=False,
+    pin_ipv4_localhost=True,
+    version_sql='SELECT version()',
+    admin_database='postgres',
+    quote_char='"',
+    exists_sql='SELECT 1 FROM pg_database WHERE datname = :name',
+    create_sql='CREATE DATABASE "{}" WITH ENCODING \'UTF8\'',
+)
+
+# 設定のデータベース種別 → 方言
+_SERVER_DIALECTS = MappingProxyType({
+    'MySQL': _MYSQL,
+    'PostgreSQL': _POSTGRESQL,
+})
+
+
+def _safe_utf8(value: str) -> str:
+    """UTF-8にエンコードできない文字（不正なサロゲート）を置換する（ASCIIはそのまま）"""
+    return value if value.isascii() else value.encode('utf-8', errors='replace').decode('utf-8')
+
+
+@dataclass(frozen=True, slots=True)
+class DBConfig:
+    """設定から一度だけ取り出して正規化したMySQL/PostgreSQL接続パラメータ"""
+    type: str
+    host: str
+    port: int
+    username: str
+    password: str = field(repr=False)
+    database: str
+    pool_options: Mapping[str, Any] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def from_settings(cls, db_config: dict, default_database: str = 'jra_data') -> 'DBConfig':
+        """settings_manager.get_db_config() 形式の辞書から生成する"""
+        db_type = db_config['type']
+        spec = _SERVER_DIALECTS[db_type]
+
+        host = str(db_config.get('host') or 'localhost').strip()
+        try:
+            port = int(db_config.get('port') or spec.default_port)
+        except (ValueError, TypeError):
+            port = spec.default_port
+
+        # Windows環境でのTCP接続調整
+        if spec.pin_ipv4_localhost and host == 'localhost' and _IS_WINDOWS:
+            host = '127.0.0.1'
+
+        return cls(
+            type=db_type,
+            host=host,
+            port=port,
+            username=_safe_utf8(str(db_config.get('username') or spec.default_user).strip()),
+            password=_safe_utf8(str(db_config.get('password') or '').strip()),
+            database=_safe_utf8(str(db_config.get('database') or db_config.get('db_name')
+                                    or default_database).strip()),
+            pool_options=MappingProxyType(_pool_options(db_config)))
+
+    @property
+    def spec(self) -> _DialectSpec:
+        return _SERVER_DIALECTS[self.type]
+
+    def url(self, database: Optional[str] = None) -> URL:
+        """
+        接続URLを組み立てる（databaseを省略すると設定のデータベース）
+
+        各要素のエスケープ（日本語・記号を含むパスワード等）はURL側で行われる。
+        """
+        if database is None:
+            database = self.database
+        return URL.create(
+            self.spec.driver,
+            username=self.username,
+            password=self.password,
+            host=self.host,
+            port=self.port,
+            database=database or None,
+            query=self.spec.url_query)
+
+
+# 接続テスト用に生成したエンジン（最近使った順。上限を超えた分と終了時に破棄する）
+_PROBE_ENGINE_CACHE_SIZE = 32
+_probe_engines: 'OrderedDict[tuple, Any]' = OrderedDict()
+_probe_engines_lock = threading.Lock()
+
+
+def _get_or_create_engine(url, connect_args: Optional[Mapping[str, Any]] = None, **engine_options):
+    """
+    接続テスト用のエンジンを接続文字列・オプションごとにキャッシュして返す
+
+    同じ設定での再テストではURL解析・方言の読み込み・プール生成を省略し、
+    プールからのチェックアウトのみで済ませる。
+    """
+    key = (url, frozenset((connect_args or {}).items()), frozenset(engine_options.items()))
+    with _probe_engines_lock:
+        engine = _probe_engines.get(key)
+        if engine is not None:
+            _probe_engines.move_to_end(key)
+            return engine
+
+        engine = create_engine(url, connect_args=dict(connect_args or {}), **engine_options)
+        _probe_engines[key] = engine
+        if len(_probe_engines) > _PROBE_ENGINE_CACHE_SIZE:
+            # 最も長く使われていないエンジンはプール内の接続ごと破棄する
+            _, evicted = _probe_engines.popitem(last=False)
+            evicted.dispose()
+        return engine
+
+
+def _dispose_probe_engines():
+    """キャッシュした接続テスト用エンジンを破棄する"""
+    with _probe_engines_lock:
+        for engine in _probe_engines.values():
+            engine.dispose()
+        _probe_engines.clear()
+
+
+atexit.register(_dispose_probe_engines)
 
 
 class DatabaseManager(LoggerMixin):
@@ -43,6 +358,7 @@ class DatabaseManager(LoggerMixin):
         self.Session = None
         self._db_type = None
         self._db_name = None
+        self._server_version = None
 
         self.emit_log("INFO", "DatabaseManagerを初期化しています...")
 
@@ -76,23 +392,19 @@ class DatabaseManager(LoggerMixin):
         try:
             if db_type == "SQLite":
                 db_path = db_config.get('path', 'test.db')
-                test_engine = create_engine(f'sqlite:///{db_path}')
-
-            elif db_type == "MySQL":
-                # MySQL: データベース存在確認と自動作成
-                return self._test_mysql_with_creation(db_config, show_create_dialog)
+                test_engine = _get_or_create_engine(f'sqlite:///{db_path}')
 
-            elif db_type == "PostgreSQL":
-                # PostgreSQL: データベース存在確認と自動作成
-                return self._test_postgresql_with_creation(db_config, show_create_dialog)
+            elif db_type in _SERVER_DIALECTS:
+                # MySQL/PostgreSQL: データベース存在確認と自動作成
+                return self._test_server_with_creation(
+                    DBConfig.from_settings(db_config, 'test'), show_create_dialog)
 
             else:
                 return False, f"未サポートのデータベース種別: {db_type}"
 
             # SQLiteの場合の接続テスト実行
             with test_engine.connect() as conn:
-                result = conn.execute(text("SELECT 1"))
-                result.fetchone()
+                conn.exec_driver_sql("SELECT 1")
 
             return True, f"{db_type} データベースへの接続に成功しました"
 
@@ -100,265 +412,50 @@ class DatabaseManager(LoggerMixin):
             logging.error(f"{db_type} 接続テスト中にエラーが発生しました: {e}")
             return False, f"接続エラー: {str(e)}"
 
-    def _test_mysql_with_creation(self, db_config: dict, show_create_dialog: bool) -> tuple[bool, str]:
+    def _test_server_with_creation(self, config: DBConfig,
+                                   show_create_dialog: bool) -> tuple[bool, str]:
         """
-        MySQL接続テスト（データベース自動作成対応）
+        MySQL/PostgreSQL接続テスト（データベース自動作成対応）
         Unicode対策強化版
         """
-        import urllib.parse
-
-        host = db_config.get('host', 'localhost')
-        try:
-            port = int(db_config.get('port', 3306)
-                       ) if db_config.get('port') else 3306
-        except (ValueError, TypeError):
-            port = 3306
-        username = db_config.get('username', 'root')
-        password = db_config.get('password', '')
-        database = db_config.get(
-            'database') or db_config.get('db_name', 'test')
-
-        # 強化されたUnicodeエンコーディング処理
-        try:
-            # 文字列の安全な正規化
-            username = str(username).strip() if username else 'root'
-            password = str(password).strip() if password else ''
-            database = str(database).strip() if database else 'test'
-            host = str(host).strip() if host else 'localhost'
-
-            # UTF-8エンコーディングの確認と修正
-            username = username.encode(
-                'utf-8', errors='replace').decode('utf-8')
-            password = password.encode(
-                'utf-8', errors='replace').decode('utf-8')
-            database = database.encode(
-                'utf-8', errors='replace').decode('utf-8')
-
-            # URLエンコーディング（safe文字を明示的に指定）
-            username_encoded = urllib.parse.quote(
-                username, safe='', encoding='utf-8')
-            password_encoded = urllib.parse.quote(
-                password, safe='', encoding='utf-8')
-            database_encoded = urllib.parse.quote(
-                database, safe='', encoding='utf-8')
+        spec = config.spec
+        database = config.database
+        url = config.url()
 
+        # デバッグ出力時のみパスワードを伏せたURLを組み立てる
+        if _logger.isEnabledFor(logging.DEBUG):
             self.emit_log(
-                "DEBUG", f"MySQL接続パラメータ: host={host}, port={port}, user={username}, db={database}")
-
-        except Exception as encoding_error:
-            error_msg = f"MySQL接続パラメータのエンコーディングエラー: {encoding_error}"
-            self.emit_log("ERROR", error_msg)
-            return False, error_msg
-
-        # 複数の接続方法を試行
-        connection_attempts = [
-            # 方法1: 標準接続（強化されたエンコーディング）
-            (
-                f'mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
-                f'?charset=utf8mb4&collation=utf8mb4_unicode_ci&use_unicode=1&connect_timeout=30'
-            ),
-            # 方法2: シンプルな設定
-            (
-                f'mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
-                f'?charset=utf8mb4&use_unicode=1'
-            ),
-            # 方法3: 最小パラメータ
-            (
-                f'mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
-            )
-        ]
-
-        last_error = None
+                "DEBUG", f"{spec.label}接続テスト: {url.render_as_string(hide_password=True)}")
 
-        for attempt_num, connection_string in enumerate(connection_attempts, 1):
-            try:
-                self.emit_log(
-                    "DEBUG", f"MySQL接続試行 {attempt_num}: {connection_string.replace(password_encoded, '***')}")
-
-                # SQLAlchemy接続エンジンの作成
-                engine_params = {
-                    'echo': False,
-                    'pool_pre_ping': True,
-                    'pool_recycle': 3600,
-                    'connect_args': {
-                        'charset': 'utf8mb4',
-                        'use_unicode': True,
-                        'connect_timeout': 30
-                    }
-                }
-
-                test_engine = create_engine(connection_string, **engine_params)
-
-                # 接続テスト実行
-                with test_engine.connect() as conn:
-                    result = conn.execute(text("SELECT VERSION()"))
-                    version_info = result.fetchone()[0]
-
-                self.emit_log(
-                    "INFO", f"MySQL接続成功（試行{attempt_num}）: {version_info}")
-                return True, f"MySQL データベース '{database}' への接続に成功しました"
-
-            except UnicodeDecodeError as unicode_error:
-                error_msg = f"MySQL接続試行{attempt_num}でUnicodeエラー: {unicode_error}"
-                self.emit_log("WARNING", error_msg)
-                last_error = unicode_error
-                continue
-
-            except Exception as e:
-                error_msg = f"MySQL接続試行{attempt_num}で一般エラー: {e}"
-                self.emit_log("WARNING", error_msg)
-                last_error = e
-
-                # データベース存在チェック
-                error_str = str(e).lower()
-                if 'unknown database' in error_str or ('database' in error_str and 'unknown' in error_str):
-                    # データベースが存在しない場合の処理
-                    if show_create_dialog:
-                        if self._show_database_create_dialog(database, "MySQL"):
-                            return self._create_mysql_database_safe(host, port, username, password, database)
-                        else:
-                            return False, f"データベース '{database}' が存在しません"
-                    else:
-                        return self._create_mysql_database_safe(host, port, username, password, database)
-                continue
-
-        # すべての接続試行が失敗した場合
-        final_error_msg = f"MySQL接続の全ての試行が失敗しました。最後のエラー: {last_error}"
-        self.emit_log("ERROR", final_error_msg)
-        return False, final_error_msg
-
-    def _test_postgresql_with_creation(self, db_config: dict, show_create_dialog: bool) -> tuple[bool, str]:
-        """
-        PostgreSQL接続テスト（データベース自動作成対応）
-        Unicodeエラー対策強化版
-        """
-        import urllib.parse
-        import platform
-
-        host = db_config.get('host', 'localhost')
         try:
-            port = int(db_config.get('port', 5432)
-                       ) if db_config.get('port') else 5432
-        except (ValueError, TypeError):
-            port = 5432
-        username = db_config.get('username', 'postgres')
-        password = db_config.get('password', '')
-        database = db_config.get(
-            'database') or db_config.get('db_name', 'test')
-
-        # 強化されたUnicodeエンコーディング処理
-        try:
-            # 文字列の安全な正規化
-            username = str(username).strip() if username else 'postgres'
-            password = str(password).strip() if password else ''
-            database = str(database).strip() if database else 'test'
-            host = str(host).strip() if host else 'localhost'
-
-            # UTF-8エンコーディングの確認と修正
-            username = username.encode(
-                'utf-8', errors='replace').decode('utf-8')
-            password = password.encode(
-                'utf-8', errors='replace').decode('utf-8')
-            database = database.encode(
-                'utf-8', errors='replace').decode('utf-8')
-
-            # URLエンコーディング（safe文字を明示的に指定）
-            username_encoded = urllib.parse.quote(
-                username, safe='', encoding='utf-8')
-            password_encoded = urllib.parse.quote(
-                password, safe='', encoding='utf-8')
-            database_encoded = urllib.parse.quote(
-                database, safe='', encoding='utf-8')
-
-            self.emit_log(
-                "DEBUG", f"PostgreSQL接続パラメータ: host={host}, port={port}, user={username}, db={database}")
-
-        except Exception as encoding_error:
-            error_msg = f"PostgreSQL接続パラメータのエンコーディングエラー: {encoding_error}"
-            self.emit_log("ERROR", error_msg)
-            return False, error_msg
-
-        # Windows環境でのTCP接続調整
-        if platform.system() == 'Windows':
-            if host in ['localhost', '127.0.0.1']:
-                host = '127.0.0.1'
-
-        # 複数の接続方法を試行
-        connection_attempts = [
-            # 方法1: 標準接続（強化されたエンコーディング）
-            (
-                f'postgresql+psycopg2://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
-                f'?client_encoding=utf8&connect_timeout=30&application_name=JRA-Data-Collector'
-            ),
-            # 方法2: Unicodeエスケープなし
-            (
-                f'postgresql://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
-                f'?sslmode=prefer&connect_timeout=30'
-            ),
-            # 方法3: 最小パラメータ
-            (
-                f'postgresql+psycopg2://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
-            )
-        ]
-
-        last_error = None
-
-        for attempt_num, connection_string in enumerate(connection_attempts, 1):
-            try:
-                self.emit_log(
-                    "DEBUG", f"PostgreSQL接続試行 {attempt_num}: {connection_string.replace(password_encoded, '***')}")
-
-                # SQLAlchemy接続エンジンの作成
-                engine_params = {
-                    'echo': False,
-                    'pool_pre_ping': True,
-                    'pool_recycle': 3600,
-                    'connect_args': {
-                        'client_encoding': 'utf8',
-                        'application_name': 'JRA-Data-Collector',
-                        'connect_timeout': 30
-                    }
-                }
+            # SQLAlchemy接続エンジンの取得（同じ接続先なら再利用）
+            test_engine = _get_or_create_engine(
+                url,
+                connect_args=spec.connect_args,
+                echo=False,
+                pool_pre_ping=True,
+                pool_recycle=3600)
 
-                test_engine = create_engine(connection_string, **engine_params)
+            # 接続テスト実行
+            with test_engine.connect() as conn:
+                version_info = str(conn.exec_driver_sql(spec.version_sql).scalar_one())
 
-                # 接続テスト実行
-                with test_engine.connect() as conn:
-                    result = conn.execute(text("SELECT version()"))
-                    version_info = result.fetchone()[0]
+            self.emit_log("INFO", f"{spec.label}接続成功: {version_info[:100]}")
+            return True, f"{spec.label} データベース '{database}' への接続に成功しました"
 
-                self.emit_log(
-                    "INFO", f"PostgreSQL接続成功（試行{attempt_num}）: {version_info[:100]}...")
-                return True, f"PostgreSQL データベース '{database}' への接続に成功しました"
+        except OperationalError as e:
+            # データベースが存在しない場合の処理
+            if _is_missing_database_error(e):
+                if show_create_dialog and not self._show_database_create_dialog(database, spec.label):
+                    return False, f"データベース '{database}' が存在しません"
+                return self._create_database_safe(config)
+            error_msg = f"{spec.label}接続に失敗しました: {e}"
 
-            except UnicodeDecodeError as unicode_error:
-                error_msg = f"PostgreSQL接続試行{attempt_num}でUnicodeエラー: {unicode_error}"
-                self.emit_log("WARNING", error_msg)
-                last_error = unicode_error
-                continue
-
-            except Exception as e:
-                error_msg = f"PostgreSQL接続試行{attempt_num}で一般エラー: {e}"
-                self.emit_log("WARNING", error_msg)
-                last_error = e
-
-                # データベース存在チェック
-                error_str = str(e).lower()
-                if 'does not exist' in error_str or 'database' in error_str and 'not exist' in error_str:
-                    # データベースが存在しない場合の処理
-                    if show_create_dialog:
-                        if self._show_database_create_dialog(database, "PostgreSQL"):
-                            return self._create_postgresql_database_safe(host, port, username, password, database)
-                        else:
-                            return False, f"データベース '{database}' が存在しません"
-                    else:
-                        return self._create_postgresql_database_safe(host, port, username, password, database)
-                continue
+        except Exception as e:
+            error_msg = f"{spec.label}接続テストでエラー: {e}"
 
-        # すべての接続試行が失敗した場合
-        final_error_msg = f"PostgreSQL接続の全ての試行が失敗しました。最後のエラー: {last_error}"
-        self.emit_log("ERROR", final_error_msg)
-        return False, final_error_msg
+        self.emit_log("ERROR", error_msg)
+        return False, error_msg
 
     def _show_database_create_dialog(self, database_name: str, db_type: str) -> bool:
         """
@@ -407,154 +504,51 @@ class DatabaseManager(LoggerMixin):
             # エラーの場合は自動作成
             return True
 
-    def _create_mysql_database_safe(self, host: str, port: int, username: str, password: str, database: str) -> tuple[bool, str]:
-        """
-        MySQLデータベースを安全に作成（Unicode対応強化版）
+    def _create_database_safe(self, config: DBConfig) -> tuple[bool, str]:
         """
-        import urllib.parse
-
-        try:
-            # 文字列の安全な正規化
-            username = str(username).encode(
-                'utf-8', errors='replace').decode('utf-8')
-            password = str(password).encode(
-                'utf-8', errors='replace').decode('utf-8')
-            database = str(database).encode(
-                'utf-8', errors='replace').decode('utf-8')
-
-            # URLエンコーディング
-            username_encoded = urllib.parse.quote(
-                username, safe='', encoding='utf-8')
-            password_encoded = urllib.parse.quote(
-                password, safe='', encoding='utf-8')
-
-            # データベース指定なしでMySQL接続の複数試行
-            connection_attempts = [
-                f'mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}?charset=utf8mb4&use_unicode=1&connect_timeout=30',
-                f'mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}?charset=utf8mb4&use_unicode=1',
-                f'mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}'
-            ]
-
-            for attempt_num, connection_string in enumerate(connection_attempts, 1):
-                try:
-                    self.emit_log("DEBUG", f"MySQLデータベース作成試行 {attempt_num}")
-
-                    admin_engine = create_engine(connection_string, echo=False)
-
-                    with admin_engine.connect() as conn:
-                        # データベース作成（識別子をバッククォート）
-                        safe_db_name = database.replace(
-                            '`', '``')  # バッククォートエスケープ
-                        conn.execute(text(
-                            f"CREATE DATABASE `{safe_db_name}` CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci"))
-                        conn.commit()
-
-                    self.emit_log(
-                        "INFO", f"MySQLデータベース '{database}' の作成に成功しました")
-
-                    # 作成したデータベースに接続テスト
-                    database_encoded = urllib.parse.quote(
-                        database, safe='', encoding='utf-8')
-                    test_connection_string = f'mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}?charset=utf8mb4&use_unicode=1&connect_timeout=30'
-
-                    test_engine = create_engine(
-                        test_connection_string, echo=False)
-                    with test_engine.connect() as conn:
-                        result = conn.execute(text("SELECT VERSION()"))
-                        result.fetchone()
-
-                    return True, f"MySQLデータベース '{database}' を作成し、接続に成功しました"
-
-                except Exception as e:
-                    self.emit_log(
-                        "WARNING", f"MySQLデータベース作成試行{attempt_num}でエラー: {e}")
-                    if attempt_num == len(connection_attempts):
-                        raise
-                    continue
-
-        except Exception as e:
-            error_msg = f"MySQLデータベース '{database}' の作成に失敗しました: {str(e)}"
-            self.emit_log("ERROR", error_msg)
-            return False, error_msg
+        MySQL/PostgreSQLデータベースを安全に作成（Unicode対応強化版）
 
-    def _create_postgresql_database_safe(self, host: str, port: int, username: str, password: str, database: str) -> tuple[bool, str]:
-        """
-        PostgreSQLデータベースを安全に作成（Unicode対応強化版）
+        既に存在する場合は何もしない（MySQLは IF NOT EXISTS、
+        PostgreSQLは pg_database で事前に存在確認する）。
         """
-        import urllib.parse
-        import platform
-
+        spec = config.spec
+        database = config.database
         try:
-            # 文字列の安全な正規化
-            username = str(username).encode(
-                'utf-8', errors='replace').decode('utf-8')
-            password = str(password).encode(
-                'utf-8', errors='replace').decode('utf-8')
-            database = str(database).encode(
-                'utf-8', errors='replace').decode('utf-8')
-
-            # URLエンコーディング
-            username_encoded = urllib.parse.quote(
-                username, safe='', encoding='utf-8')
-            password_encoded = urllib.parse.quote(
-                password, safe='', encoding='utf-8')
-
-            # Windows環境でのTCP接続調整
-            if platform.system() == 'Windows':
-                if host in ['localhost', '127.0.0.1']:
-                    host = '127.0.0.1'
-
-            # postgres データベースに接続（デフォルトで存在）
-            connection_attempts = [
-                f'postgresql+psycopg2://{username_encoded}:{password_encoded}@{host}:{port}/postgres?client_encoding=utf8&connect_timeout=30',
-                f'postgresql://{username_encoded}:{password_encoded}@{host}:{port}/postgres?sslmode=prefer&connect_timeout=30',
-                f'postgresql+psycopg2://{username_encoded}:{password_encoded}@{host}:{port}/postgres'
-            ]
-
-            for attempt_num, connection_string in enumerate(connection_attempts, 1):
-                try:
-                    self.emit_log(
-                        "DEBUG", f"PostgreSQLデータベース作成試行 {attempt_num}")
-
-                    admin_engine = create_engine(connection_string, echo=False)
-
-                    # PostgreSQLでは自動コミットモードでCREATE DATABASEを実行
-                    with admin_engine.connect() as conn:
-                        # トランザクション外でCREATE DATABASEを実行
-                        conn.execute(text("COMMIT"))
-                        conn.connection.autocommit = True
-
-                        # データベース作成（識別子をクォート）
-                        safe_db_name = database.replace(
-                            '"', '""')  # ダブルクォートエスケープ
-                        conn.execute(
-                            text(f'CREATE DATABASE "{safe_db_name}" WITH ENCODING \'UTF8\''))
-
-                    self.emit_log(
-                        "INFO", f"PostgreSQLデータベース '{database}' の作成に成功しました")
+            admin_url = config.url(spec.admin_database)
+            self.emit_log("DEBUG", f"{spec.label}データベース作成を試行")
 
-                    # 作成したデータベースに接続テスト
-                    database_encoded = urllib.parse.quote(
-                        database, safe='', encoding='utf-8')
-                    test_connection_string = f'postgresql+psycopg2://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}?client_encoding=utf8&connect_timeout=30'
+            # CREATE DATABASEはトランザクション外で実行する必要があるため自動コミットモードで接続
+            admin_engine = create_engine(
+                admin_url, echo=False, isolation_level="AUTOCOMMIT",
+                connect_args=dict(spec.connect_args))
+            try:
+                with admin_engine.connect() as conn:
+                    exists = (spec.exists_sql is not None and conn.execute(
+                        text(spec.exists_sql), {"name": database}).scalar_one_or_none() is not None)
+                    if not exists:
+                        # 識別子のクォート文字をエスケープして作成
+                        safe_db_name = database.replace(spec.quote_char, spec.quote_char * 2)
+                        conn.exec_driver_sql(spec.create_sql.format(safe_db_name))
+            finally:
+                admin_engine.dispose()
 
-                    test_engine = create_engine(
-                        test_connection_string, echo=False)
-                    with test_engine.connect() as conn:
-                        result = conn.execute(text("SELECT version()"))
-                        result.fetchone()
+            self.emit_log(
+                "INFO", f"{spec.label}データベース '{database}' の作成に成功しました")
 
-                    return True, f"PostgreSQLデータベース '{database}' を作成し、接続に成功しました"
+            # 作成したデータベースに接続テスト
+            test_url = config.url()
+            test_engine = create_engine(
+                test_url, echo=False, connect_args=dict(spec.connect_args))
+            try:
+                with test_engine.connect() as conn:
+                    conn.exec_driver_sql("SELECT 1")
+            finally:
+                test_engine.dispose()
 
-                except Exception as e:
-                    self.emit_log(
-                        "WARNING", f"PostgreSQLデータベース作成試行{attempt_num}でエラー: {e}")
-                    if attempt_num == len(connection_attempts):
-                        raise
-                    continue
+            return True, f"{spec.label}データベース '{database}' を作成し、接続に成功しました"
 
         except Exception as e:
-            error_msg = f"PostgreSQLデータベース '{database}' の作成に失敗しました: {str(e)}"
+            error_msg = f"{spec.label}データベース '{database}' の作成に失敗しました: {str(e)}"
             self.emit_log("ERROR", error_msg)
             return False, error_msg
 
@@ -570,10 +564,8 @@ class DatabaseManager(LoggerMixin):
 
         if db_type == "SQLite":
             self._connect_sqlite(db_config)
-        elif db_type == "MySQL":
-            self._connect_mysql(db_config)
-        elif db_type == "PostgreSQL":
-            self._connect_postgresql(db_config)
+        elif db_type in _SERVER_DIALECTS:
+            self._connect_server(DBConfig.from_settings(db_config))
         else:
             error_msg = f"未サポートのデータベース種別: {db_type}"
             self.emit_log("ERROR", error_msg)
@@ -606,10 +598,9 @@ class DatabaseManager(LoggerMixin):
             try:
                 if db_type == "SQLite":
                     return self._connect_sqlite_with_result(db_config)
-                elif db_type == "MySQL":
-                    return self._connect_mysql_with_result(db_config)
-                elif db_type == "PostgreSQL":
-                    return self._connect_postgresql_with_result(db_config)
+                elif db_type in _SERVER_DIALECTS:
+                    return self._connect_server(
+                        DBConfig.from_settings(db_config), fallback=False)
                 else:
                     # 元の状態に戻す
                     self._db_type = original_db_type
@@ -639,34 +630,27 @@ class DatabaseManager(LoggerMixin):
             db_path = str(db_path).strip() if db_path else 'jra_data.db'
 
             # UTF-8エンコーディングの確認と修正
-            db_path = db_path.encode('utf-8', errors='replace').decode('utf-8')
+            db_path = _safe_utf8(db_path)
 
             self._db_name = db_path
             self.emit_log("INFO", f"SQLiteデータベース接続: {db_path}")
 
-            # SQLite接続文字列の安全な構築
-            if os.path.isabs(db_path):
-                # 絶対パスの場合
-                connection_string = f'sqlite:///{db_path}'
-            else:
-                # 相対パスの場合
-                from pathlib import Path
-                safe_path = Path(db_path).resolve()
-                connection_string = f'sqlite:///{safe_path}'
+            # SQLite接続文字列の安全な構築（相対パスは解決結果をキャッシュ）
+            if not os.path.isabs(db_path):
+                db_path = _resolved_sqlite_path(db_path, os.getcwd())
+            connection_string = f'sqlite:///{db_path}'
 
             self.engine = create_engine(
-                connection_string,
-                echo=False,
-                pool_pre_ping=True
-            )
+                connection_string, echo=False, query_cache_size=_QUERY_CACHE_SIZE)
+            event.listen(self.engine, "connect", _apply_sqlite_pragmas)
 
             # 接続テスト
             with self.engine.connect() as connection:
-                result = connection.execute(text("SELECT sqlite_version()"))
-                version_info = result.fetchone()[0]
+                version_info = connection.exec_driver_sql(
+                    "SELECT sqlite_version()").scalar_one()
                 self.emit_log("INFO", f"SQLite接続成功: バージョン {version_info}")
 
-            self.Session = sessionmaker(bind=self.engine)
+            self._bind_session()
 
         except Exception as e:
             error_msg = f"SQLite接続エラー: {e}"
@@ -675,298 +659,91 @@ class DatabaseManager(LoggerMixin):
             self.engine = None
             self.Session = None
 
-    def _connect_mysql(self, db_config: dict):
+    def _connect_server(self, config: DBConfig, fallback: bool = True) -> tuple[bool, str]:
         """
-        MySQL接続（修正点3: データベース自動生成機能付き）
+        MySQL/PostgreSQL接続（修正点3: データベース自動生成機能付き）
         日本語パス対応: URLエンコーディングとUnicode設定強化
-        Unicode対策強化版
-        """
-        import urllib.parse
-
-        host = db_config.get('host', 'localhost')
-        try:
-            port = int(db_config.get('port', 3306)
-                       ) if db_config.get('port') else 3306
-        except (ValueError, TypeError):
-            port = 3306
-            username = db_config.get('username', 'root')
-            password = db_config.get('password', '')
-        database = db_config.get('database') or db_config.get(
-            'db_name', 'jra_data')  # 両方に対応
-
-        self._db_name = database
-
-        # 強化されたUnicodeエンコーディング処理
-        try:
-            # 文字列の安全な正規化
-            username = str(username).strip() if username else 'root'
-            password = str(password).strip() if password else ''
-            database = str(database).strip() if database else 'jra_data'
-            host = str(host).strip() if host else 'localhost'
-
-            # UTF-8エンコーディングの確認と修正
-            username = username.encode(
-                'utf-8', errors='replace').decode('utf-8')
-            password = password.encode(
-                'utf-8', errors='replace').decode('utf-8')
-            database = database.encode(
-                'utf-8', errors='replace').decode('utf-8')
-
-            # URLエンコーディング（safe文字を明示的に指定）
-            username_encoded = urllib.parse.quote(
-                username, safe='', encoding='utf-8')
-            password_encoded = urllib.parse.quote(
-                password, safe='', encoding='utf-8')
-            database_encoded = urllib.parse.quote(
-                database, safe='', encoding='utf-8')
-
-        except Exception as encoding_error:
-            error_msg = f"MySQL接続パラメータのエンコーディングエラー: {encoding_error}"
-            self.emit_log("ERROR", error_msg)
-            self.emit_log("WARNING", "SQLiteフォールバックモードに切り替えます...")
-            self._fallback_to_sqlite()
-            return
-
-        # 複数の接続方法を試行
-        connection_attempts = [
-            # 方法1: 標準接続（強化されたエンコーディング）
-            (
-                f'mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
-                f'?charset=utf8mb4&collation=utf8mb4_unicode_ci&use_unicode=1&connect_timeout=30'
-            ),
-            # 方法2: シンプルな設定
-            (
-                f'mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
-                f'?charset=utf8mb4&use_unicode=1'
-            ),
-            # 方法3: 最小パラメータ
-            (
-                f'mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
-            )
-        ]
-
-        for attempt_num, connection_string in enumerate(connection_attempts, 1):
-            try:
-                self.emit_log(
-                    "INFO", f"MySQL接続試行 {attempt_num}: {connection_string.replace(password_encoded, '***')}")
-
-                # SQLAlchemy接続オプションでUnicode対応を強化
-                connect_args = {
-                    'charset': 'utf8mb4',
-                    'use_unicode': True,
-                    'connect_timeout': 30
-                }
-
-                self.engine = create_engine(
-                    connection_string,
-                    echo=False,
-                    connect_args=connect_args,
-                    pool_pre_ping=True,
-                    pool_recycle=3600
-                )
-
-                # 接続をテスト
-                with self.engine.connect() as connection:
-                    # UTF-8での動作確認
-                    result = connection.execute(text("SELECT VERSION()"))
-                    version_info = result.fetchone()[0]
-                    self.emit_log(
-                        "INFO", f"MySQL接続成功（試行{attempt_num}）: {version_info}")
-
-                self.Session = sessionmaker(bind=self.engine)
-                return
-
-            except OperationalError as e:
-                # 修正点3: データベースが存在しない場合のエラーをハンドル
-                if self._handle_mysql_db_creation(e, host, port, username, password, database):
-                    # データベース作成後、再接続（同じエンコーディング設定）
-                    self.emit_log("INFO", "データベース作成後、再接続を試行中...")
-                    self.engine = create_engine(
-                        connection_string,
-                        echo=False,
-                        connect_args=connect_args,
-                        pool_pre_ping=True,
-                        pool_recycle=3600
-                    )
-
-                    with self.engine.connect() as connection:
-                        self.emit_log(
-                            "INFO", f"MySQLデータベース '{database}' に再接続成功")
-
-                    self.Session = sessionmaker(bind=self.engine)
-                    return
-                else:
-                    # その他のOperationalErrorは次の接続方法を試行
-                    self.emit_log(
-                        "WARNING", f"MySQL接続試行{attempt_num}でOperationalError: {e}")
-                    continue
-
-            except UnicodeDecodeError as e:
-                # Unicode関連エラーの詳細な処理
-                error_msg = f"MySQL接続試行{attempt_num}でUnicodeエラー（日本語パス関連）: {e}"
-                self.emit_log("WARNING", error_msg)
-                continue
-
-            except Exception as e:
-                error_msg = f"MySQL接続試行{attempt_num}で一般エラー: {e}"
-                self.emit_log("WARNING", error_msg)
-                continue
 
-        # すべての接続試行が失敗した場合
-        self.emit_log("ERROR", "MySQL接続の全ての試行が失敗しました")
-        self.emit_log("WARNING", "SQLiteフォールバックモードに切り替えます...")
-        self._fallback_to_sqlite()
-        return
+        fallback=True（通常の接続）では、データベースが存在しなければ作成し、
+        接続できなければSQLiteにフォールバックする。
+        fallback=False（connect_without_fallback用）は結果を返すのみ。
 
-    def _connect_postgresql(self, db_config: dict):
-        """
-        PostgreSQL接続（修正点3: データベース自動生成機能付き）
-        日本語パス対応: URLエンコーディングとUnicode設定強化
-        Unicode対策強化版
+        Returns:
+            (接続成功フラグ, メッセージ)
         """
-        import urllib.parse
-
-        host = db_config.get('host', 'localhost')
-        try:
-            port = int(db_config.get('port', 5432)
-                       ) if db_config.get('port') else 5432
-        except (ValueError, TypeError):
-            port = 5432
-            username = db_config.get('username', 'postgres')
-            password = db_config.get('password', '')
-        database = db_config.get('database') or db_config.get(
-            'db_name', 'jra_data')  # 両方に対応
-
+        spec = config.spec
+        database = config.database
+        url = config.url()
         self._db_name = database
 
-        # 強化されたUnicodeエンコーディング処理
-        try:
-            # 文字列の安全な正規化
-            username = str(username).strip() if username else 'postgres'
-            password = str(password).strip() if password else ''
-            database = str(database).strip() if database else 'jra_data'
-            host = str(host).strip() if host else 'localhost'
-
-            # UTF-8エンコーディングの確認と修正
-            username = username.encode(
-                'utf-8', errors='replace').decode('utf-8')
-            password = password.encode(
-                'utf-8', errors='replace').decode('utf-8')
-            database = database.encode(
-                'utf-8', errors='replace').decode('utf-8')
-
-            # URLエンコーディング（safe文字を明示的に指定）
-            username_encoded = urllib.parse.quote(
-                username, safe='', encoding='utf-8')
-            password_encoded = urllib.parse.quote(
-                password, safe='', encoding='utf-8')
-            database_encoded = urllib.parse.quote(
-                database, safe='', encoding='utf-8')
-
-        except Exception as encoding_error:
-            error_msg = f"PostgreSQL接続パラメータのエンコーディングエラー: {encoding_error}"
-            self.emit_log("ERROR", error_msg)
-            self.emit_log("WARNING", "SQLiteフォールバックモードに切り替えます...")
-            self._fallback_to_sqlite()
-            return
+        # デバッグ出力時のみパスワードを伏せたURLを組み立てる
+        if _logger.isEnabledFor(logging.DEBUG):
+            self.emit_log(
+                "DEBUG", f"{spec.label}接続: {url.render_as_string(hide_password=True)}")
 
-        # Windows環境でのTCP接続調整 + 強化されたエンコーディング設定
-        import platform
-        if platform.system() == 'Windows':
-            if host in ['localhost', '127.0.0.1']:
-                host = '127.0.0.1'
-
-        # 複数の接続方法を試行
-        connection_attempts = [
-            # 方法1: 標準接続（強化されたエンコーディング）
-            (
-                f'postgresql+psycopg2://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
-                f'?client_encoding=utf8&application_name=JRA-Data-Collector'
-                f'&connect_timeout=30&options=-c timezone=Asia/Tokyo'
-            ),
-            # 方法2: シンプルな設定
-            (
-                f'postgresql+psycopg2://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
-                f'?client_encoding=utf8&connect_timeout=30'
-            ),
-            # 方法3: 最小パラメータ
-            (
-                f'postgresql+psycopg2://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}'
+        try:
+            self.engine = create_engine(
+                url,
+                echo=False,
+                connect_args={**spec.connect_args, **spec.engine_connect_args},
+                query_cache_size=_QUERY_CACHE_SIZE,
+                **spec.engine_options,
+                **config.pool_options  # pool_pre_pingは通常オフ（TCPキープアライブで代替）
             )
-        ]
-
-        for attempt_num, connection_string in enumerate(connection_attempts, 1):
+            if spec.socket_keepalive:
+                event.listen(self.engine, "connect", _enable_socket_keepalive)
+            event.listen(self.engine, "connect", self._capture_server_version)
+
+            # 接続をテスト（バージョンは接続確立時に取得済み）
+            with self.engine.connect():
+                pass
+
+        except OperationalError as e:
+            if not (fallback and _is_missing_database_error(e)):
+                return self._server_connect_failed(spec, e, fallback)
+
+            # 修正点3: データベースが存在しない場合は作成して再接続
+            created, message = self._create_database_safe(config)
+            if not created:
+                return self._server_connect_failed(spec, message, fallback)
             try:
-                self.emit_log(
-                    "INFO", f"PostgreSQL接続試行 {attempt_num}: {connection_string.replace(password_encoded, '***')}")
+                with self.engine.connect():
+                    pass
+            except Exception as retry_error:
+                return self._server_connect_failed(spec, retry_error, fallback)
 
-                # SQLAlchemy接続オプションでUnicode対応を強化
-                connect_args = {
-                    'client_encoding': 'utf8',
-                    'application_name': 'JRA-Data-Collector',
-                    'connect_timeout': 30
-                }
+        except Exception as e:
+            return self._server_connect_failed(spec, e, fallback)
+
+        self.emit_log(
+            "INFO", f"{spec.label}接続成功: {config.host}:{config.port}/{database} ({self._server_version})")
+        self._bind_session()
+        return True, f"{spec.label}接続に成功しました: {database}"
+
+    def _server_connect_failed(self, spec: _DialectSpec, error, fallback: bool) -> tuple[bool, str]:
+        """MySQL/PostgreSQL接続失敗を記録し、必要ならSQLiteにフォールバックする"""
+        error_msg = f"{spec.label}接続に失敗しました: {error}"
+        if fallback:
+            self.emit_log("ERROR", f"{error_msg}（SQLiteにフォールバックします）")
+            self._fallback_to_sqlite()
+        else:
+            self.emit_log("ERROR", error_msg)
+        return False, error_msg
 
-                self.engine = create_engine(
-                    connection_string,
-                    echo=False,
-                    connect_args=connect_args,
-                    pool_pre_ping=True,  # 接続の事前確認
-                    pool_recycle=3600    # 1時間で接続を再利用
-                )
-
-                # 接続をテスト
-                with self.engine.connect() as connection:
-                    # UTF-8での動作確認
-                    result = connection.execute(text("SELECT version()"))
-                    version_info = result.fetchone()[0]
-                    self.emit_log(
-                        "INFO", f"PostgreSQL接続成功（試行{attempt_num}）: {version_info[:100]}...")
-
-                self.Session = sessionmaker(bind=self.engine)
-                return
-
-            except OperationalError as e:
-                # 修正点3: データベースが存在しない場合のエラーをハンドル
-                if self._handle_postgresql_db_creation(e, host, port, username, password, database):
-                    # データベース作成後、再接続（同じエンコーディング設定）
-                    self.emit_log("INFO", "データベース作成後、再接続を試行中...")
-                    self.engine = create_engine(
-                        connection_string,
-                        echo=False,
-                        connect_args=connect_args,
-                        pool_pre_ping=True,
-                        pool_recycle=3600
-                    )
-
-                    with self.engine.connect() as connection:
-                        self.emit_log(
-                            "INFO", f"PostgreSQLデータベース '{database}' に再接続成功")
-
-                    self.Session = sessionmaker(bind=self.engine)
-                    return
-                # 一時的にコメントアウト: インデントエラー修正のため
-                # else:
-                #     # その他のOperationalErrorは次の接続方法を試行
-                #     self.emit_log("WARNING", f"PostgreSQL接続試行{attempt_num}でOperationalError: {e}")
-                #     continue
-
-            except UnicodeDecodeError as e:
-                # Unicode関連エラーの詳細な処理
-                error_msg = f"PostgreSQL接続試行{attempt_num}でUnicodeエラー（日本語パス関連）: {e}"
-                self.emit_log("WARNING", error_msg)
-                # continue  # 一時的にコメントアウト
+    def _bind_session(self):
+        """現在のengineにバインドしたSessionファクトリを作成する"""
+        from sqlalchemy.orm import sessionmaker
+        self.Session = sessionmaker(bind=self.engine)
 
-            except Exception as e:
-                error_msg = f"PostgreSQL接続試行{attempt_num}で一般エラー: {e}"
-                self.emit_log("WARNING", error_msg)
-                # continue  # 一時的にコメントアウト
+    def _capture_server_version(self, dbapi_connection, connection_record):
+        """
+        接続確立時にサーバーバージョンを記録する（engineの"connect"イベント）
 
-        # すべての接続試行が失敗した場合
-        self.emit_log("ERROR", "PostgreSQL接続の全ての試行が失敗しました")
-        self.emit_log("WARNING", "SQLiteフォールバックモードに切り替えます...")
-        self._fallback_to_sqlite()
-        return
+        psycopg2 は起動パケットから得た整数（例: 150002）、
+        pymysql はハンドシェイクで得た文字列を server_version に持つため、
+        バージョン取得のためのクエリは発行しない。
+        """
+        self._server_version = getattr(dbapi_connection, 'server_version', None)
 
     def _fallback_to_sqlite(self):
         """
@@ -982,114 +759,21 @@ class DatabaseManager(LoggerMixin):
             self._db_name = safe_db_path
 
             self.engine = create_engine(
-                f'sqlite:///{safe_db_path}', echo=False)
+                f'sqlite:///{safe_db_path}', echo=False,
+                query_cache_size=_QUERY_CACHE_SIZE)
+            event.listen(self.engine, "connect", _apply_sqlite_pragmas)
 
             # 接続テスト
             with self.engine.connect() as connection:
                 self.emit_log("INFO", "SQLiteフォールバック接続が成功しました")
 
-            self.Session = sessionmaker(bind=self.engine)
+            self._bind_session()
 
         except Exception as fallback_error:
             self.emit_log("ERROR", f"SQLiteフォールバックも失敗: {fallback_error}")
             self.engine = None
             self.Session = None
 
-    def _handle_mysql_db_creation(self, e: OperationalError, host: str, port: int,
-                                  username: str, password: str, database: str) -> bool:
-        """
-        MySQLデータベースが存在しないエラーを検出し、作成を試みる
-
-        修正点3: MySQL用データベース自動生成
-        """
-        if not MYSQL_CONNECTOR_AVAILABLE:
-            self.emit_log(
-                "ERROR", "mysql.connectorが利用できません。データベース自動作成をスキップします。")
-            return False
-
-        original_exception = e.orig
-        db_does_not_exist = False
-
-        if isinstance(original_exception, mysql.connector.Error):
-            # mysql-connector-pythonの場合、エラーコード ER_BAD_DB_ERROR (1049) を確認
-            if original_exception.errno == mysql.connector.errorcode.ER_BAD_DB_ERROR:
-                db_does_not_exist = True
-
-        if db_does_not_exist:
-            self.emit_log(
-                "WARNING", f"MySQLデータベース '{database}' が存在しません。自動作成を試行します。")
-
-            try:
-                # デフォルトデータベースに接続
-                default_connection_string = f'mysql+pymysql://{username}:{password}@{host}:{port}'
-                engine = create_engine(default_connection_string)
-
-                with engine.connect() as connection:
-                    # AUTOCOMMITを設定してCREATE DATABASEを実行
-                    connection = connection.execution_options(
-                        isolation_level="AUTOCOMMIT")
-                    connection.execute(text(f"CREATE DATABASE {database}"))
-
-                self.emit_log("INFO", f"MySQLデータベース '{database}' を正常に作成しました")
-                return True
-
-            except Exception as create_exc:
-                error_msg = f"MySQLデータベース '{database}' の作成に失敗しました: {create_exc}"
-                self.emit_log("ERROR", error_msg)
-                raise ConnectionError(error_msg) from create_exc
-
-        return False
-
-    def _handle_postgresql_db_creation(self, e: OperationalError, host: str, port: int,
-                                       username: str, password: str, database: str) -> bool:
-        """
-        PostgreSQLデータベースが存在しないエラーを検出し、作成を試みる
-
-        修正点3: PostgreSQL用データベース自動生成
-        """
-        if not PSYCOPG2_AVAILABLE:
-            self.emit_log("ERROR", "psycopg2が利用できません。データベース自動作成をスキップします。")
-            return False
-
-        original_exception = e.orig
-        db_does_not_exist = False
-
-        if isinstance(original_exception, psycopg2.OperationalError):
-            # psycopg2の場合、"database... does not exist" というメッセージが含まれる
-            if f'database "{database}" does not exist' in str(original_exception):
-                db_does_not_exist = True
-
-        if db_does_not_exist:
-            self.emit_log(
-                "WARNING", f"PostgreSQLデータベース '{database}' が存在しません。自動作成を試行します。")
-
-            try:
-                # デフォルトデータベース（postgres）に接続
-                import platform
-                if platform.system() == 'Windows':
-                    default_connection_string = f'postgresql+psycopg2://{username}:{password}@{host}:{port}/postgres?host={host}'
-                else:
-                    default_connection_string = f'postgresql+psycopg2://{username}:{password}@{host}:{port}/postgres'
-
-                engine = create_engine(default_connection_string)
-
-                with engine.connect() as connection:
-                    # AUTOCOMMITを設定してCREATE DATABASEを実行
-                    connection = connection.execution_options(
-                        isolation_level="AUTOCOMMIT")
-                    connection.execute(text(f"CREATE DATABASE {database}"))
-
-                self.emit_log(
-                    "INFO", f"PostgreSQLデータベース '{database}' を正常に作成しました")
-                return True
-
-            except Exception as create_exc:
-                error_msg = f"PostgreSQLデータベース '{database}' の作成に失敗しました: {create_exc}"
-                self.emit_log("ERROR", error_msg)
-                raise ConnectionError(error_msg) from create_exc
-
-        return False
-
     def get_db_type(self) -> str:
         """データベースタイプを取得"""
         return self._db_type
@@ -1098,7 +782,7 @@ class DatabaseManager(LoggerMixin):
         """データベース名を取得"""
         return self._db_name
 
-    def bulk_insert(self, table_name: str, df: pd.DataFrame):
+    def bulk_insert(self, table_name: str, df: 'pd.DataFrame'):
         """
         pandas.DataFrame形式のデータを、指定されたテーブルに高速に一括挿入する。
         主キー重複などのエラーが発生した場合は、そのトランザクションをスキップして処理を継続する。
@@ -1109,15 +793,25 @@ class DatabaseManager(LoggerMixin):
             return
 
         logging.info(f"テーブル '{table_name}' に {len(df)} 件のデータを挿入します。")
+        if self._db_type == 'postgresql':
+            method, chunksize = _psql_insert_values, None
+        elif self._db_type == 'sqlite':
+            # バインド変数の上限を超えない行数ごとに複数行INSERTを送信
+            method, chunksize = 'multi', max(1, _SQLITE_MAX_VARIABLES // len(df.columns))
+        else:
+            method, chunksize = 'multi', _MULTI_ROW_CHUNKSIZE
         try:
             df.to_sql(
                 table_name,
                 con=self.engine,
                 if_exists='append',
-                index=False
+                index=False,
+                method=method,
+                chunksize=chunksize
             )
             logging.info(f"テーブル '{table_name}' へのデータ挿入が完了しました。")
-        except IntegrityError:
+        except (IntegrityError, self.engine.dialect.dbapi.IntegrityError):
+            # PostgreSQLのexecute_values経路はDBAPIカーソルを直接使うため、ドライバーの例外も対象
             logging.warning(
                 f"テーブル '{table_name}' への挿入中に主キー重複エラーが発生しました。重複データはスキップされます。")
             # 重複エラーの場合は、1行ずつ挿入を試みるフォールバック処理
@@ -1127,23 +821,17 @@ class DatabaseManager(LoggerMixin):
             # その他のエラーは処理を中断させるため再スロー
             raise
 
-    def _insert_row_by_row(self, table_name: str, df: pd.DataFrame):
-        """1行ずつデータを挿入するフォールバックメソッド"""
-        logging.info(f"フォールバック処理: '{table_name}'テーブルに1行ずつ挿入を試みます。")
-        success_count = 0
-        with self.engine.connect() as connection:
-            for i, row in df.iterrows():
-                try:
-                    with connection.begin() as trans:  # 各行でトランザクションを開始
-                        row.to_frame().T.to_sql(table_name, con=connection, if_exists='append', index=False)
-                        success_count += 1
-                except IntegrityError:
-                    # 主キー重複は無視
-                    continue
-                except Exception as e:
-                    logging.error(f"行単位の挿入中にエラー (Row {i}): {e}")
-                    # 他のエラーはログに残す
-        logging.info(f"フォールバック処理完了。{success_count}/{len(df)} 件の新規データを挿入しました。")
+    def _insert_row_by_row(self, table_name: str, df: 'pd.DataFrame'):
+        """重複行をスキップして一括挿入するフォールバックメソッド（INSERT IGNORE / ON CONFLICT DO NOTHING）"""
+        logging.info(f"フォールバック処理: '{table_name}'テーブルに重複をスキップして挿入を試みます。")
+        # NaNはto_sqlと同様にNULLとして扱う
+        records = df.astype(object).where(df.notna(), None).to_dict(orient='records')
+        try:
+            result = self.upsert_records(table_name, records, ignore_conflicts=True)
+        except DatabaseError as e:
+            logging.error(f"重複スキップ挿入中にエラーが発生しました: {e}")
+            return
+        logging.info(f"フォールバック処理完了。{result['inserted']}/{len(df)} 件の新規データを挿入しました。")
 
     def get_table_names(self) -> list[str]:
         """
@@ -1196,40 +884,29 @@ class DatabaseManager(LoggerMixin):
                 spec['table_name'] for spec in EtlProcessor.SPEC_DEFINITIONS.values()
             ]
 
+            existing_tables = [t for t in tracked_tables if t in table_names]
             with self.Session() as session:
-                for table_name in tracked_tables:
-                    if table_name in table_names:
-                        try:
-                            # レコード数を取得
-                            count_query = text(
-                                f"SELECT COUNT(*) FROM {table_name}")
-                            count_result = session.execute(
-                                count_query).scalar()
-
-                            # 最新更新日時を取得（created_dateカラムがある場合）
-                            latest = "N/A"
-                            try:
-                                latest_query = text(
-                                    f"SELECT MAX(create_date) FROM {table_name}")
-                                latest_result = session.execute(
-                                    latest_query).scalar()
-                                if latest_result:
-                                    latest = str(latest_result)
-                            except:
-                                # create_dateカラムが存在しない場合は無視
-                                pass
-
-                            summary[table_name] = {
-                                "count": count_result or 0,
-                                "latest": latest
-                            }
-                        except Exception as e:
-                            logging.warning(
-                                f"テーブル '{table_name}' のサマリー取得でエラー: {e}")
-                            summary[table_name] = {"count": 0, "latest": "エラー"}
-                    else:
-                        # テーブルが存在しない場合
-                        summary[table_name] = {"count": 0, "latest": "未作成"}
+                # 行数はカタログ統計の概算を優先（全件スキャンを避ける）
+                estimates = self._estimate_row_counts(session, existing_tables)
+                try:
+                    stats = self._summarize_tables(
+                        session, inspector, existing_tables, estimates)
+                except Exception as e:
+                    logging.warning(f"テーブルサマリーの一括取得でエラー: {e}")
+                    stats = {name: (count, None) for name, count in estimates.items()}
+
+            for table_name in tracked_tables:
+                if table_name not in table_names:
+                    # テーブルが存在しない場合
+                    summary[table_name] = {"count": 0, "latest": "未作成"}
+                elif table_name not in stats:
+                    summary[table_name] = {"count": 0, "latest": "エラー"}
+                else:
+                    count_result, latest_result = stats[table_name]
+                    summary[table_name] = {
+                        "count": count_result or 0,
+                        "latest": str(latest_result) if latest_result else "N/A"
+                    }
 
         except Exception as e:
             logging.error(f"データサマリー取得中にエラーが発生: {e}")
@@ -1237,6 +914,95 @@ class DatabaseManager(LoggerMixin):
 
         return summary
 
+    def _summarize_tables(self, session, inspector, table_names: list[str],
+                          estimates: dict[str, int]) -> dict[str, tuple]:
+        """
+        各テーブルの (レコード数, 最新更新日時) をUNION ALLの1クエリでまとめて取得する。
+
+        概算件数があるテーブルはCOUNT(*)を省き、create_dateカラムがないテーブルは
+        最新更新日時をNULLとする（どちらも不要なテーブルはクエリに含めない）。
+        """
+        stats = {name: (count, None) for name, count in estimates.items()}
+        members = []
+        for name in table_names:
+            has_latest = any(
+                col['name'] == 'create_date' for col in inspector.get_columns(name))
+            if name in estimates and not has_latest:
+                continue
+            members.append(select(
+                literal(name).label('table_name'),
+                null().label('row_count') if name in estimates
+                else func.count().label('row_count'),
+                # 方言間・テーブル間で型を揃えるため文字列に変換
+                cast(func.max(column('create_date')), String).label('latest') if has_latest
+                else null().label('latest'),
+            ).select_from(table(name)))
+
+        if not members:
+            return stats
+
+        stmt = members[0] if len(members) == 1 else union_all(*members)
+        for name, count, latest in session.execute(stmt):
+            stats[name] = (estimates.get(name, count), latest)
+        return stats
+
+    def _estimate_row_counts(self, session, table_names: list[str]) -> dict[str, int]:
+        """
+        カタログ統計（pg_class.reltuples / information_schema.tables.table_rows）から
+        行数の概算を一度のクエリで取得する。
+
+        SQLiteや統計が未収集のテーブルは含まない（呼び出し側でCOUNT(*)を使う）。
+        """
+        sql = _ROW_ESTIMATE_SQL.get(self._db_type)
+        if sql is None or not table_names:
+            return {}
+
+        stmt = text(sql).bindparams(bindparam('names', expanding=True))
+        try:
+            prelude = _ROW_ESTIMATE_PRELUDE.get(self._db_type)
+            if prelude is not None:
+                session.execute(text(prelude))
+            rows = session.execute(stmt, {'names': table_names}).all()
+        except Exception as e:
+            session.rollback()
+            logging.warning(f"行数の概算取得に失敗したため、COUNT(*)で集計します: {e}")
+            return {}
+
+        # 未ANALYZE（PostgreSQLの-1や14未満の0、MySQLのNULL）や、統計のキャッシュで
+        # 取り込み直後に0のままのテーブルは不明として除外し、COUNT(*)で数える
+        return {name: int(estimate) for name, estimate in rows
+                if estimate is not None and estimate > 0}
+
+    def has_any_data(self) -> bool:
+        """
+        主要テーブルのいずれかにレコードが1件でも存在するかを判定する。
+        全件数を数えず、最初にレコードが見つかった時点で判定を終える。
+        """
+        if self.engine is None:
+            logging.warning("データベースに接続されていないため、データの有無を確認できません。")
+            return False
+
+        try:
+            table_names = set(inspect(self.engine).get_table_names())
+
+            from ..services.etl_processor import EtlProcessor
+            tracked_tables = [
+                spec['table_name'] for spec in EtlProcessor.SPEC_DEFINITIONS.values()
+            ]
+
+            with self.engine.connect() as conn:
+                for table_name in tracked_tables:
+                    if table_name not in table_names:
+                        continue
+                    if conn.execute(
+                            text(f"SELECT 1 FROM {table_name} LIMIT 1")).first() is not None:
+                        return True
+
+        except Exception as e:
+            logging.error(f"データ有無の確認中にエラーが発生: {e}")
+
+        return False
+
     def close(self):
         """データベース接続を閉じる"""
         if self.engine:
@@ -1309,12 +1075,7 @@ class DatabaseManager(LoggerMixin):
                             # 実際に接続をテスト
                             with self.engine.connect() as conn:
                                 # 簡単な接続テスト
-                                if self._db_type == 'sqlite':
-                                    conn.execute(text("SELECT 1"))
-                                elif self._db_type == 'mysql':
-                                    conn.execute(text("SELECT 1"))
-                                elif self._db_type == 'postgresql':
-                                    conn.execute(text("SELECT 1"))
+                                conn.exec_driver_sql("SELECT 1")
                             
                             # 接続テストに成功した場合
                             success_msg = f"{self._db_type} データベース '{self._db_name}' への再接続に成功しました"
@@ -1340,7 +1101,8 @@ class DatabaseManager(LoggerMixin):
             return False, critical_error_msg
 
     def upsert_records(self, table_name: str, records: List[Any],
-                       primary_keys: List[str] = None) -> Dict[str, int]:
+                       primary_keys: List[str] = None,
+                       ignore_conflicts: bool = False) -> Dict[str, int]:
         """
         アトミックなUPSERT操作でレコードを挿入/更新
 
@@ -1348,6 +1110,7 @@ class DatabaseManager(LoggerMixin):
             table_name: テーブル名
             records: dataclassインスタンスのリスト
             primary_keys: 主キーとなるカラム名のリスト
+            ignore_conflicts: Trueの場合は更新せず、重複レコードをスキップする
 
         Returns:
             処理結果の統計情報 {'inserted': 0, 'updated': 0, 'errors': 0}
@@ -1387,11 +1150,11 @@ class DatabaseManager(LoggerMixin):
 
         try:
             if db_type == 'mysql':
-                return self._mysql_upsert(table_name, record_dicts, primary_keys)
+                return self._mysql_upsert(table_name, record_dicts, primary_keys, ignore_conflicts)
             elif db_type == 'postgresql':
-                return self._postgresql_upsert(table_name, record_dicts, primary_keys)
+                return self._postgresql_upsert(table_name, record_dicts, primary_keys, ignore_conflicts)
             elif db_type == 'sqlite':
-                return self._sqlite_upsert(table_name, record_dicts, primary_keys)
+                return self._sqlite_upsert(table_name, record_dicts, primary_keys, ignore_conflicts)
             else:
                 raise DatabaseError(f"サポートされていないデータベース種別: {db_type}")
 
@@ -1400,7 +1163,8 @@ class DatabaseManager(LoggerMixin):
             raise DatabaseError(f"UPSERT操作に失敗しました: {e}", operation="upsert")
 
     def _mysql_upsert(self, table_name: str, records: List[Dict[str, Any]],
-                      primary_keys: List[str] = None) -> Dict[str, int]:
+                      primary_keys: List[str] = None,
+                      ignore_conflicts: bool = False) -> Dict[str, int]:
         """
         MySQL用のUPSERT操作 (INSERT ... ON DUPLICATE KEY UPDATE)
         """
@@ -1410,8 +1174,8 @@ class DatabaseManager(LoggerMixin):
         # カラム名を取得
         columns = list(records[0].keys())
 
-        # UPDATE句用のカラム（主キーを除く）
-        update_columns = [
+        # UPDATE句用のカラム（主キーを除く。重複スキップ時は更新しない）
+        update_columns = [] if ignore_conflicts else [
             col for col in columns if col not in (primary_keys or [])]
 
         # SQL構築
@@ -1436,7 +1200,8 @@ class DatabaseManager(LoggerMixin):
         return self._execute_batch_upsert(sql, records, columns, "MySQL")
 
     def _postgresql_upsert(self, table_name: str, records: List[Dict[str, Any]],
-                           primary_keys: List[str] = None) -> Dict[str, int]:
+                           primary_keys: List[str] = None,
+                           ignore_conflicts: bool = False) -> Dict[str, int]:
         """
         PostgreSQL用のUPSERT操作 (INSERT ... ON CONFLICT DO UPDATE)
         """
@@ -1450,13 +1215,15 @@ class DatabaseManager(LoggerMixin):
         if not primary_keys:
             primary_keys = ['id']  # デフォルト主キー
 
-        # UPDATE句用のカラム（主キーを除く）
-        update_columns = [col for col in columns if col not in primary_keys]
+        # UPDATE句用のカラム（主キーを除く。重複スキップ時は更新しない）
+        update_columns = [] if ignore_conflicts else [
+            col for col in columns if col not in primary_keys]
 
-        # SQL構築
+        # SQL構築（重複スキップ時はすべての一意制約違反を対象にする）
         placeholders = ', '.join(['%s'] * len(columns))
         column_list = ', '.join([f'"{col}"' for col in columns])
-        conflict_target = ', '.join([f'"{pk}"' for pk in primary_keys])
+        conflict_target = '' if ignore_conflicts else '(' + ', '.join(
+            [f'"{pk}"' for pk in primary_keys]) + ')'
 
         if update_columns:
             update_clause = ', '.join(
@@ -1464,20 +1231,21 @@ class DatabaseManager(LoggerMixin):
             sql = f"""
                 INSERT INTO "{table_name}" ({column_list})
                 VALUES ({placeholders})
-                ON CONFLICT ({conflict_target}) DO UPDATE SET {update_clause}
+                ON CONFLICT {conflict_target} DO UPDATE SET {update_clause}
             """
         else:
             # 更新するカラムがない場合はDO NOTHINGを使用
             sql = f"""
                 INSERT INTO "{table_name}" ({column_list})
                 VALUES ({placeholders})
-                ON CONFLICT ({conflict_target}) DO NOTHING
+                ON CONFLICT {conflict_target} DO NOTHING
             """
 
         return self._execute_batch_upsert(sql, records, columns, "PostgreSQL")
 
     def _sqlite_upsert(self, table_name: str, records: List[Dict[str, Any]],
-                       primary_keys: List[str] = None) -> Dict[str, int]:
+                       primary_keys: List[str] = None,
+                       ignore_conflicts: bool = False) -> Dict[str, int]:
         """
         SQLite用のUPSERT操作 (INSERT ... ON CONFLICT DO UPDATE)
         """
@@ -1488,12 +1256,13 @@ class DatabaseManager(LoggerMixin):
         columns = list(records[0].keys())
 
         # 主キーが指定されていない場合はROWIDを使用
-        if not primary_keys:
+        if not primary_keys and not ignore_conflicts:
             # SQLiteの場合、テーブル情報から主キーを推定
             primary_keys = self._get_sqlite_primary_keys(table_name)
 
-        # UPDATE句用のカラム（主キーを除く）
-        update_columns = [col for col in columns if col not in primary_keys]
+        # UPDATE句用のカラム（主キーを除く。重複スキップ時は更新しない）
+        update_columns = [] if ignore_conflicts else [
+            col for col in columns if col not in primary_keys]
 
         # SQL構築
         placeholders = ', '.join(['?'] * len(columns))
@@ -1522,16 +1291,13 @@ class DatabaseManager(LoggerMixin):
         """
         バッチUPSERT操作を実行
         """
-        # データ準備
-        batch_data = []
-        for record in records:
-            row_data = [record.get(col) for col in columns]
-            batch_data.append(row_data)
+        # データ準備（位置パラメータのタプル）
+        batch_data = [tuple(record.get(col) for col in columns) for record in records]
 
-        # バッチ実行
+        # バッチ実行（%s / ? はドライバーのパラメータ形式のため、text()を経由せず直接渡す）
         try:
             with self.engine.begin() as conn:
-                result = conn.execute(text(sql), batch_data)
+                result = conn.exec_driver_sql(sql, batch_data)
 
                 # 影響を受けた行数を取得（データベースによって異なる）
                 affected_rows = result.rowcount if hasattr(
@@ -1609,103 +1375,6 @@ class DatabaseManager(LoggerMixin):
         """
         return self.upsert_records(table_name, records, primary_keys)
 
-    def _connect_postgresql_with_result(self, db_config: dict) -> tuple[bool, str]:
-        """
-        PostgreSQL接続（戻り値付き、フォールバックなし）
-        
-        Args:
-            db_config: データベース設定辞書
-            
-        Returns:
-            (接続成功フラグ, メッセージ)
-        """
-        import urllib.parse
-
-        host = db_config.get('host', 'localhost')
-        try:
-            port = int(db_config.get('port', 5432)) if db_config.get('port') else 5432
-        except (ValueError, TypeError):
-            port = 5432
-        
-        username = db_config.get('username', 'postgres')
-        password = db_config.get('password', '')
-        database = db_config.get('database') or db_config.get('db_name', 'jra_data')
-
-        self._db_name = database
-
-        # 強化されたUnicodeエンコーディング処理
-        try:
-            # 文字列の安全な正規化
-            username = str(username).strip() if username else 'postgres'
-            password = str(password).strip() if password else ''
-            database = str(database).strip() if database else 'jra_data'
-            host = str(host).strip() if host else 'localhost'
-
-            # UTF-8エンコーディングの確認と修正
-            username = username.encode('utf-8', errors='replace').decode('utf-8')
-            password = password.encode('utf-8', errors='replace').decode('utf-8')
-            database = database.encode('utf-8', errors='replace').decode('utf-8')
-
-            # URLエンコーディング（safe文字を明示的に指定）
-            username_encoded = urllib.parse.quote(username, safe='', encoding='utf-8')
-            password_encoded = urllib.parse.quote(password, safe='', encoding='utf-8')
-            database_encoded = urllib.parse.quote(database, safe='', encoding='utf-8')
-
-        except Exception as encoding_error:
-            error_msg = f"PostgreSQL接続パラメータのエンコーディングエラー: {encoding_error}"
-            self.emit_log("ERROR", error_msg)
-            return False, error_msg
-
-        # 接続文字列の生成
-        import platform
-        if platform.system() == 'Windows':
-            if host in ['localhost', '127.0.0.1']:
-                host = '127.0.0.1'
-
-        connection_attempts = [
-            f"postgresql+psycopg2://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}?client_encoding=utf8",
-            f"postgresql://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}?client_encoding=utf8"
-        ]
-
-        for attempt_num, connection_string in enumerate(connection_attempts, 1):
-            try:
-                self.emit_log("INFO", f"PostgreSQL接続試行 {attempt_num}: {connection_string.replace(password_encoded, '***')}")
-
-                # SQLAlchemy接続オプションでUnicode対応を強化
-                connect_args = {
-                    'client_encoding': 'utf8',
-                    'application_name': 'JRA-Data-Collector',
-                    'connect_timeout': 30
-                }
-
-                self.engine = create_engine(
-                    connection_string,
-                    echo=False,
-                    connect_args=connect_args,
-                    pool_pre_ping=True,
-                    pool_recycle=3600
-                )
-
-                # 接続をテスト
-                with self.engine.connect() as connection:
-                    result = connection.execute(text("SELECT version()"))
-                    version_info = result.fetchone()[0]
-                    self.emit_log("INFO", f"PostgreSQL接続成功（試行{attempt_num}）: {version_info[:100]}...")
-
-                self.Session = sessionmaker(bind=self.engine)
-                return True, f"PostgreSQL接続に成功しました: {database}"
-
-            except Exception as e:
-                error_msg = f"PostgreSQL接続試行{attempt_num}でエラー: {e}"
-                self.emit_log("WARNING", error_msg)
-                if attempt_num == len(connection_attempts):
-                    # 最後の試行も失敗した場合
-                    return False, f"PostgreSQL接続に失敗しました: {e}"
-                continue
-
-        # ここには到達しないはずだが、安全のため
-        return False, "PostgreSQL接続の全ての試行が失敗しました"
-
     def _connect_sqlite_with_result(self, db_config: dict) -> tuple[bool, str]:
         """
         SQLite接続（戻り値付き）
@@ -1734,72 +1403,19 @@ class DatabaseManager(LoggerMixin):
             self._db_name = db_path
             self.emit_log("INFO", f"SQLite接続を試行: {db_path}")
 
-            self.engine = create_engine(f'sqlite:///{db_path}', echo=False)
+            self.engine = create_engine(
+                f'sqlite:///{db_path}', echo=False, query_cache_size=_QUERY_CACHE_SIZE)
+            event.listen(self.engine, "connect", _apply_sqlite_pragmas)
 
             # 接続テスト
             with self.engine.connect() as connection:
-                connection.execute(text("SELECT 1"))
+                connection.exec_driver_sql("SELECT 1")
                 self.emit_log("INFO", f"SQLite接続成功: {db_path}")
 
-            self.Session = sessionmaker(bind=self.engine)
+            self._bind_session()
             return True, f"SQLite接続に成功しました: {db_path}"
 
         except Exception as e:
             error_msg = f"SQLite接続に失敗しました: {e}"
             self.emit_log("ERROR", error_msg)
             return False, error_msg
-
-    def _connect_mysql_with_result(self, db_config: dict) -> tuple[bool, str]:
-        """
-        MySQL接続（戻り値付き、フォールバックなし）
-        
-        Args:
-            db_config: データベース設定辞書
-            
-        Returns:
-            (接続成功フラグ, メッセージ)
-        """
-        import urllib.parse
-
-        host = db_config.get('host', 'localhost')
-        try:
-            port = int(db_config.get('port', 3306)) if db_config.get('port') else 3306
-        except (ValueError, TypeError):
-            port = 3306
-        
-        username = db_config.get('username', 'root')
-        password = db_config.get('password', '')
-        database = db_config.get('database') or db_config.get('db_name', 'jra_data')
-
-        self._db_name = database
-
-        try:
-            # URLエンコーディング
-            username_encoded = urllib.parse.quote(username, safe='', encoding='utf-8')
-            password_encoded = urllib.parse.quote(password, safe='', encoding='utf-8')
-            database_encoded = urllib.parse.quote(database, safe='', encoding='utf-8')
-
-            connection_string = f"mysql+pymysql://{username_encoded}:{password_encoded}@{host}:{port}/{database_encoded}?charset=utf8mb4"
-            
-            self.emit_log("INFO", f"MySQL接続を試行: {connection_string.replace(password_encoded, '***')}")
-
-            self.engine = create_engine(
-                connection_string,
-                echo=False,
-                pool_pre_ping=True,
-                pool_recycle=3600
-            )
-
-            # 接続をテスト
-            with self.engine.connect() as connection:
-                result = connection.execute(text("SELECT VERSION()"))
-                version_info = result.fetchone()[0]
-                self.emit_log("INFO", f"MySQL接続成功: {version_info}")
-
-            self.Session = sessionmaker(bind=self.engine)
-            return True, f"MySQL接続に成功しました: {database}"
-
-        except Exception as e:
-            error_msg = f"MySQL接続に失敗しました: {e}"
-            self.emit_log("ERROR", error_msg)
-            return False, error_msg
@@ -70,6 +70,27 @@ class EtlDataPipeline(QObject):
         except Exception as e:
             logging.error(f"データ追加中にエラーが発生: {e}")
 
+    def add_data_bulk(self, data_list: List[tuple], chunk_size: int = 50):
+        """
+        パイプラインに複数のデータをまとめて追加する（プロデューサー側）
+        Args:
+            data_list: (data_spec, raw_data)のタプルのリスト
+            chunk_size: 1回のキュー投入でまとめる件数
+        """
+        if not self.is_running or self.is_cancelled:
+            return
+
+        # 1件ずつではなくチャンク単位でキューに追加する
+        for start in range(0, len(data_list), chunk_size):
+            chunk = list(data_list[start:start + chunk_size])
+            try:
+                self.data_queue.put(chunk, timeout=5.0)
+            except queue.Full:
+                logging.warning(
+                    f"データキューが満杯です。{len(chunk)} 件のデータをスキップします。")
+            except Exception as e:
+                logging.error(f"データ追加中にエラーが発生: {e}")
+
     def finish_production(self):
         """
         データ生成が完了したことを通知する
@@ -196,16 +217,24 @@ class EtlDataPipeline(QObject):
             while True:
                 try:
                     # タイムアウト付きでキューからデータを取得
-                    data_spec, raw_data = self.data_queue.get(timeout=1.0)
+                    item = self.data_queue.get(timeout=1.0)
 
-                    # 終了マーカーチェック
-                    if data_spec is None:
-                        logging.info("データ生成完了マーカーを受信しました。")
-                        # 残りのバッチデータを処理
-                        if batch_data:
-                            logging.info("残りのバッチデータを処理します。")
-                            self._process_batch(batch_data)
-                        break
+                    # add_data_bulk で追加されたチャンクは (data_spec, raw_data) のリスト
+                    if isinstance(item, list):
+                        chunk = item
+                    else:
+                        data_spec, raw_data = item
+
+                        # 終了マーカーチェック
+                        if data_spec is None:
+                            logging.info("データ生成完了マーカーを受信しました。")
+                            # 残りのバッチデータを処理
+                            if batch_data:
+                                logging.info("残りのバッチデータを処理します。")
+                                self._process_batch(batch_data)
+                            break
+
+                        chunk = (item,)
 
                     # キャンセルチェック
                     if self.is_cancelled:
@@ -213,15 +242,18 @@ class EtlDataPipeline(QObject):
                         break
 
                     # バッチデータに追加
-                    if data_spec not in batch_data:
-                        batch_data[data_spec] = []
-                    batch_data[data_spec].append(raw_data)
-                    total_queued_items += 1
+                    for data_spec, raw_data in chunk:
+                        if data_spec not in batch_data:
+                            batch_data[data_spec] = []
+                        batch_data[data_spec].append(raw_data)
+                    total_queued_items += len(chunk)
 
                     # 10件ごとにキュー状況をログ出力
                     if total_queued_items % 10 == 0:
-                        logging.debug(f"キューから受信: 累計 {total_queued_items} アイテム, "
-                                      f"現在のバッチサイズ: {sum(len(items) for items in batch_data.values())}")
+                        if logging.getLogger().isEnabledFor(logging.DEBUG):
+                            logging.debug("キューから受信: 累計 %d アイテム, 現在のバッチサイズ: %d",
+                                          total_queued_items,
+                                          sum(len(items) for items in batch_data.values()))
 
                     # バッチサイズまたは時間間隔でバッチ処理を実行
                     total_items = sum(len(items)
@@ -232,8 +264,8 @@ class EtlDataPipeline(QObject):
                             (current_time - last_process_time) >= process_interval):
 
                         if batch_data:
-                            logging.debug(f"バッチ処理トリガー: アイテム数={total_items}, "
-                                          f"経過時間={current_time - last_process_time:.1f}秒")
+                            logging.debug("バッチ処理トリガー: アイテム数=%d, 経過時間=%.1f秒",
+                                          total_items, current_time - last_process_time)
                             self._process_batch(batch_data)
                             batch_data = {}
                             last_process_time = current_time
@@ -243,7 +275,7 @@ class EtlDataPipeline(QObject):
                     current_time = time.time()
                     if (batch_data and
                             (current_time - last_process_time) >= process_interval):
-                        logging.debug(f"タイムアウト処理: バッチ処理を実行します。")
+                        logging.debug("タイムアウト処理: バッチ処理を実行します。")
                         self._process_batch(batch_data)
                         batch_data = {}
                         last_process_time = current_time
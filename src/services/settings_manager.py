@@ -7,7 +7,7 @@ import configparser
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 # PyQtシグナル機構のサポート
@@ -140,6 +140,11 @@ class ConfigManager(QObject):
                 'username': self.config.get('Database', 'username', fallback='postgres'),
                 'password': self.config.get('Database', 'password', fallback=''),
                 'db_name': self.config.get('Database', 'db_name', fallback='jra_data.db'),
+                'pool_pre_ping': self.config.getboolean('Database', 'pool_pre_ping', fallback=False),
+                'pool_size': self.config.getint('Database', 'pool_size', fallback=20),
+                'max_overflow': self.config.getint('Database', 'max_overflow', fallback=40),
+                'pool_timeout': self.config.getint('Database', 'pool_timeout', fallback=30),
+                'pool_recycle': self.config.getint('Database', 'pool_recycle', fallback=3600),
             }
         except Exception as e:
             self.logger.error(f"データベース設定取得エラー: {e}")
@@ -256,6 +261,28 @@ class ConfigManager(QObject):
             self.logger.error(f"設定値設定エラー: {e}")
             raise
 
+    def set_values(self, values: Dict[Tuple[str, str], str]) -> None:
+        """
+        複数の設定値をまとめて設定し、ファイルへの保存は一度だけ行う
+
+        Args:
+            values: (セクション, キー) -> 値 の辞書
+        """
+        if not values:
+            return
+
+        try:
+            for (section, key), value in values.items():
+                if not self.config.has_section(section):
+                    self.config.add_section(section)
+                self.config.set(section, key, value)
+
+            self.save()
+
+        except Exception as e:
+            self.logger.error(f"設定値一括設定エラー: {e}")
+            raise
+
     # ETLルール管理機能（旧SettingsManagerとの互換性のため）
     def load_etl_rules(self) -> Dict[str, Any]:
         """
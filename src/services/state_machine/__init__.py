@@ -5,7 +5,7 @@ State Machine Package for JRA-Data Collector
 ステートマシンパターンを実装します。
 """
 
-from .base import AppState
+from .base import AppState, StateKind
 from .states import (
     IdleState,
     RequestingDataState,
@@ -18,6 +18,7 @@ from .states import (
 
 __all__ = [
     'AppState',
+    'StateKind',
     'IdleState',
     'RequestingDataState',
     'PollingDownloadState',
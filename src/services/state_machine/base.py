@@ -7,7 +7,8 @@ Phase 3: Worker Pipeline統合対応
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Optional
 import logging
 
 if TYPE_CHECKING:
@@ -16,6 +17,14 @@ if TYPE_CHECKING:
     from ..workers.base import ProgressInfo
 
 
+class StateKind(IntEnum):
+    """コントローラーが頻繁に参照する状態の種別"""
+    OTHER = 0
+    IDLE = 1
+    PIPELINE_PROCESSING = 2
+    ERROR = 3
+
+
 class AppState(ABC):
     """
     アプリケーション状態の抽象基底クラス
@@ -26,6 +35,9 @@ class AppState(ABC):
     Phase 3では Worker Pipeline との統合サポートを追加。
     """
 
+    # 状態の種別（サブクラスで上書き。遷移時にコンテキストへキャッシュされる）
+    KIND: ClassVar[StateKind] = StateKind.OTHER
+
     def __init__(self, name: str = None):
         self._context: Optional[AppController] = None
         self._name = name or self.__class__.__name__
@@ -9,7 +9,7 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 from PyQt5.QtCore import QObject, pyqtSignal as Signal
 
-from .base import AppState
+from .base import AppState, StateKind
 from ..workers.signals import LoggerMixin, LogRecord
 
 
@@ -21,6 +21,8 @@ class ErrorState(AppState, LoggerMixin):
     UIダイアログ表示の責務は持たない（AppControllerが担当）
     """
 
+    KIND = StateKind.ERROR
+
     # シグナル定義
     error_occurred = Signal(str, str)  # title, message
     error_recovered = Signal()
@@ -82,7 +84,7 @@ class ErrorState(AppState, LoggerMixin):
             for task_name in list(context.active_tasks.keys()):
                 self.emit_log(
                     "WARNING", f"[{self.error_id}] タスク '{task_name}' を中断しています...")
-                context.active_tasks[task_name]['status'] = 'error'
+                context._set_task_status(task_name, 'error')
 
         # エラー統計を更新
         if hasattr(context, 'error_stats'):
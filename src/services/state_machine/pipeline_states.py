@@ -11,7 +11,7 @@ import time
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from multiprocessing import cpu_count
 
-from .base import AppState, StateTransitionError
+from .base import AppState, StateKind, StateTransitionError
 from ..workers.base import ProgressInfo
 from ..workers.pipeline_coordinator import PipelineCoordinator
 
@@ -26,6 +26,8 @@ class PipelineProcessingState(AppState):
     参考: https://medium.com/@ageitgey/quick-tip-speed-up-your-python-data-processing-scripts-with-process-pools-cf275350163a
     """
 
+    KIND = StateKind.PIPELINE_PROCESSING
+
     def __init__(self, data_params: Dict[str, Any], etl_rules: Dict[str, Any]):
         super().__init__("PipelineProcessing")
         self.data_params = data_params
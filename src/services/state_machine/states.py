@@ -6,7 +6,7 @@ Concrete State Classes for JRA-Data Collector
 
 from typing import Any, Dict, Optional
 import logging
-from .base import AppState, StateTransitionError
+from .base import AppState, StateKind, StateTransitionError
 
 
 class IdleState(AppState):
@@ -17,6 +17,8 @@ class IdleState(AppState):
     ユーザーからの処理開始要求を待機している状態。
     """
 
+    KIND = StateKind.IDLE
+
     def __init__(self):
         super().__init__("Idle")
 
@@ -386,6 +388,8 @@ class ErrorState(AppState):
     エラー情報の表示とユーザーへの通知を行う。
     """
 
+    KIND = StateKind.ERROR
+
     def __init__(self, error: Exception = None, context_info: Dict[str, Any] = None):
         super().__init__("Error")
         self.error = error
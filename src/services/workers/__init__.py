@@ -8,7 +8,7 @@ Phase 3 Update: 統一されたシグナルと構造化ログシステムを統
 """
 
 from .base import BaseWorker, WorkerState, CancellationToken
-from .signals import WorkerSignals, LogRecord, ProgressInfo, TaskResult, LoggerMixin
+from .signals import WorkerSignals, LogRecord, ProgressInfo, TaskResult, TaskInfo, LoggerMixin
 from .jvlink_reader import JvLinkReaderWorker
 from .etl_processor_worker import EtlProcessorWorker
 from .database_writer import DatabaseWriterWorker
@@ -25,6 +25,7 @@ __all__ = [
     'LogRecord',
     'ProgressInfo',
     'TaskResult',
+    'TaskInfo',
     'LoggerMixin',
 
     # ワーカーインプリメンテーション
@@ -30,7 +30,7 @@ class WorkerState(Enum):
     COMPLETED = "completed"          # 完了
 
 
-@dataclass
+@dataclass(slots=True)
 class ProgressInfo:
     """進捗情報"""
     worker_name: str
@@ -5,13 +5,14 @@ Unified Worker Signals for JRA-Data Collector
 構造化ログのためのデータクラスを提供します。
 """
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
 from PySide6.QtCore import QObject, Signal
 
 
-@dataclass
+@dataclass(slots=True)
 class LogRecord:
     """
     構造化ログレコード
@@ -25,8 +26,14 @@ class LogRecord:
     message: str
     context: Optional[Dict[str, Any]] = None  # 追加のコンテキスト情報
 
+    def __post_init__(self):
+        # 語彙の小さいフィールドはインターンして同一オブジェクトを共有する
+        self.level = sys.intern(self.level)
+        self.task_name = sys.intern(self.task_name)
+        self.worker_name = sys.intern(self.worker_name)
 
-@dataclass
+
+@dataclass(slots=True)
 class ProgressInfo:
     """
     進捗情報構造体
@@ -43,7 +50,7 @@ class ProgressInfo:
     estimated_remaining: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """
     タスク完了結果
@@ -60,6 +67,19 @@ class TaskResult:
     summary: Optional[Dict[str, Any]] = None
 
 
+@dataclass(slots=True)
+class TaskInfo:
+    """
+    実行中タスク情報
+
+    コントローラーがタスクごとの状態を追跡するための軽量な構造体です。
+    """
+    worker_name: str
+    start_time: datetime
+    status: str  # 'running', 'completed', 'error'
+    end_time: Optional[datetime] = None
+
+
 class WorkerSignals(QObject):
     """
     統一されたワーカーシグナル定義
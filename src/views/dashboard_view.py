@@ -5,6 +5,7 @@
 システムの健全性と最新状況を直感的かつ迅速に把握できる画面
 """
 
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from PySide6.QtCore import Signal, Qt, QTimer, Slot
@@ -86,6 +87,9 @@ class DashboardView(QWidget):
     
     # シグナル定義
     quick_action_requested = Signal(str)  # クイックアクション要求
+
+    # アクティビティログの最大保持件数
+    MAX_ACTIVITIES = 10
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -95,7 +99,7 @@ class DashboardView(QWidget):
         # 状態管理
         self.jvlink_status = "unknown"
         self.last_sync_info = None
-        self.recent_activities = []
+        self.recent_activities = deque(maxlen=self.MAX_ACTIVITIES)  # 新しい順
         
         # 更新タイマー
         self.update_timer = QTimer()
@@ -283,14 +287,13 @@ class DashboardView(QWidget):
         timestamp = datetime.now().strftime("%H:%M")
         activity_text = f"{timestamp} - {action}: {status}"
         
-        # リストの先頭に追加
-        self.recent_activities.insert(0, activity_text)
-        
-        # 最大10件まで保持
-        if len(self.recent_activities) > 10:
-            self.recent_activities = self.recent_activities[:10]
-        
-        self._update_activity_display()
+        # リストの先頭に追加（最大件数を超えた古いものは deque が破棄）
+        self.recent_activities.appendleft(activity_text)
+
+        # 表示も先頭に1行追加し、溢れた末尾の行だけを削除する
+        self.activity_list.insertItem(0, QListWidgetItem(activity_text))
+        while self.activity_list.count() > self.MAX_ACTIVITIES:
+            self.activity_list.takeItem(self.activity_list.count() - 1)
 
     def _update_activity_display(self):
         """アクティビティ表示を更新"""
@@ -299,6 +302,11 @@ class DashboardView(QWidget):
             item = QListWidgetItem(activity)
             self.activity_list.addItem(item)
 
+    def reset(self):
+        """アクティビティログを一括でクリア"""
+        self.recent_activities.clear()
+        self.activity_list.clear()
+
     def _show_detail_log(self):
         """詳細ログの表示"""
         # TODO: 詳細ログビューアーを開く